@@ -1,5 +1,32 @@
+from charter._exc import SargabilityWarning
+from charter._json import from_json
+from charter._loader import BatchLoader
+from charter._ops import Interner, Param
+from charter._optimize import optimize, push_down_not
+from charter._pagination import Keyset, SortKey
+from charter._plan import IndexPlanner
 from charter._predicate import Predicate
+from charter._serialize import canonical_json, from_bytes, to_bytes
+from charter._split import Capabilities, Split, split
+from charter._stream import from_json_stream
 
 __all__ = [
+    "BatchLoader",
+    "Capabilities",
+    "IndexPlanner",
+    "Interner",
+    "Keyset",
+    "Param",
     "Predicate",
+    "SargabilityWarning",
+    "SortKey",
+    "Split",
+    "canonical_json",
+    "from_bytes",
+    "from_json",
+    "from_json_stream",
+    "optimize",
+    "push_down_not",
+    "split",
+    "to_bytes",
 ]
@@ -2,18 +2,22 @@
 
 from typing import TYPE_CHECKING, Any, Literal, overload
 
+from charter._backends.cache import CachedBackend, CacheInfo
 from charter._backends.interface import Backend
 from charter._exc import BackendNotAvailableError
 
-__all__ = ["Backend"]
+__all__ = ["Backend", "CacheInfo", "CachedBackend"]
 
 
 if TYPE_CHECKING:
     try:
+        from charter._backends.numpy import NumpyBackend
         from charter._backends.pymongo import PymongoBackend
         from charter._backends.sqlalchemy import SQLAlchemyBackend
     except ImportError:
         pass
+    from charter._backends.python import PythonBackend
+    from charter._backends.sql import SQLBackend
 
     @overload
     def load_backend(
@@ -25,6 +29,21 @@ if TYPE_CHECKING:
         name: Literal["pymongo"],
     ) -> "type[PymongoBackend]": ...
 
+    @overload
+    def load_backend(
+        name: Literal["numpy"],
+    ) -> "type[NumpyBackend]": ...
+
+    @overload
+    def load_backend(
+        name: Literal["python"],
+    ) -> "type[PythonBackend]": ...
+
+    @overload
+    def load_backend(
+        name: Literal["sql"],
+    ) -> "type[SQLBackend]": ...
+
     def load_backend(name: str) -> "type[Backend[Any]]": ...
 else:
 
@@ -50,5 +69,22 @@ else:
                         " Install with: `pip install pymongo`",
                     ) from e
                 return PymongoBackend
+            case "numpy":
+                try:
+                    from charter._backends.numpy import NumpyBackend
+                except ImportError as e:
+                    raise BackendNotAvailableError(
+                        "Backend 'numpy' is required for NumpyBackend."
+                        " Install with: `pip install numpy`",
+                    ) from e
+                return NumpyBackend
+            case "python":
+                from charter._backends.python import PythonBackend
+
+                return PythonBackend
+            case "sql":
+                from charter._backends.sql import SQLBackend
+
+                return SQLBackend
             case _:
                 raise ValueError(f"Unknown backend: {name}")
@@ -0,0 +1,100 @@
+import copy
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from typing import NamedTuple
+
+from charter._backends.interface import Backend, QueryType
+from charter._ops import Operation, Operator, structural_key
+
+
+class CacheInfo(NamedTuple):
+    """Counters reported by :meth:`CachedBackend.cache_info`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class CachedBackend(Backend[QueryType]):
+    """Bounded LRU cache in front of another backend's ``transform``.
+
+    Results are keyed by the structural key of the operations, so equal
+    trees built independently share one entry. Operations holding
+    unhashable values bypass the cache and count as misses.
+
+    Backends with ``mutable_output`` (e.g. :class:`PymongoBackend`) get a
+    deep copy of the cached result on every call, so callers may modify
+    what they receive.
+    """
+
+    def __init__(self, backend: Backend[QueryType], maxsize: int = 256) -> None:
+        """Initialize the cache.
+
+        Args:
+            backend: Backend whose results are cached
+            maxsize: Maximum number of cached results
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be a positive integer, got {maxsize}")
+
+        self.backend = backend
+        self.maxsize = maxsize
+        self._cache: OrderedDict[Hashable, QueryType] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def transform(self, operations: Sequence[Operation]) -> QueryType:
+        try:
+            key = tuple(structural_key(op) for op in operations)
+        except TypeError:
+            with self._lock:
+                self._misses += 1
+            return self.backend.transform(operations)
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return self._copy(self._cache[key])
+            self._misses += 1
+
+        result = self.backend.transform(operations)
+
+        with self._lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+        return self._copy(result)
+
+    def non_sargable_reason(self, op: Operator) -> str | None:
+        return self.backend.non_sargable_reason(op)
+
+    def cache_info(self) -> CacheInfo:
+        """Report cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self.maxsize,
+                currsize=len(self._cache),
+            )
+
+    def cache_clear(self) -> None:
+        """Drop all cached results and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def _copy[T](self, result: T) -> T:
+        if self.backend.mutable_output:
+            return copy.deepcopy(result)
+        return result
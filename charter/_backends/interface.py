@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from typing import Any, Generic, TypeVar
+from typing import Any, ClassVar, Generic, TypeVar
 
-from charter._ops import Operation
+from charter._ops import Operation, Operator
 
 QueryType = TypeVar("QueryType", covariant=True)
 
@@ -14,6 +14,9 @@ class Backend(ABC, Generic[QueryType]):  # noqa: UP046
     query formats (e.g., MongoDB queries, SQLAlchemy expressions).
     """
 
+    # Whether ``transform`` returns objects callers may modify in place.
+    mutable_output: ClassVar[bool] = False
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the backend.
 
@@ -36,3 +39,17 @@ class Backend(ABC, Generic[QueryType]):  # noqa: UP046
             ValueError: If operations are invalid or unsupported
         """
         ...
+
+    def non_sargable_reason(self, op: Operator) -> str | None:
+        """Explain why the query built for ``op`` can't be served by an index.
+
+        Used by :class:`charter.IndexPlanner` to warn about operations that
+        turn into full scans. Backends without indexes return ``None``.
+
+        Args:
+            op: Operator to check
+
+        Returns:
+            What the backend renders that defeats an index, or ``None``
+        """
+        return None
@@ -0,0 +1,209 @@
+import re
+from collections.abc import Mapping, Sequence
+from functools import reduce
+from operator import and_, or_
+from typing import Any, cast
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from charter._backends.interface import Backend
+from charter._exc import TransformationError, UnsupportedOperationError
+from charter._ops import (
+    ALL_OPERATORS,
+    ContainsData,
+    LogicOperator,
+    LogicOperators,
+    Operation,
+    Operator,
+    Operators,
+    Param,
+    fold_operations,
+)
+
+type Mask = NDArray[np.bool_]
+
+# Dtype kinds the string operators accept: unicode, variable-width
+# ``StringDType`` and object arrays holding ``str``.
+_STRING_KINDS = frozenset("UTO")
+
+
+class NumpyBackend(Backend[Mask]):
+    """Backend for columnar data held in NumPy arrays.
+
+    Transforms operations into a boolean mask over the rows, evaluated one
+    column at a time with vectorized NumPy operations. ``None`` in object
+    columns, ``NaN`` and ``NaT`` are treated as null: they match only
+    ``eq(field, None)`` and never satisfy a comparison, ``neq``,
+    ``contains`` or ``regex``, matching SQL semantics.
+    """
+
+    mutable_output = True
+
+    columns: dict[str, NDArray[Any]]
+
+    def __init__(self, data: Mapping[str, ArrayLike] | NDArray[np.void]) -> None:
+        """Initialize NumPy backend.
+
+        Args:
+            data: Mapping of column name to one-dimensional array, or a
+                structured array whose fields are the columns
+        """
+        if isinstance(data, np.ndarray):
+            if data.dtype.names is None:
+                raise TypeError(
+                    f"Data must be a mapping or a structured array, got {data.dtype}"
+                )
+            columns = {name: data[name] for name in data.dtype.names}
+        else:
+            columns = {name: np.asarray(column) for name, column in data.items()}
+
+        lengths = {column.shape for column in columns.values()}
+        if len(lengths) > 1 or any(len(shape) != 1 for shape in lengths):
+            raise ValueError("Columns must be one-dimensional and of equal length")
+
+        self.columns = columns
+        self.size = len(next(iter(columns.values()))) if columns else 0
+
+    def transform(self, operations: Sequence[Operation]) -> Mask:
+        masks = fold_operations(
+            operations, self._transform_operator, self._combine_logic_operator
+        )
+        return self._and(masks)
+
+    def _combine_logic_operator(self, op: LogicOperator, masks: list[Mask]) -> Mask:
+        match op.operator:
+            case LogicOperators.AND:
+                return self._and(masks)
+            case LogicOperators.OR:
+                return reduce(or_, masks)
+            case LogicOperators.NOT:
+                return ~self._and(masks)
+            case _:
+                raise UnsupportedOperationError(
+                    f"Unsupported logic operator: {op.operator}"
+                )
+
+    def _and(self, masks: list[Mask]) -> Mask:
+        if not masks:
+            return np.ones(self.size, dtype=np.bool_)
+        return reduce(and_, masks)
+
+    def _transform_operator(self, op: Operator) -> Mask:
+        column = self._get_column(op.field)
+        if op.operator not in ALL_OPERATORS:
+            raise UnsupportedOperationError(f"Unsupported operator: {op.operator}")
+
+        value = op.value
+        if isinstance(value, Param) or (
+            isinstance(value, ContainsData) and isinstance(value.value, Param)
+        ):
+            raise UnsupportedOperationError(
+                "NumpyBackend does not support Param placeholders"
+            )
+
+        match op.operator:
+            case Operators.EQ:
+                if value is None:
+                    return self._nulls(column)
+                return self._compare(column, np.equal, value)
+            case Operators.NEQ:
+                if value is None:
+                    return ~self._nulls(column)
+                return self._compare(column, np.not_equal, value)
+            case Operators.IN:
+                dtype = object if column.dtype.kind == "O" else None
+                return np.isin(column, np.asarray(value, dtype=dtype))
+            case Operators.GT:
+                return self._compare(column, np.greater, value)
+            case Operators.GTE:
+                return self._compare(column, np.greater_equal, value)
+            case Operators.LT:
+                return self._compare(column, np.less, value)
+            case Operators.LTE:
+                return self._compare(column, np.less_equal, value)
+            case Operators.CONTAINS:
+                return self._transform_contains(op.field, column, value)
+            case Operators.REGEX:
+                return self._transform_regex(op.field, column, value)
+            case _:
+                raise UnsupportedOperationError(f"Unsupported operator: {op.operator}")
+
+    def _compare(self, column: NDArray[Any], ufunc: np.ufunc, value: Any) -> Mask:
+        """Apply ``ufunc`` to the non-null values, leaving nulls ``False``."""
+        if column.dtype.kind != "O":
+            return cast(Mask, ufunc(column, value) & ~self._nulls(column))
+
+        mask = np.zeros(len(column), dtype=np.bool_)
+        valid = ~self._nulls(column)
+        mask[valid] = ufunc(column[valid], value).astype(np.bool_)
+        return mask
+
+    def _transform_contains(
+        self, field: str, column: NDArray[Any], contains_data: ContainsData
+    ) -> Mask:
+        needle = cast(str, contains_data.value)
+
+        def search(strings: NDArray[Any]) -> Mask:
+            if contains_data.ignore_case:
+                strings = np.strings.lower(strings)
+                return np.strings.find(strings, needle.lower()) >= 0
+            return np.strings.find(strings, needle) >= 0
+
+        return self._match_strings(field, column, search)
+
+    def _transform_regex(self, field: str, column: NDArray[Any], pattern: str) -> Mask:
+        """Match ``pattern`` once per distinct value rather than once per row."""
+        compiled = re.compile(pattern)
+
+        def search(strings: NDArray[Any]) -> Mask:
+            distinct, inverse = np.unique(strings, return_inverse=True)
+            matched = np.fromiter(
+                (compiled.search(string) is not None for string in distinct.tolist()),
+                dtype=np.bool_,
+                count=len(distinct),
+            )
+            return matched[inverse]
+
+        return self._match_strings(field, column, search)
+
+    def _match_strings(self, field: str, column: NDArray[Any], search: Any) -> Mask:
+        if column.dtype.kind not in _STRING_KINDS:
+            raise TransformationError(
+                f"Column '{field}' of dtype {column.dtype} is not a string column"
+            )
+        if column.dtype.kind != "O":
+            return cast(Mask, search(column))
+
+        mask = np.zeros(len(column), dtype=np.bool_)
+        is_str = np.fromiter(
+            (isinstance(value, str) for value in column.tolist()),
+            dtype=np.bool_,
+            count=len(column),
+        )
+        if is_str.any():
+            mask[is_str] = search(column[is_str].astype(np.dtypes.StringDType()))
+        return mask
+
+    def _nulls(self, column: NDArray[Any]) -> Mask:
+        match column.dtype.kind:
+            case "f" | "c":
+                return np.isnan(column)
+            case "m" | "M":
+                return np.isnat(column)
+            case "O":
+                return np.fromiter(
+                    (value is None for value in column.tolist()),
+                    dtype=np.bool_,
+                    count=len(column),
+                )
+            case _:
+                return np.zeros(len(column), dtype=np.bool_)
+
+    def _get_column(self, field_name: str) -> NDArray[Any]:
+        """Get column array by name."""
+        column = self.columns.get(field_name)
+
+        if column is None:
+            raise TransformationError(f"Unknown column '{field_name}'")
+        return column
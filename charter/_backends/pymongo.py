@@ -1,117 +1,792 @@
-from collections.abc import Sequence
-from typing import Any, cast
+import re
+from array import array
+from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 from bson import ObjectId
 
 from charter._backends.interface import Backend
-from charter._exc import UnsupportedOperationError
+from charter._exc import TransformationError, UnsupportedOperationError
 from charter._ops import (
+    ALL_OPERATORS,
+    SEQUENCE_OPERATORS,
     ContainsData,
     LogicOperator,
+    LogicOperatorNode,
     LogicOperators,
     Operation,
     OperationType,
     Operator,
+    OperatorNode,
     Operators,
+    Param,
+    fold_logic_operator,
+    fold_operations,
+)
+from charter._pagination import Keyset
+from charter._regex import literal_prefix
+
+if TYPE_CHECKING:
+    from pymongo.asynchronous.collection import AsyncCollection
+    from pymongo.collection import Collection
+
+# Placeholder for the chunk of the ``in`` list split by ``find_chunked``.
+_CHUNK_PARAM = Param("__charter_in_chunk__")
+
+# Operators whose value is not an id, left alone by ``convert_id``.
+_NON_ID_OPERATORS = frozenset(
+    {Operators.CONTAINS, Operators.REGEX, Operators.ELEM_MATCH}
 )
 
 
 class PymongoBackend(Backend[list[dict[str, Any]]]):
     """Backend for Beanie/MongoDB queries.
 
-    Transforms operations into MongoDB query dictionaries.
+    Transforms operations into MongoDB query dictionaries. ``not`` is
+    rendered as ``$nin``, ``$ne`` or a field level ``$not`` for a single
+    condition and as ``$nor`` otherwise; like every MongoDB negation, it
+    matches documents where the field is null or missing.
+
+    Dotted fields such as ``attrs.color`` address subdocuments. ``any``,
+    ``all`` and ``elem_match`` become ``$in``, ``$all`` and ``$elemMatch``
+    on the array, all of which multikey indexes serve.
     """
 
-    def __init__(self, alias_id: bool = False, convert_id: bool = False) -> None:
+    mutable_output = True
+
+    def __init__(
+        self,
+        alias_id: bool = False,
+        convert_id: bool = False,
+        *,
+        regex_prefix_range: bool = False,
+    ) -> None:
         """Initialize Beanie backend.
 
         Args:
             alias_id: Whether to convert 'id' field to '_id' for MongoDB
-            convert_id: Whether to convert 'id' field to ObjectId for MongoDB
+            convert_id: Whether to convert 'id' field to ObjectId for MongoDB;
+                ``contains``, ``regex`` and ``elem_match`` values are kept as is
+            regex_prefix_range: Whether ``regex`` with an anchored literal
+                prefix is compared as a ``$gte``/``$lt`` range over that
+                prefix, keeping ``$regex`` only for the rest of the pattern.
+                Not valid for collections with a non-simple collation.
         """
         self.alias_id = alias_id
         self.convert_id = convert_id
+        self.regex_prefix_range = regex_prefix_range
 
     def transform(self, operations: Sequence[Operation]) -> list[dict[str, Any]]:
-        criteria: list[dict[str, Any]] = []
-        for op in operations:
-            match op.operation_type:
-                case OperationType.OPERATOR:
-                    criteria.append(self._transform_operator(cast(Operator, op)))
-                case OperationType.LOGIC:
-                    criteria.append(
-                        self._transform_logic_operator(cast(LogicOperator, op))
-                    )
-                case _:
-                    raise UnsupportedOperationError(
-                        f"Unsupported operation type: {op.operation_type}"
-                    )
+        return fold_operations(
+            operations, self._transform_operator, self._combine_logic_operator
+        )
+
+    def transform_document(self, operations: Sequence[Operation]) -> dict[str, Any]:
+        """Transform operations into a single filter document.
+
+        Operations joined by ``and`` share one document, with conditions on
+        the same field merged into one operator document::
+
+            {"age": {"$gt": 1, "$lt": 9}, "role": "admin"}
+
+        A condition that cannot be merged, such as a second ``$gt`` on the
+        same field or a second ``$or``, is kept in ``$and``.
+
+        Args:
+            operations: Sequence of operations to transform
+
+        Returns:
+            MongoDB filter document
+        """
+        criteria = fold_operations(
+            operations, self._transform_operator, self._combine_document
+        )
+        return _merge_criteria(criteria)
+
+    def sort(self, keyset: Keyset) -> list[tuple[str, int]]:
+        """Build the sort specification of a keyset.
+
+        Args:
+            keyset: Sort order of the pages
+
+        Returns:
+            Specification to pass as ``sort`` to ``Collection.find``
+        """
+        return [
+            (self._get_field_name(key.field), -1 if key.descending else 1)
+            for key in keyset.keys
+        ]
+
+    def pipeline(
+        self,
+        operations: Sequence[Operation],
+        stages: Sequence[Mapping[str, Any]],
+    ) -> list[Mapping[str, Any]]:
+        """Filter an aggregation pipeline, matching each condition as early as it can.
+
+        Operations joined by ``and`` are split into conditions, and every
+        condition gets a ``$match`` right after the last stage that changes
+        one of its fields, or at the start of the pipeline. Conditions on
+        base collection fields thus run before ``$lookup`` and ``$unwind``,
+        and conditions on joined fields right after the stage producing
+        them. Conditions at the same place share one ``$match``::
+
+            backend.pipeline(
+                [p.eq("status", "paid"), p.eq("customer.country", "DE")],
+                [{"$lookup": {..., "as": "customer"}}, {"$unwind": "$customer"}],
+            )
+            # [{"$match": {"status": "paid"}}, {"$lookup": ...},
+            #  {"$unwind": "$customer"}, {"$match": {"customer.country": "DE"}}]
+
+        ``$match`` and ``$sort`` are passed by any condition. ``$lookup``,
+        ``$graphLookup``, ``$unwind``, ``$addFields``, ``$set`` and
+        ``$unset`` only hold back conditions on the fields they write. Any
+        other stage, such as ``$group``, ``$project`` or ``$limit``, holds
+        back every condition.
+
+        Args:
+            operations: Sequence of operations to transform
+            stages: Aggregation pipeline to filter
+
+        Returns:
+            Pipeline with the ``$match`` stages added
+        """
+        outputs = [_stage_outputs(stage) for stage in stages]
+        groups: dict[int, list[Operation]] = {}
+        for condition in _conjuncts(operations):
+            fields = self._condition_fields(condition)
+            position = len(stages)
+            while position:
+                written = outputs[position - 1]
+                if written is None or fields & written:
+                    break
+                position -= 1
+            groups.setdefault(position, []).append(condition)
+
+        pipeline: list[Mapping[str, Any]] = []
+        for position in range(len(stages) + 1):
+            if position in groups:
+                pipeline.append({"$match": self.transform_document(groups[position])})
+            if position < len(stages):
+                pipeline.append(stages[position])
+        return pipeline
+
+    def _condition_fields(self, condition: Operation) -> set[str]:
+        """Top-level fields a condition reads, after aliasing."""
+        fields: set[str] = set()
+
+        def leaf(op: Operator) -> None:
+            fields.add(_root_field(self._get_field_name(op.field)))
+
+        fold_operations([condition], leaf, lambda op, results: None)
+        return fields
 
-        return criteria
+    def stream(
+        self,
+        collection: "Collection[Any]",
+        operations: Sequence[Operation],
+        *,
+        batch_size: int = 1000,
+        **find_kwargs: Any,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Find documents and yield them in batches.
+
+        The cursor fetches ``batch_size`` documents per round trip and only
+        one batch is held at a time, so memory stays bounded however many
+        documents match. The cursor is closed when the iteration ends.
+
+        Args:
+            collection: Collection to query
+            operations: Sequence of operations to transform
+            batch_size: Number of documents per batch
+            **find_kwargs: Passed to ``collection.find``
+
+        Yields:
+            Lists of at most ``batch_size`` documents
+        """
+        cursor = collection.find(
+            self.transform_document(operations), batch_size=batch_size, **find_kwargs
+        )
+        try:
+            batch = []
+            for document in cursor:
+                batch.append(document)
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        finally:
+            cursor.close()
+
+    async def astream(
+        self,
+        collection: "AsyncCollection[Any]",
+        operations: Sequence[Operation],
+        *,
+        batch_size: int = 1000,
+        **find_kwargs: Any,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Find documents and yield them in batches, asynchronously.
+
+        Same as :meth:`stream`, for ``async for`` over a collection of
+        ``pymongo.AsyncMongoClient``.
+
+        Args:
+            collection: Collection to query
+            operations: Sequence of operations to transform
+            batch_size: Number of documents per batch
+            **find_kwargs: Passed to ``collection.find``
+
+        Yields:
+            Lists of at most ``batch_size`` documents
+        """
+        cursor = collection.find(
+            self.transform_document(operations), batch_size=batch_size, **find_kwargs
+        )
+        try:
+            batch = []
+            async for document in cursor:
+                batch.append(document)
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        finally:
+            await cursor.close()
+
+    def find_chunked(
+        self,
+        collection: "Collection[Any]",
+        operations: Sequence[Operation],
+        *,
+        max_in_length: int = 10000,
+        max_workers: int = 4,
+        **find_kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        """Find documents, splitting an oversized ``in`` list into chunks.
+
+        The longest ``in`` list with more than ``max_in_length`` values is
+        split into chunks of at most that many values, and the filter is
+        run once per chunk in a thread pool. Only a list outside of ``not``
+        is split, where a document matches the whole list if and only if it
+        matches one of the chunks. The results are merged in chunk order,
+        keeping the first document for each ``_id``, so ``sort`` and
+        ``limit`` given in ``find_kwargs`` apply per chunk. A ``projection``
+        must therefore keep ``_id``; documents that still come back without
+        one, as from some views, are all kept.
+
+        Args:
+            collection: Collection to query
+            operations: Sequence of operations to transform
+            max_in_length: Longest ``in`` list sent in a single query
+            max_workers: Maximum number of queries run at once
+            **find_kwargs: Passed to ``collection.find``
+
+        Returns:
+            Matching documents
+
+        Raises:
+            TransformationError: If a parameter is named like the placeholder
+                reserved for the chunks
+            ValueError: If ``max_in_length`` is not positive or the
+                projection excludes ``_id``
+        """
+        if max_in_length < 1:
+            raise ValueError("max_in_length must be positive")
+        projection = find_kwargs.get("projection")
+        if isinstance(projection, Mapping) and not projection.get("_id", True):
+            raise ValueError("find_chunked merges chunks by _id; keep it in projection")
+
+        found = self._find_oversized_in(operations, max_in_length)
+        if found is None:
+            document = self.transform_document(operations)
+            return list(collection.find(document, **find_kwargs))
+
+        target, path = found
+        if _CHUNK_PARAM.name in _param_names(operations):
+            raise TransformationError(
+                f"Parameter name '{_CHUNK_PARAM.name}' is reserved by find_chunked"
+            )
+        chunk_leaf = OperatorNode(Operators.IN, target.field, _CHUNK_PARAM)
+        template = MongoTemplate(
+            [self.transform_document(_replace_at(operations, path, chunk_leaf))]
+        )
+
+        values = target.value
+        filters = [
+            template.bind({_CHUNK_PARAM.name: list(values[i : i + max_in_length])})[0]
+            for i in range(0, len(values), max_in_length)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda document: list(collection.find(document, **find_kwargs)),
+                filters,
+            )
+            merged: list[dict[str, Any]] = []
+            seen: set[Any] = set()
+            for documents in results:
+                for document in documents:
+                    if "_id" not in document:
+                        merged.append(document)
+                    elif document["_id"] not in seen:
+                        seen.add(document["_id"])
+                        merged.append(document)
+        return merged
+
+    def _find_oversized_in(
+        self, operations: Sequence[Operation], max_in_length: int
+    ) -> tuple[Operator, list[int]] | None:
+        """Find the longest ``in`` list over ``max_in_length`` outside ``not``.
+
+        Returns:
+            The operator and its path of operand indices from the top level,
+            or ``None`` if there is no such list
+        """
+
+        def leaf(op: Operator) -> _Found | None:
+            if (
+                op.operator == Operators.IN
+                and not isinstance(op.value, Param)
+                and len(op.value) > max_in_length
+            ):
+                return _Found(op, None)
+            return None
+
+        def logic(op: LogicOperator, candidates: list[_Found | None]) -> _Found | None:
+            if op.operator == LogicOperators.NOT:
+                return None
+            return _longest(candidates)
+
+        found = _longest(fold_operations(operations, leaf, logic))
+        if found is None:
+            return None
+        # Each level links to the candidate it picked, innermost last.
+        path: list[int] = []
+        node: _Found | None = found
+        while node is not None and node.path is not None:
+            index, node = node.path
+            path.append(index)
+        assert node is not None
+        return node.op, path
+
+    def _combine_document(
+        self, op: LogicOperator, criteria: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        if op.operator == LogicOperators.AND:
+            return _merge_criteria(criteria)
+        if op.operator == LogicOperators.NOT:
+            return _negate([_merge_criteria(criteria)])
+        return self._combine_logic_operator(op, criteria)
 
     def _transform_logic_operator(self, op: LogicOperator) -> dict[str, Any]:
-        transformed_ops = self.transform(op.operations)
+        return fold_logic_operator(
+            op, self._transform_operator, self._combine_logic_operator
+        )
 
+    def _combine_logic_operator(
+        self, op: LogicOperator, criteria: list[dict[str, Any]]
+    ) -> dict[str, Any]:
         match op.operator:
             case LogicOperators.AND:
-                return {"$and": transformed_ops}
+                return {"$and": criteria}
             case LogicOperators.OR:
-                return {"$or": transformed_ops}
+                return {"$or": criteria}
             case LogicOperators.NOT:
-                return {"$not": transformed_ops}
+                return _negate(criteria)
             case _:
                 raise UnsupportedOperationError(
                     f"Unsupported logic operator: {op.operator}"
                 )
 
+    def template(self, operations: Sequence[Operation]) -> "MongoTemplate":
+        """Transform operations holding ``Param`` placeholders once.
+
+        Args:
+            operations: Sequence of operations to transform
+
+        Returns:
+            Template whose ``bind`` fills the placeholders with values
+        """
+        return MongoTemplate(self.transform(operations))
+
     def _transform_operator(self, op: Operator) -> dict[str, Any]:
         field = self._get_field_name(op.field)
-        if self.convert_id and field == "_id":
-            if op.operator == Operators.IN:
-                op = Operator(
-                    operator=op.operator,
-                    field=field,
-                    value=[ObjectId(v) for v in op.value],
-                )
+        if op.operator not in ALL_OPERATORS:
+            raise UnsupportedOperationError(f"Unsupported operator: {op.operator}")
+
+        value = op.value
+        if self.convert_id and field == "_id" and op.operator not in _NON_ID_OPERATORS:
+            many = op.operator in SEQUENCE_OPERATORS
+            if isinstance(value, Param):
+                value = _ObjectIdSlot(value, many=many)
+            elif many:
+                value = [ObjectId(v) for v in value]
             else:
-                op = Operator(
-                    operator=op.operator,
-                    field=field,
-                    value=ObjectId(op.value),
-                )
+                value = ObjectId(value)
+        elif isinstance(value, array):
+            # BSON has no encoding for typed arrays.
+            value = value.tolist()
 
         match op.operator:
             case Operators.EQ:
-                return {field: op.value}
+                return {field: value}
             case Operators.NEQ:
-                return {field: {"$ne": op.value}}
+                return {field: {"$ne": value}}
             case Operators.IN:
-                return {field: {"$in": op.value}}
+                return {field: {"$in": value}}
             case Operators.GT:
-                return {field: {"$gt": op.value}}
+                return {field: {"$gt": value}}
             case Operators.GTE:
-                return {field: {"$gte": op.value}}
+                return {field: {"$gte": value}}
             case Operators.LT:
-                return {field: {"$lt": op.value}}
+                return {field: {"$lt": value}}
             case Operators.LTE:
-                return {field: {"$lte": op.value}}
+                return {field: {"$lte": value}}
             case Operators.CONTAINS:
-                return self._transform_contains(field, cast(ContainsData, op.value))
+                return self._transform_contains(field, cast(ContainsData, value))
             case Operators.REGEX:
-                return {field: {"$regex": op.value}}
+                return {field: self._transform_regex(value)}
+            case Operators.ANY:
+                return {field: {"$in": value}}
+            case Operators.ALL:
+                return {field: {"$all": value}}
+            case Operators.ELEM_MATCH:
+                # Element fields are never aliased to ``_id``.
+                elements = PymongoBackend(regex_prefix_range=self.regex_prefix_range)
+                return {field: {"$elemMatch": elements.transform_document(value)}}
             case _:
                 raise UnsupportedOperationError(f"Unsupported operator: {op.operator}")
 
+    def non_sargable_reason(self, op: Operator) -> str | None:
+        match op.operator:
+            case Operators.CONTAINS:
+                if cast(ContainsData, op.value).ignore_case:
+                    return "renders an unanchored $regex with $options: i"
+                return "renders an unanchored $regex"
+            case Operators.REGEX if not (
+                isinstance(op.value, str) and op.value.startswith("^")
+            ):
+                return "renders an unanchored $regex"
+            case _:
+                return None
+
+    def _transform_regex(self, pattern: Any) -> dict[str, Any]:
+        prefix = None
+        if self.regex_prefix_range and isinstance(pattern, str):
+            prefix = literal_prefix(pattern)
+        if prefix is None:
+            return {"$regex": pattern}
+
+        condition: dict[str, Any] = {"$gte": prefix.prefix}
+        if prefix.upper_bound is not None:
+            condition["$lt"] = prefix.upper_bound
+        if not prefix.exact:
+            condition["$regex"] = pattern
+        return condition
+
     def _transform_contains(
         self,
         field: str,
         contains_data: ContainsData,
     ) -> dict[str, Any]:
+        value = contains_data.value
         if contains_data.ignore_case:
-            return {field: {"$regex": contains_data.value.lower(), "$options": "i"}}
-        return {field: {"$regex": contains_data.value}}
+            if isinstance(value, str):
+                value = value.lower()
+            return {field: {"$regex": value, "$options": "i"}}
+        return {field: {"$regex": value}}
 
     def _get_field_name(self, field: str) -> str:
         if self.alias_id and field == "id":
             return "_id"
         return field
+
+
+class _Found(NamedTuple):
+    """An oversized ``in`` list, or a link to the operand holding one."""
+
+    op: Operator
+    path: "tuple[int, _Found] | None"
+
+
+def _longest(candidates: list[_Found | None]) -> _Found | None:
+    indexed = [(i, c) for i, c in enumerate(candidates) if c is not None]
+    if not indexed:
+        return None
+    index, best = max(indexed, key=lambda item: len(item[1].op.value))
+    return _Found(best.op, (index, best))
+
+
+def _replace_at(
+    operations: Sequence[Operation], path: list[int], replacement: Operation
+) -> list[Operation]:
+    """Replace the operation at ``path``, rebuilding only its ancestors."""
+    parents: list[LogicOperator] = []
+    siblings: Sequence[Operation] = operations
+    for index in path[:-1]:
+        parent = cast(LogicOperator, siblings[index])
+        parents.append(parent)
+        siblings = parent.operations
+
+    node = replacement
+    for parent, index in zip(reversed(parents), reversed(path[1:]), strict=True):
+        children = list(parent.operations)
+        children[index] = node
+        node = LogicOperatorNode(parent.operator, children)
+    result = list(operations)
+    result[path[0]] = node
+    return result
+
+
+def _param_names(operations: Sequence[Operation]) -> set[str]:
+    names: set[str] = set()
+    stack = list(operations)
+    while stack:
+        operation = stack.pop()
+        if operation.operation_type is OperationType.LOGIC:
+            stack.extend(cast(LogicOperator, operation).operations)
+            continue
+        op = cast(Operator, operation)
+        if op.operator == Operators.ELEM_MATCH:
+            stack.extend(op.value)
+        elif isinstance(op.value, Param):
+            names.add(op.value.name)
+    return names
+
+
+def _conjuncts(operations: Sequence[Operation]) -> list[Operation]:
+    """Split operations into the conditions joined by top-level ``and``."""
+    conditions: list[Operation] = []
+    stack = list(reversed(operations))
+    while stack:
+        operation = stack.pop()
+        if (
+            operation.operation_type is OperationType.LOGIC
+            and cast(LogicOperator, operation).operator == LogicOperators.AND
+        ):
+            stack.extend(reversed(cast(LogicOperator, operation).operations))
+        else:
+            conditions.append(operation)
+    return conditions
+
+
+def _root_field(path: str) -> str:
+    return path.split(".", 1)[0]
+
+
+def _stage_outputs(stage: Mapping[str, Any]) -> frozenset[str] | None:
+    """Top-level fields an aggregation stage writes.
+
+    ``None`` for a stage no condition may be moved in front of.
+    """
+    if len(stage) != 1:
+        return None
+    ((name, spec),) = stage.items()
+    match name:
+        case "$match" | "$sort":
+            return frozenset()
+        case "$lookup" | "$graphLookup":
+            return frozenset([_root_field(spec["as"])])
+        case "$unwind":
+            if isinstance(spec, str):
+                return frozenset([_root_field(spec.removeprefix("$"))])
+            paths = [spec["path"].removeprefix("$")]
+            if "includeArrayIndex" in spec:
+                paths.append(spec["includeArrayIndex"])
+            return frozenset(_root_field(path) for path in paths)
+        case "$addFields" | "$set":
+            return frozenset(_root_field(path) for path in spec)
+        case "$unset":
+            paths = [spec] if isinstance(spec, str) else spec
+            return frozenset(_root_field(path) for path in paths)
+        case _:
+            return None
+
+
+def _negate(criteria: list[dict[str, Any]]) -> dict[str, Any]:
+    """Negate criteria joined by ``and``, on the field itself where possible.
+
+    A single field condition is negated in place, with ``$nin`` and ``$ne``
+    preferred over ``$not`` as the planner can use an index for them;
+    anything else is wrapped in ``$nor``.
+    """
+    if len(criteria) == 1 and len(criteria[0]) == 1:
+        ((field, condition),) = criteria[0].items()
+        if not field.startswith("$"):
+            operators = _as_operators(condition)
+            if operators is None:
+                return {field: {"$not": condition}}
+            if operators.keys() == {"$in"}:
+                return {field: {"$nin": operators["$in"]}}
+            if operators.keys() == {"$eq"}:
+                return {field: {"$ne": operators["$eq"]}}
+            return {field: {"$not": operators}}
+
+    if len(criteria) == 1:
+        return {"$nor": criteria}
+    return {"$nor": [{"$and": criteria}]}
+
+
+def _merge_criteria(criteria: list[dict[str, Any]]) -> dict[str, Any]:
+    """Join criteria with an implicit ``and`` in one document."""
+    document: dict[str, Any] = {}
+    rest: list[dict[str, Any]] = []
+    for criterion in criteria:
+        for key, value in criterion.items():
+            if not _merge_condition(document, key, value):
+                rest.append({key: value})
+
+    if rest:
+        document.setdefault("$and", []).extend(rest)
+    return document
+
+
+def _merge_condition(document: dict[str, Any], key: str, value: Any) -> bool:
+    """Add ``{key: value}`` to ``document``, returning whether it fit."""
+    if key not in document:
+        document[key] = value
+        return True
+    if key == "$and":
+        # The criteria are built for this document and not shared.
+        document[key].extend(value)
+        return True
+    if key.startswith("$"):
+        return False
+
+    existing = _as_operators(document[key])
+    new = _as_operators(value)
+    if existing is None or new is None or existing.keys() & new.keys():
+        return False
+    document[key] = {**existing, **new}
+    return True
+
+
+def _as_operators(condition: Any) -> dict[str, Any] | None:
+    """Return a field condition as an operator document, if it has one."""
+    if (
+        isinstance(condition, dict)
+        and condition
+        and all(key.startswith("$") for key in condition)
+    ):
+        return condition
+    if isinstance(condition, re.Pattern):
+        # ``{"$eq": pattern}`` would compare the stored value with the
+        # pattern itself instead of matching it.
+        return None
+    return {"$eq": condition}
+
+
+class _ObjectIdSlot:
+    """``Param`` whose bound value is converted to ``ObjectId``."""
+
+    __slots__ = ("param", "many")
+
+    def __init__(self, param: Param, many: bool) -> None:
+        self.param = param
+        self.many = many
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(param={self.param!r}, many={self.many!r})"
+
+
+class MongoTemplate:
+    """Prebuilt MongoDB filter skeleton with ``Param`` value slots.
+
+    Slots are located once, when the template is built. ``bind`` copies only
+    the containers on the way to each slot; everything else is shared with
+    the skeleton, so bound filters must be treated as read-only.
+    """
+
+    def __init__(self, criteria: list[dict[str, Any]]) -> None:
+        """Initialize the template.
+
+        Args:
+            criteria: Output of :meth:`PymongoBackend.transform`
+        """
+        self.criteria = criteria
+        self.slots: list[Param | _ObjectIdSlot] = []
+        # Keys on the way to the slots, nested as in the skeleton.
+        self._tree: dict[Any, Any] = {}
+        self._collect_slots()
+
+    @property
+    def params(self) -> set[str]:
+        """Names of the parameters the template expects."""
+        return {self._param(slot).name for slot in self.slots}
+
+    def bind(self, values: Mapping[str, Any]) -> list[dict[str, Any]]:
+        """Fill the slots with values.
+
+        Args:
+            values: Mapping of parameter name to value
+
+        Returns:
+            MongoDB query dictionaries, as returned by ``transform``
+
+        Raises:
+            TransformationError: If a parameter has no value
+        """
+        root: list[Any] = list(self.criteria)
+        stack: list[tuple[Any, dict[Any, Any]]] = [(root, self._tree)]
+        while stack:
+            node, tree = stack.pop()
+            for key, branch in tree.items():
+                if isinstance(branch, dict):
+                    copied = node[key] = node[key].copy()
+                    stack.append((copied, branch))
+                else:
+                    node[key] = self._resolve(branch, values)
+        return root
+
+    def _collect_slots(self) -> None:
+        # Each container is linked to its parent as ``[key, parent, tree]``,
+        # its tree only created once a slot is found below it, so finding a
+        # slot costs as many steps as it adds to ``_tree``.
+        stack: list[tuple[Any, list[Any] | None]] = [(self.criteria, None)]
+        while stack:
+            node, link = stack.pop()
+            match node:
+                case Param() | _ObjectIdSlot():
+                    self.slots.append(node)
+                    assert link is not None
+                    key, parent, branch = link[0], link[1], node
+                    while True:
+                        if parent is None:
+                            self._tree[key] = branch
+                            break
+                        if parent[2] is not None:
+                            parent[2][key] = branch
+                            break
+                        parent[2] = {key: branch}
+                        key, parent, branch = parent[0], parent[1], parent[2]
+                case dict():
+                    stack.extend(
+                        (value, [key, link, None])
+                        for key, value in reversed(node.items())
+                    )
+                case list():
+                    stack.extend(
+                        (value, [index, link, None])
+                        for index, value in reversed(list(enumerate(node)))
+                    )
+
+    def _resolve(self, slot: Param | _ObjectIdSlot, values: Mapping[str, Any]) -> Any:
+        param = self._param(slot)
+        try:
+            value = values[param.name]
+        except KeyError:
+            raise TransformationError(
+                f"Missing value for parameter '{param.name}'"
+            ) from None
+
+        if isinstance(slot, _ObjectIdSlot):
+            if slot.many:
+                return [ObjectId(v) for v in value]
+            return ObjectId(value)
+        return value
+
+    def _param(self, slot: Param | _ObjectIdSlot) -> Param:
+        return slot.param if isinstance(slot, _ObjectIdSlot) else slot
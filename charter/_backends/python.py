@@ -0,0 +1,237 @@
+import re
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from typing import Any, Literal, cast
+
+from charter._backends.interface import Backend
+from charter._exc import TransformationError, UnsupportedOperationError
+from charter._ops import (
+    ALL_OPERATORS,
+    ContainsData,
+    LogicOperator,
+    LogicOperators,
+    Operation,
+    Operator,
+    Operators,
+    Param,
+    fold_operations,
+)
+
+type Accessor = Literal["auto", "item", "attribute"]
+
+_COMPARISONS = {
+    Operators.GT: ">",
+    Operators.GTE: ">=",
+    Operators.LT: "<",
+    Operators.LTE: "<=",
+}
+
+
+# Logic operators nested in one generated function. Deeper subtrees are
+# moved into functions of their own to stay within the parser's limits.
+_MAX_NESTING = 50
+
+
+def _get_auto(obj: Any, field: str) -> Any:
+    if isinstance(obj, Mapping):
+        return obj.get(field)
+    return getattr(obj, field, None)
+
+
+def _get_path(obj: Any, names: tuple[str, ...]) -> Any:
+    for name in names:
+        if obj is None:
+            return None
+        obj = _get_auto(obj, name)
+    return obj
+
+
+class PythonBackend(Backend[Callable[[Any], bool]]):
+    """Backend for filtering Python objects in memory.
+
+    Compiles operations into a single Python function, generated as source
+    code, so the operation tree is walked once rather than per record.
+    Missing fields read as ``None``, and ``None`` never satisfies a
+    comparison, ``neq``, ``contains`` or ``regex``, matching SQL semantics.
+    """
+
+    def __init__(
+        self, accessor: Accessor = "auto", *, dotted_paths: bool = False
+    ) -> None:
+        """Initialize Python backend.
+
+        Args:
+            accessor: How field values are read from records: ``"item"`` for
+                mappings, ``"attribute"`` for dataclasses and other objects,
+                ``"auto"`` to pick per record
+            dotted_paths: Whether a field such as ``meta.color`` is read as
+                ``color`` of ``meta``, through mappings and attributes alike,
+                rather than as a single key
+        """
+        if accessor not in ("auto", "item", "attribute"):
+            raise ValueError(f"Unknown accessor: {accessor}")
+        self.accessor = accessor
+        self.dotted_paths = dotted_paths
+
+    def transform(self, operations: Sequence[Operation]) -> Callable[[Any], bool]:
+        compiler = _Compiler(self.accessor, self.dotted_paths)
+        return compiler.define("_predicate", compiler.compile_all(operations))
+
+
+class _Compiler:
+    def __init__(self, accessor: Accessor, dotted_paths: bool = False) -> None:
+        self.accessor = accessor
+        self.dotted_paths = dotted_paths
+        self.namespace: dict[str, Any] = {
+            "_get_auto": _get_auto,
+            "_get_path": _get_path,
+            "_Hashable": Hashable,
+        }
+
+    def define(self, name: str, expression: str) -> Callable[[Any], bool]:
+        try:
+            code = compile(
+                f"def {name}(_obj):\n    return {expression}\n", "<charter>", "exec"
+            )
+        except (MemoryError, RecursionError, SyntaxError) as e:
+            raise TransformationError("Operation tree is too large to compile") from e
+
+        exec(code, self.namespace)
+        return cast(Callable[[Any], bool], self.namespace[name])
+
+    def compile_all(self, operations: Sequence[Operation]) -> str:
+        compiled = fold_operations(
+            operations,
+            lambda op: (self._compile_operator(op), 0),
+            self._compile_logic_operator,
+        )
+        if not compiled:
+            return "True"
+        return self._join(" and ", [expression for expression, _ in compiled])
+
+    def _compile_logic_operator(
+        self, op: LogicOperator, operands: list[tuple[str, int]]
+    ) -> tuple[str, int]:
+        """Compile to an expression and the number of logic operators it nests."""
+        expressions = [expression for expression, _ in operands]
+        match op.operator:
+            case LogicOperators.AND:
+                expression = self._join(" and ", expressions)
+            case LogicOperators.OR:
+                expression = self._join(" or ", expressions)
+            case LogicOperators.NOT:
+                expression = f"(not {self._join(' and ', expressions)})"
+            case _:
+                raise UnsupportedOperationError(
+                    f"Unsupported logic operator: {op.operator}"
+                )
+
+        depth = 1 + max((depth for _, depth in operands), default=0)
+        if depth < _MAX_NESTING:
+            return expression, depth
+
+        name = f"_f{len(self.namespace)}"
+        self.define(name, expression)
+        return f"{name}(_obj)", 0
+
+    def _compile_operator(self, op: Operator) -> str:
+        if op.operator not in ALL_OPERATORS:
+            raise UnsupportedOperationError(f"Unsupported operator: {op.operator}")
+
+        value = op.value
+        if isinstance(value, Param) or (
+            isinstance(value, ContainsData) and isinstance(value.value, Param)
+        ):
+            raise UnsupportedOperationError(
+                "PythonBackend does not support Param placeholders"
+            )
+
+        get = self._get(op.field)
+        match op.operator:
+            case Operators.EQ:
+                if value is None:
+                    return f"({get} is None)"
+                return f"({get} == {self._const(value)})"
+            case Operators.NEQ:
+                if value is None:
+                    return f"({get} is not None)"
+                return f"((_v := {get}) is not None and _v != {self._const(value)})"
+            case Operators.IN:
+                return f"({self._member(f'(_v := {get})', '_v', value)})"
+            case Operators.GT | Operators.GTE | Operators.LT | Operators.LTE:
+                comparison = _COMPARISONS[op.operator]
+                return (
+                    f"((_v := {get}) is not None"
+                    f" and _v {comparison} {self._const(value)})"
+                )
+            case Operators.CONTAINS:
+                contains_data = cast(ContainsData, value)
+                if contains_data.ignore_case:
+                    needle = self._const(cast(str, contains_data.value).lower())
+                    return f"(isinstance(_v := {get}, str) and {needle} in _v.lower())"
+                needle = self._const(contains_data.value)
+                return f"(isinstance(_v := {get}, str) and {needle} in _v)"
+            case Operators.REGEX:
+                pattern = self._const(re.compile(value))
+                return (
+                    f"(isinstance(_v := {get}, str)"
+                    f" and {pattern}.search(_v) is not None)"
+                )
+            case Operators.ANY:
+                member = self._member("_x", "_x", value)
+                return (
+                    f"(isinstance(_v := {get}, list | tuple)"
+                    f" and any({member} for _x in _v))"
+                )
+            case Operators.ALL:
+                values = self._const(tuple(value))
+                return (
+                    f"(isinstance(_v := {get}, list | tuple)"
+                    f" and all(_x in _v for _x in {values}))"
+                )
+            case Operators.ELEM_MATCH:
+                # Element fields are read by a predicate of their own.
+                compiler = _Compiler(self.accessor, self.dotted_paths)
+                element = self._const(
+                    compiler.define("_element", compiler.compile_all(value))
+                )
+                return (
+                    f"(isinstance(_v := {get}, list | tuple)"
+                    f" and any(map({element}, _v)))"
+                )
+            case _:
+                raise UnsupportedOperationError(f"Unsupported operator: {op.operator}")
+
+    def _get(self, field: str) -> str:
+        if self.dotted_paths and "." in field:
+            first, *rest = field.split(".")
+            return f"_get_path({self._get(first)}, {self._const(tuple(rest))})"
+        name = self._const(field)
+        match self.accessor:
+            case "item":
+                return f"_obj.get({name})"
+            case "attribute":
+                return f"getattr(_obj, {name}, None)"
+            case _:
+                return f"_get_auto(_obj, {name})"
+
+    def _const(self, value: Any) -> str:
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def _member(self, item: str, name: str, values: Sequence[Any]) -> str:
+        """Test ``item``, bound to ``name``, for membership in ``values``.
+
+        Hashable values are looked up in a set. Unhashable items, such as a
+        list read from a record, can't equal any of them and don't match.
+        """
+        try:
+            members = self._const(frozenset(values))
+        except TypeError:
+            return f"{item} in {self._const(tuple(values))}"
+        return f"isinstance({item}, _Hashable) and {name} in {members}"
+
+    def _join(self, separator: str, operands: list[str]) -> str:
+        if len(operands) == 1:
+            return operands[0]
+        return f"({separator.join(operands)})"
@@ -0,0 +1,359 @@
+import re
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import Any, Literal, NamedTuple, cast
+
+from charter._backends.interface import Backend
+from charter._exc import TransformationError, UnsupportedOperationError
+from charter._ops import (
+    ALL_OPERATORS,
+    ContainsData,
+    LogicOperator,
+    LogicOperators,
+    Operation,
+    Operator,
+    Operators,
+    Param,
+    fold_operations,
+)
+
+type Paramstyle = Literal["qmark", "numeric", "named", "format", "pyformat"]
+
+# SQL text in pieces, joined once the whole tree is rendered so deep trees
+# are not copied at every level.
+type _Parts = str | list[_Parts]
+
+_PLACEHOLDERS: dict[str, Callable[[int], str]] = {
+    "qmark": lambda index: "?",
+    "numeric": lambda index: f":{index}",
+    "named": lambda index: f":p{index}",
+    "format": lambda index: "%s",
+    "pyformat": lambda index: f"%(p{index})s",
+}
+
+_COMPARISONS = {
+    Operators.EQ: "=",
+    Operators.NEQ: "<>",
+    Operators.GT: ">",
+    Operators.GTE: ">=",
+    Operators.LT: "<",
+    Operators.LTE: "<=",
+}
+
+
+class SQLDialect(NamedTuple):
+    """SQL rendered by :class:`SQLBackend` where databases disagree.
+
+    Templates are formatted with ``{column}``, the quoted column, and
+    ``{value}``, the placeholder of the bound value. ``contains`` binds the
+    substring itself rather than a ``LIKE`` pattern, so values need no
+    escaping; for ``contains_ignore_case`` it is lowercased first, in Python,
+    so the column's ``lower`` must fold case the same way. SQLite's built-in
+    ``lower`` only folds ASCII letters; see :meth:`SQLBackend.create_lower`.
+    """
+
+    quote: str
+    contains: str
+    contains_ignore_case: str
+    regex: str
+    # ``in`` with a ``Param`` bound to a whole list; ``None`` if unsupported.
+    in_param: str | None = None
+
+
+DIALECTS: Mapping[str, SQLDialect] = {
+    "sqlite": SQLDialect(
+        quote='"',
+        contains="instr({column}, {value}) > 0",
+        # ASCII only unless :meth:`SQLBackend.create_lower` replaced ``lower``.
+        contains_ignore_case="instr(lower({column}), {value}) > 0",
+        # Needs a ``regexp`` function, see :meth:`SQLBackend.create_regexp`.
+        regex="{column} REGEXP {value}",
+    ),
+    "postgresql": SQLDialect(
+        quote='"',
+        contains="strpos({column}, {value}) > 0",
+        contains_ignore_case="strpos(lower({column}), {value}) > 0",
+        regex="{column} ~ {value}",
+        in_param="{column} = ANY({value})",
+    ),
+    "mysql": SQLDialect(
+        quote="`",
+        contains="INSTR(CAST({column} AS BINARY), CAST({value} AS BINARY)) > 0",
+        contains_ignore_case="INSTR(LOWER({column}), {value}) > 0",
+        regex="REGEXP_LIKE({column}, {value}, 'c')",
+    ),
+}
+
+
+class _LowerSlot:
+    """``Param`` whose bound value is lowercased."""
+
+    __slots__ = ("param",)
+
+    def __init__(self, param: Param) -> None:
+        self.param = param
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(param={self.param!r})"
+
+
+class SQLQuery(NamedTuple):
+    """``WHERE`` criteria and their parameters, ready for ``cursor.execute``.
+
+    Example:
+        >>> query = backend.transform(operations)
+        >>> sql = f"SELECT * FROM users WHERE {query.where}"
+        >>> cursor.execute(sql, query.parameters)
+    """
+
+    where: str
+    # A sequence for positional paramstyles, a mapping for named ones. Values
+    # of ``Param`` placeholders are left as slots until :meth:`bind`.
+    parameters: tuple[Any, ...] | dict[str, Any]
+
+    def bind(self, values: Mapping[str, Any]) -> tuple[Any, ...] | dict[str, Any]:
+        """Fill the ``Param`` slots of the parameters with values.
+
+        Args:
+            values: Mapping of parameter name to value
+
+        Returns:
+            Parameters to execute ``where`` with
+
+        Raises:
+            TransformationError: If a parameter has no value
+        """
+        if isinstance(self.parameters, dict):
+            return {
+                name: _resolve(value, values) for name, value in self.parameters.items()
+            }
+        return tuple(_resolve(value, values) for value in self.parameters)
+
+
+def _resolve(value: Any, values: Mapping[str, Any]) -> Any:
+    if not isinstance(value, Param | _LowerSlot):
+        return value
+
+    param = value.param if isinstance(value, _LowerSlot) else value
+    try:
+        bound = values[param.name]
+    except KeyError:
+        raise TransformationError(
+            f"Missing value for parameter '{param.name}'"
+        ) from None
+    return bound.lower() if isinstance(value, _LowerSlot) else bound
+
+
+class SQLBackend(Backend[SQLQuery]):
+    """Backend for DB-API drivers, rendering raw parameterized SQL.
+
+    Transforms operations straight into the text of a ``WHERE`` clause and
+    its parameters in the driver's paramstyle, skipping the expression
+    trees and statement compilation of :class:`SQLAlchemyBackend`. Only
+    whitelisted fields are rendered, as quoted column names, and every
+    value is sent as a parameter, so no input reaches the SQL text.
+    """
+
+    def __init__(
+        self,
+        columns: Iterable[str] | Mapping[str, str],
+        *,
+        table: str | None = None,
+        paramstyle: Paramstyle = "qmark",
+        dialect: Literal["sqlite", "postgresql", "mysql"] | SQLDialect = "sqlite",
+    ) -> None:
+        """Initialize SQL backend.
+
+        Args:
+            columns: Fields that may be filtered on, or a mapping of field to
+                column name
+            table: Table or alias the columns are qualified with
+            paramstyle: Placeholder style of the driver, as in its
+                ``paramstyle`` attribute
+            dialect: Name of a built-in dialect, or a custom one
+        """
+        if paramstyle not in _PLACEHOLDERS:
+            raise ValueError(f"Unknown paramstyle: {paramstyle}")
+        if isinstance(dialect, str):
+            if dialect not in DIALECTS:
+                raise ValueError(f"Unknown dialect: {dialect}")
+            dialect = DIALECTS[dialect]
+
+        if not isinstance(columns, Mapping):
+            columns = {column: column for column in columns}
+        self.paramstyle = paramstyle
+        self.dialect = dialect
+        self.table = table
+
+        prefix = "" if table is None else f"{self._quote(table)}."
+        self.columns = {
+            field: prefix + self._quote(column) for field, column in columns.items()
+        }
+
+    def transform(self, operations: Sequence[Operation]) -> SQLQuery:
+        parameters: list[Any] = []
+        placeholder = _PLACEHOLDERS[self.paramstyle]
+
+        def bind(value: Any) -> str:
+            parameters.append(value)
+            return placeholder(len(parameters))
+
+        parts = fold_operations(
+            operations,
+            lambda op: self._transform_operator(op, bind),
+            self._combine_logic_operator,
+        )
+        where = "".join(_flatten(self._and(parts)))
+        if self.paramstyle in ("named", "pyformat"):
+            return SQLQuery(
+                where,
+                {f"p{index}": value for index, value in enumerate(parameters, 1)},
+            )
+        return SQLQuery(where, tuple(parameters))
+
+    def non_sargable_reason(self, op: Operator) -> str | None:
+        match op.operator:
+            case Operators.CONTAINS:
+                return "renders a substring search"
+            case Operators.REGEX:
+                return "renders a regular expression match"
+            case _:
+                return None
+
+    @staticmethod
+    def create_regexp(connection: Any) -> None:
+        """Define the ``regexp`` function SQLite calls for ``REGEXP``.
+
+        Args:
+            connection: ``sqlite3`` connection
+        """
+
+        def regexp(pattern: str, value: Any) -> bool:
+            return isinstance(value, str) and re.search(pattern, value) is not None
+
+        connection.create_function("regexp", 2, regexp, deterministic=True)
+
+    @staticmethod
+    def create_lower(connection: Any) -> None:
+        """Replace SQLite's ASCII only ``lower`` with :meth:`str.lower`.
+
+        ``contains`` with ``ignore_case`` lowercases the value in Python, so
+        without this non-ASCII text in the column never matches.
+
+        Args:
+            connection: ``sqlite3`` connection
+        """
+
+        def lower(value: Any) -> Any:
+            return value.lower() if isinstance(value, str) else value
+
+        connection.create_function("lower", 1, lower, deterministic=True)
+
+    def _combine_logic_operator(
+        self, op: LogicOperator, criteria: list[_Parts]
+    ) -> _Parts:
+        match op.operator:
+            case LogicOperators.AND:
+                return self._and(criteria)
+            case LogicOperators.OR:
+                if not criteria:
+                    return "1 = 0"
+                return self._join(" OR ", criteria)
+            case LogicOperators.NOT:
+                return ["(NOT ", self._and(criteria), ")"]
+            case _:
+                raise UnsupportedOperationError(
+                    f"Unsupported logic operator: {op.operator}"
+                )
+
+    def _and(self, criteria: list[_Parts]) -> _Parts:
+        if not criteria:
+            return "1 = 1"
+        return self._join(" AND ", criteria)
+
+    def _join(self, separator: str, criteria: list[_Parts]) -> _Parts:
+        if len(criteria) == 1:
+            return criteria[0]
+        parts: list[_Parts] = ["("]
+        for index, criterion in enumerate(criteria):
+            if index:
+                parts.append(separator)
+            parts.append(criterion)
+        parts.append(")")
+        return parts
+
+    def _transform_operator(self, op: Operator, bind: Callable[[Any], str]) -> str:
+        if op.operator not in ALL_OPERATORS:
+            raise UnsupportedOperationError(f"Unsupported operator: {op.operator}")
+
+        column = self._get_column(op.field)
+        value = op.value
+        match op.operator:
+            case Operators.EQ if value is None:
+                return f"{column} IS NULL"
+            case Operators.NEQ if value is None:
+                return f"{column} IS NOT NULL"
+            case (
+                Operators.EQ
+                | Operators.NEQ
+                | Operators.GT
+                | Operators.GTE
+                | Operators.LT
+                | Operators.LTE
+            ):
+                return f"{column} {_COMPARISONS[op.operator]} {bind(value)}"
+            case Operators.IN:
+                if isinstance(value, Param):
+                    if self.dialect.in_param is None:
+                        raise UnsupportedOperationError(
+                            "SQLBackend does not support Param placeholders for"
+                            " 'in' with this dialect"
+                        )
+                    return self.dialect.in_param.format(
+                        column=column, value=bind(value)
+                    )
+                if not value:
+                    return "1 = 0"
+                placeholders = ", ".join(bind(item) for item in value)
+                return f"{column} IN ({placeholders})"
+            case Operators.CONTAINS:
+                return self._transform_contains(column, cast(ContainsData, value), bind)
+            case Operators.REGEX:
+                return self.dialect.regex.format(column=column, value=bind(value))
+            case _:
+                raise UnsupportedOperationError(f"Unsupported operator: {op.operator}")
+
+    def _transform_contains(
+        self, column: str, contains_data: ContainsData, bind: Callable[[Any], str]
+    ) -> str:
+        value = contains_data.value
+        if not contains_data.ignore_case:
+            return self.dialect.contains.format(column=column, value=bind(value))
+
+        lowered = _LowerSlot(value) if isinstance(value, Param) else value.lower()
+        return self.dialect.contains_ignore_case.format(
+            column=column, value=bind(lowered)
+        )
+
+    def _get_column(self, field: str) -> str:
+        column = self.columns.get(field)
+        if column is None:
+            raise AttributeError(f"Field '{field}' is not an allowed column")
+        return column
+
+    def _quote(self, identifier: str) -> str:
+        quote = self.dialect.quote
+        return f"{quote}{identifier.replace(quote, quote * 2)}{quote}"
+
+
+def _flatten(parts: _Parts) -> Iterator[str]:
+    """Yield the pieces of rendered SQL in order, without recursion."""
+    stack: list[Iterator[_Parts]] = [iter([parts])]
+    while stack:
+        for part in stack[-1]:
+            if isinstance(part, str):
+                yield part
+            else:
+                stack.append(iter(part))
+                break
+        else:
+            stack.pop()
@@ -1,13 +1,22 @@
-from collections.abc import Callable, Sequence
-from typing import Any, cast
+import functools
+import uuid
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 import sqlalchemy as sa
 from sqlalchemy import Column, ColumnElement, func
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import DeclarativeBase, RelationshipProperty, Session, aliased
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.compiler import SQLCompiler
 
 from charter._backends.interface import Backend
 from charter._exc import UnsupportedOperationError
 from charter._ops import (
+    ALL_OPERATORS,
     ContainsData,
     LogicOperator,
     LogicOperators,
@@ -15,14 +24,291 @@ from charter._ops import (
     OperationType,
     Operator,
     Operators,
+    Param,
+    fold_logic_operator,
+    fold_operations,
 )
+from charter._pagination import Keyset
+from charter._regex import literal_prefix
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+# Key in ``Table.info`` holding the rows of a temporary ``in`` table.
+_TEMP_TABLE_VALUES = "charter_in_values"
+
+# Values JSONB containment compares like ``=`` does.
+_JSON_SCALARS = frozenset({str, int, float, bool})
+
+_ARRAY_OPERATORS = frozenset({Operators.ANY, Operators.ALL, Operators.ELEM_MATCH})
+
+
+class InListThresholds(NamedTuple):
+    """List lengths at which :class:`SQLAlchemyBackend` switches ``in`` strategy.
+
+    By default every list is sent as one expanding bind parameter, a plain
+    ``column IN (...)`` whose values go through the column type's bind
+    processing. Other strategies are opt-in: lists shorter than ``literal``
+    are rendered inline as literals; from ``values`` on, the list is
+    rendered as a ``VALUES`` derived table, which needs no bind parameters
+    and lets the database join against it; from ``temp_table`` on, the list
+    is loaded into a temporary table (see
+    :meth:`SQLAlchemyBackend.temp_tables`). ``None`` disables a strategy.
+
+    The ``literal`` and ``values`` strategies render values with the
+    column type's literal processor instead of its bind processor, so they
+    suit plain numeric, string and date columns only; binary columns and
+    ``TypeDecorator`` types with ``process_bind_param`` stop matching.
+    Inlined literals also defeat the database's plan cache.
+    """
+
+    literal: int | None = None
+    values: int | None = None
+    temp_table: int | None = None
+
+
+class _FieldPath(NamedTuple):
+    """A field resolved to a column, reached through ``relationships``."""
+
+    # Attribute key of the column on the mapper of the last relationship.
+    key: str
+    column: Column[Any]
+    relationships: tuple[RelationshipProperty[Any], ...]
+    # Keys leading into the document of a JSON column.
+    json_path: tuple[str, ...] = ()
+
+
+class _Criteria(NamedTuple):
+    """Criteria of one operation for :meth:`SQLAlchemyBackend.filter`."""
+
+    # Criteria using ``EXISTS`` for every relationship.
+    exists: ColumnElement[bool]
+    # Criteria using the joined tables, ``None`` if no join is involved.
+    joined: ColumnElement[bool] | None
+
+
+@functools.cache
+def _field_paths(entity: type[DeclarativeBase]) -> Mapping[str, _FieldPath]:
+    """Map the columns of ``entity`` and of its direct relationships.
+
+    Built once per entity and shared by every backend instance. Related
+    columns are keyed by a dotted path, such as ``author.name``.
+    """
+    mapper = sa.inspect(entity)
+    paths = {key: _FieldPath(key, column, ()) for key, column in mapper.columns.items()}
+    for relationship in mapper.relationships:
+        for key, column in relationship.mapper.columns.items():
+            paths[f"{relationship.key}.{key}"] = _FieldPath(
+                key, column, (relationship,)
+            )
+    return MappingProxyType(paths)
+
+
+def _walk_field_path(entity: type[DeclarativeBase], field: str) -> _FieldPath | None:
+    """Resolve a dotted path through relationships, then into a JSON column."""
+    names = field.split(".")
+    mapper = sa.inspect(entity)
+    relationships = []
+    for index, name in enumerate(names):
+        relationship = mapper.relationships.get(name)
+        if relationship is not None:
+            relationships.append(relationship)
+            mapper = relationship.mapper
+            continue
+
+        column = mapper.columns.get(name)
+        json_path = tuple(names[index + 1 :])
+        if column is None or (json_path and not isinstance(column.type, sa.JSON)):
+            return None
+        return _FieldPath(name, column, tuple(relationships), json_path)
+    return None
+
+
+def _walk_relationships(
+    entity: type[DeclarativeBase], field: str
+) -> tuple[RelationshipProperty[Any], ...] | None:
+    """Resolve a dotted path made of relationships only."""
+    mapper = sa.inspect(entity)
+    relationships = []
+    for name in field.split("."):
+        relationship = mapper.relationships.get(name)
+        if relationship is None:
+            return None
+        relationships.append(relationship)
+        mapper = relationship.mapper
+    return tuple(relationships)
+
+
+def _nest(json_path: Sequence[str], value: Any) -> Any:
+    """Wrap a value in the objects leading to it along a JSON path."""
+    for key in reversed(json_path):
+        value = {key: value}
+    return value
+
+
+def _equality_document(operations: Sequence[Operation]) -> dict[str, Any] | None:
+    """Build the object an element must contain to match ``eq`` operations.
+
+    ``None`` unless every operation is a scalar ``eq``, possibly under
+    ``and``, and no two of them conflict.
+    """
+    document: dict[str, Any] = {}
+    stack = list(operations)
+    while stack:
+        operation = stack.pop()
+        if operation.operation_type is OperationType.LOGIC:
+            logic = cast(LogicOperator, operation)
+            if logic.operator != LogicOperators.AND:
+                return None
+            stack.extend(logic.operations)
+            continue
+
+        op = cast(Operator, operation)
+        if op.operator != Operators.EQ or type(op.value) not in _JSON_SCALARS:
+            return None
+        *keys, last = op.field.split(".")
+        target = document
+        for key in keys:
+            target = target.setdefault(key, {})
+            if not isinstance(target, dict):
+                return None
+        if target.setdefault(last, op.value) != op.value:
+            return None
+    return document
+
+
+def _containment_documents(op: Operator, json_path: Sequence[str]) -> list[Any] | None:
+    """Documents a JSONB column must contain one of for ``op`` to match.
+
+    ``None`` where containment can't express the operation, which then falls
+    back to extracting the value at ``json_path``.
+    """
+    value = op.value
+    match op.operator:
+        case Operators.EQ if type(value) in _JSON_SCALARS:
+            return [_nest(json_path, value)]
+        case Operators.IN | Operators.ANY if isinstance(value, Sequence) and all(
+            type(item) in _JSON_SCALARS for item in value
+        ):
+            wrap = op.operator == Operators.ANY
+            return [_nest(json_path, [item] if wrap else item) for item in value]
+        case Operators.ALL if isinstance(value, Sequence) and all(
+            type(item) in _JSON_SCALARS for item in value
+        ):
+            return [_nest(json_path, list(value))]
+        case Operators.ELEM_MATCH:
+            document = _equality_document(value)
+            return None if document is None else [_nest(json_path, [document])]
+        case _:
+            return None
+
+
+def _json_element(
+    column: ColumnElement[Any], json_path: Sequence[str], value: Any
+) -> ColumnElement[Any]:
+    """Extract the value at ``json_path``, typed after the compared value."""
+    element = column[tuple(json_path) if len(json_path) > 1 else json_path[0]]
+    if isinstance(value, ContainsData):
+        value = value.value
+    elif isinstance(value, list | tuple) and value:
+        value = value[0]
+
+    match value:
+        case bool():
+            return element.as_boolean()  # type: ignore[no-any-return]
+        case int():
+            return element.as_integer()  # type: ignore[no-any-return]
+        case float():
+            return element.as_float()  # type: ignore[no-any-return]
+        case _:
+            return element.as_string()  # type: ignore[no-any-return]
+
+
+def _find_temp_tables(statement: sa.ClauseElement) -> list[sa.Table]:
+    tables = {
+        element.name: element
+        for element in visitors.iterate(statement)
+        if isinstance(element, sa.Table) and _TEMP_TABLE_VALUES in element.info
+    }
+    return list(tables.values())
+
+
+def _create_temp_tables(connection: sa.Connection, tables: list[sa.Table]) -> None:
+    for table in tables:
+        table.create(connection)
+        connection.execute(
+            sa.insert(table),
+            [{"value": value} for value in table.info[_TEMP_TABLE_VALUES]],
+        )
+
+
+def _drop_temp_tables(connection: sa.Connection, tables: list[sa.Table]) -> None:
+    for table in tables:
+        table.drop(connection)
+
+
+class _InValues(ColumnElement[bool]):
+    """``column IN (VALUES ...)`` with the values rendered as literals.
+
+    Built by hand rather than with ``sa.values``, which creates and compiles
+    one tuple element per row and is far too slow for this list size.
+    Statements holding it are not cached, as no two lists are alike.
+    """
+
+    inherit_cache = False
+    type = sa.Boolean()
+
+    _traverse_internals = [("column", visitors.InternalTraversal.dp_clauseelement)]
+
+    def __init__(self, column: ColumnElement[Any], values: Sequence[Any]) -> None:
+        self.column = column
+        self.values = values
+
+    @property
+    def _from_objects(self) -> list[sa.FromClause]:
+        return self.column._from_objects
+
+
+def _render_in_values(
+    element: _InValues, compiler: SQLCompiler, row: str, **kw: Any
+) -> str:
+    render = compiler.render_literal_value
+    type_ = element.column.type
+    rows = ", ".join(row.format(render(value, type_)) for value in element.values)
+    return f"{compiler.process(element.column, **kw)} IN (VALUES {rows})"
+
+
+@compiles(_InValues)
+def _compile_in_values(element: _InValues, compiler: SQLCompiler, **kw: Any) -> str:
+    return _render_in_values(element, compiler, "({})", **kw)
+
+
+@compiles(_InValues, "mysql")
+@compiles(_InValues, "mariadb")
+def _compile_in_values_mysql(
+    element: _InValues, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return _render_in_values(element, compiler, "ROW({})", **kw)
 
 
 class SQLAlchemyBackend(Backend[ColumnElement[bool]]):
     """
     Backend for SQLAlchemy ORM queries.
 
-    Transforms operations into SQLAlchemy column expressions.
+    Transforms operations into SQLAlchemy column expressions. ``Param``
+    placeholders become bind parameters, so a transformed template can be
+    executed many times with different values and reuse the compiled
+    statement cache. A placeholder bound to ``None`` matches nothing, as
+    ``= NULL`` does, unless ``nullable_params`` is set.
+
+    Fields may be dotted paths through relationships, such as
+    ``author.name``. They are compared in an ``EXISTS`` subquery, built with
+    ``has()`` for to-one and ``any()`` for to-many relationships, so a book
+    with several matching tags is still returned once. A path may continue
+    into a JSON column, such as ``meta.size.width``. There the extracted
+    value is cast after the Python type of the compared value, so ``Param``
+    placeholders, which have none, are rejected on JSON paths, except in
+    ``contains`` and ``regex``, which always compare strings.
     """
 
     entity: type[DeclarativeBase]
@@ -35,11 +321,26 @@ class SQLAlchemyBackend(Backend[ColumnElement[bool]]):
         entity: type[DeclarativeBase],
         *,
         use_lower_like: bool = False,
+        in_thresholds: InListThresholds = InListThresholds(),  # noqa: B008
+        regex_prefix_range: bool = False,
+        nullable_params: bool = False,
     ) -> None:
         """Initialize SQLAlchemy backend.
 
         Args:
             entity: SQLAlchemy model class
+            use_lower_like: Whether to use ``lower(column) LIKE`` instead of
+                ``ILIKE`` for case-insensitive ``contains``
+            in_thresholds: List lengths at which ``in`` switches strategy
+            regex_prefix_range: Whether ``regex`` with an anchored literal
+                prefix is compared as a range over that prefix, keeping
+                ``REGEXP`` only for the rest of the pattern. Only valid for
+                columns ordered by code point, such as under the ``C`` or a
+                binary collation.
+            nullable_params: Whether ``eq`` and ``neq`` with a ``Param``
+                match like the literal ``None`` when it is bound to ``None``.
+                The null case is then spelled out next to the comparison,
+                which a generic prepared plan cannot serve from an index.
         """
         if not issubclass(entity, DeclarativeBase):
             raise TypeError(
@@ -47,6 +348,11 @@ class SQLAlchemyBackend(Backend[ColumnElement[bool]]):
             )
 
         self.entity = entity
+        self.fields = _field_paths(entity)
+        self.use_lower_like = use_lower_like
+        self.in_thresholds = in_thresholds
+        self.regex_prefix_range = regex_prefix_range
+        self.nullable_params = nullable_params
 
         if use_lower_like:
             self.generate_contains_ignore_case = lambda c, p: func.lower(c).like(
@@ -56,108 +362,532 @@ class SQLAlchemyBackend(Backend[ColumnElement[bool]]):
             self.generate_contains_ignore_case = lambda c, p: c.ilike(p.lower())
 
     def transform(self, operations: Sequence[Operation]) -> ColumnElement[bool]:
-        if not operations:
-            return sa.true()
+        criteria = fold_operations(
+            operations, self._transform_operator, self._combine_logic_operator
+        )
+        return self._and(criteria)
 
-        criteria: list[ColumnElement[bool]] = []
-
-        for op in operations:
-            match op.operation_type:
-                case OperationType.OPERATOR:
-                    criteria.append(self._transform_operator(cast(Operator, op)))
-                case OperationType.LOGIC:
-                    criteria.append(
-                        self._transform_logic_operator(cast(LogicOperator, op))
-                    )
-                case _:
-                    raise UnsupportedOperationError(
-                        f"Unsupported operation type: {op.operation_type}"
-                    )
+    def filter(
+        self, statement: sa.Select[Any], operations: Sequence[Operation]
+    ) -> sa.Select[Any]:
+        """Apply operations to a select of the entity, joining to-one relationships.
 
-        if len(criteria) == 1:
-            return criteria[0]
+        Unlike :meth:`transform`, fields reached only through to-one
+        relationships are compared on a ``LEFT OUTER JOIN`` of the related
+        table, which never repeats rows and which the database plans like
+        any other join. To-many relationships keep the ``EXISTS`` subquery.
+        Fields under ``not`` keep it as well: only there does a missing
+        related row satisfy the negation.
 
-        return sa.and_(*criteria)
+        Args:
+            statement: Select of the entity
+            operations: Operations to apply
+
+        Returns:
+            The statement with the joins and the ``WHERE`` criteria added
+        """
+        joins: dict[tuple[str, ...], tuple[type[Any], Any]] = {}
+
+        def leaf(op: Operator) -> _Criteria:
+            exists = self._transform_operator(op)
+            if op.operator == Operators.ELEM_MATCH:
+                return _Criteria(exists, None)
+            path = self._get_field_path(op.field)
+            if not path.relationships or any(
+                relationship.uselist for relationship in path.relationships
+            ):
+                return _Criteria(exists, None)
+
+            target = self._join(path, joins)
+            column = getattr(target, path.key).expression
+            return _Criteria(exists, self._compare(column, op, path.json_path))
+
+        def logic(op: LogicOperator, results: list[_Criteria]) -> _Criteria:
+            exists = self._combine_logic_operator(op, [r.exists for r in results])
+            if op.operator == LogicOperators.NOT or all(
+                result.joined is None for result in results
+            ):
+                return _Criteria(exists, None)
+            return _Criteria(
+                exists, self._combine_logic_operator(op, self._joined(results))
+            )
+
+        results = fold_operations(operations, leaf, logic)
+        for target, onclause in joins.values():
+            statement = statement.outerjoin(target, onclause)
+        return statement.where(self._and(self._joined(results)))
+
+    def _join(
+        self,
+        path: _FieldPath,
+        joins: dict[tuple[str, ...], tuple[type[Any], Any]],
+    ) -> type[Any]:
+        """Return the joined alias of the last relationship of ``path``."""
+        parent: Any = self.entity
+        prefix: tuple[str, ...] = ()
+        for relationship in path.relationships:
+            prefix += (relationship.key,)
+            if prefix not in joins:
+                target = aliased(relationship.mapper.class_)
+                joins[prefix] = (
+                    target,
+                    getattr(parent, relationship.key).of_type(target),
+                )
+            parent = joins[prefix][0]
+        return cast(type[Any], parent)
+
+    def _joined(self, results: list[_Criteria]) -> list[ColumnElement[bool]]:
+        return [
+            result.exists if result.joined is None else result.joined
+            for result in results
+        ]
+
+    def order_by(self, keyset: Keyset) -> list[ColumnElement[Any]]:
+        """Build the ``ORDER BY`` clauses of a keyset.
+
+        Args:
+            keyset: Sort order of the pages
+
+        Returns:
+            Clauses to pass to ``Select.order_by``
+        """
+        clauses: list[ColumnElement[Any]] = []
+        for key in keyset.keys:
+            column = self._get_column(key.field)
+            clauses.append(column.desc() if key.descending else column.asc())
+        return clauses
+
+    def seek(
+        self, keyset: Keyset, values: Sequence[Any], *, row_values: bool = True
+    ) -> ColumnElement[bool]:
+        """Build the criteria selecting the rows after ``values``.
+
+        When all keys sort in the same direction and ``row_values`` is set,
+        this is a single row-value comparison such as ``(a, b) > (x, y)``,
+        which PostgreSQL, MySQL and SQLite match against a composite index.
+        Otherwise it is the transformed :meth:`Keyset.after` predicate,
+        ``(a > x) OR (a = x AND b > y)`` behind a bound on ``a``, which works
+        everywhere.
+
+        Args:
+            keyset: Sort order of the pages
+            values: Values of the sort keys in the last row of a page
+            row_values: Whether to use a row-value comparison where possible.
+                Disable it for databases without one, such as SQL Server.
+
+        Returns:
+            Criteria selecting the next page
+        """
+        predicate = keyset.after(values)
+        directions = {key.descending for key in keyset.keys}
+        if not row_values or len(keyset.keys) == 1 or len(directions) > 1:
+            return self.transform([predicate])
+
+        columns = sa.tuple_(*(self._get_column(key.field) for key in keyset.keys))
+        row = sa.tuple_(*(sa.literal(value) for value in values))
+        return columns < row if directions == {True} else columns > row
 
     def _transform_logic_operator(self, op: LogicOperator) -> ColumnElement[bool]:
+        return fold_logic_operator(
+            op, self._transform_operator, self._combine_logic_operator
+        )
+
+    def _combine_logic_operator(
+        self, op: LogicOperator, criteria: list[ColumnElement[bool]]
+    ) -> ColumnElement[bool]:
         match op.operator:
             case LogicOperators.AND:
-                return sa.and_(*self.transform(op.operations))
+                return sa.and_(*criteria)
             case LogicOperators.OR:
-                return sa.or_(*self.transform(op.operations))
+                return sa.or_(*criteria)
             case LogicOperators.NOT:
-                return ~self.transform(op.operations)
+                return ~self._and(criteria)
             case _:
                 raise UnsupportedOperationError(
                     f"Unsupported logic operator: {op.operator}"
                 )
 
+    def _and(self, criteria: list[ColumnElement[bool]]) -> ColumnElement[bool]:
+        if not criteria:
+            return sa.true()
+        if len(criteria) == 1:
+            return criteria[0]
+        return sa.and_(*criteria)
+
     def _transform_operator(self, op: Operator) -> ColumnElement[bool]:
-        column = self._get_column(op.field)
+        relationships = None
+        if op.operator == Operators.ELEM_MATCH:
+            relationships = _walk_relationships(self.entity, op.field)
+
+        if relationships is not None:
+            # Elements are rows of the related entity, matched with ``EXISTS``.
+            related = SQLAlchemyBackend(
+                relationships[-1].mapper.class_,
+                use_lower_like=self.use_lower_like,
+                in_thresholds=self.in_thresholds,
+                regex_prefix_range=self.regex_prefix_range,
+                nullable_params=self.nullable_params,
+            )
+            criterion = related.transform(op.value)
+        else:
+            path = self._get_field_path(op.field)
+            relationships = path.relationships
+            criterion = self._compare(path.column, op, path.json_path)
+
+        for relationship in reversed(relationships):
+            attribute = relationship.class_attribute
+            if relationship.uselist:
+                criterion = attribute.any(criterion)
+            else:
+                criterion = attribute.has(criterion)
+        return criterion
+
+    def _compare(
+        self,
+        column: ColumnElement[Any],
+        op: Operator,
+        json_path: Sequence[str] = (),
+    ) -> ColumnElement[bool]:
+        if op.operator not in ALL_OPERATORS:
+            raise UnsupportedOperationError(f"Unsupported operator: {op.operator}")
+
+        if json_path or op.operator in _ARRAY_OPERATORS:
+            criterion = self._compare_document(column, op, json_path)
+            if criterion is not None:
+                return criterion
+            column = _json_element(column, json_path, op.value)
+
+        value = op.value
+        if isinstance(value, Param):
+            if self.nullable_params and op.operator in (Operators.EQ, Operators.NEQ):
+                return self._compare_param(column, op.operator, value)
+            value = sa.bindparam(value.name, expanding=op.operator == Operators.IN)
+
         match op.operator:
             case Operators.EQ:
-                match op.value:
+                match value:
                     case None:
                         return column.is_(None)
                     case bool():
-                        return column.is_(op.value)
+                        return column.is_(value)
                     case _:
-                        return column == op.value  # type: ignore[no-any-return]
+                        return column == value  # type: ignore[no-any-return]
 
             case Operators.NEQ:
-                match op.value:
+                match value:
                     case None:
                         return column.isnot(None)
                     case bool():
-                        return column.isnot(op.value)
+                        return column.isnot(value)
                     case _:
-                        return column != op.value  # type: ignore[no-any-return]
+                        return column != value  # type: ignore[no-any-return]
 
             case Operators.IN:
-                return column.in_(op.value)
+                if isinstance(value, ColumnElement):
+                    return column.in_(value)
+                return self._transform_in(column, value)
             case Operators.GT:
-                return column > op.value  # type: ignore[no-any-return]
+                return column > value  # type: ignore[no-any-return]
             case Operators.GTE:
-                return column >= op.value  # type: ignore[no-any-return]
+                return column >= value  # type: ignore[no-any-return]
             case Operators.LT:
-                return column < op.value  # type: ignore[no-any-return]
+                return column < value  # type: ignore[no-any-return]
             case Operators.LTE:
-                return column <= op.value  # type: ignore[no-any-return]
+                return column <= value  # type: ignore[no-any-return]
             case Operators.CONTAINS:
-                return self._transform_contains(column, cast(ContainsData, op.value))
+                return self._transform_contains(column, cast(ContainsData, value))
             case Operators.REGEX:
-                return self._transform_regex(column, op.value)
+                return self._transform_regex(column, value)
             case _:
                 raise UnsupportedOperationError(f"Unsupported operator: {op.operator}")
 
+    def _compare_param(
+        self, column: ColumnElement[Any], operator: Operators, param: Param
+    ) -> ColumnElement[bool]:
+        """Compare for equality with a parameter that may be bound to ``None``.
+
+        A literal ``None`` becomes ``IS NULL`` or ``IS NOT NULL``, which a
+        bind parameter cannot switch to, so the null case is spelled out
+        next to the plain comparison.
+        """
+        value = sa.bindparam(param.name, type_=column.type)
+        if operator == Operators.EQ:
+            return sa.or_(column == value, sa.and_(column.is_(None), value.is_(None)))
+        return sa.or_(column != value, sa.and_(column.isnot(None), value.is_(None)))
+
+    def _compare_document(
+        self,
+        column: ColumnElement[Any],
+        op: Operator,
+        json_path: Sequence[str],
+    ) -> ColumnElement[bool] | None:
+        """Compare with an operator GIN indexes serve, where one applies.
+
+        ``any`` and ``all`` on an ``ARRAY`` column become ``&&`` and ``@>``.
+        On a ``JSONB`` column, operations that containment expresses become
+        ``@>`` against a document nesting the value under ``json_path``.
+        Other operations on a JSON path return ``None``, to be compared with
+        the extracted value instead.
+        """
+        value = op.value
+        column_type = column.type
+        if isinstance(column_type, ARRAY) and not json_path:
+            if isinstance(value, Param):
+                value = sa.bindparam(value.name, type_=column_type)
+            match op.operator:
+                case Operators.ANY:
+                    return cast(ColumnElement[bool], column.overlap(value))
+                case Operators.ALL:
+                    return column.contains(value)
+
+        if isinstance(value, Param) and op.operator != Operators.REGEX:
+            # Without a value there is no type to cast the extraction to,
+            # and containment needs the whole document up front.
+            raise UnsupportedOperationError(
+                "SQLAlchemyBackend does not support Param placeholders"
+                f" for '{op.operator}' on JSON fields; pass the value itself"
+            )
+
+        if isinstance(column_type, JSONB):
+            documents = _containment_documents(op, json_path)
+            if documents is not None:
+                return sa.or_(*(column.contains(document) for document in documents))
+
+        if op.operator in _ARRAY_OPERATORS:
+            raise UnsupportedOperationError(
+                f"SQLAlchemyBackend supports '{op.operator}' only on JSONB"
+                " and ARRAY columns, and on relationships for 'elem_match'"
+                " with equality conditions on JSONB"
+            )
+        return None
+
+    def non_sargable_reason(self, op: Operator) -> str | None:
+        if "." in op.field and op.operator in ALL_OPERATORS:
+            path = self.fields.get(op.field) or _walk_field_path(self.entity, op.field)
+            if (
+                path is not None
+                and path.json_path
+                and not (
+                    isinstance(path.column.type, JSONB)
+                    and _containment_documents(op, path.json_path) is not None
+                )
+            ):
+                return "renders a JSON path extraction"
+
+        match op.operator:
+            case Operators.CONTAINS:
+                if not cast(ContainsData, op.value).ignore_case:
+                    return "renders LIKE with a leading wildcard"
+                if self.use_lower_like:
+                    return "renders lower(column) LIKE with a leading wildcard"
+                return "renders ILIKE with a leading wildcard"
+            case Operators.REGEX if not (
+                self.regex_prefix_range
+                and isinstance(op.value, str)
+                and literal_prefix(op.value) is not None
+            ):
+                return "renders a REGEXP match"
+            case _:
+                return None
+
+    def _transform_in(
+        self, column: ColumnElement[Any], values: Sequence[Any]
+    ) -> ColumnElement[bool]:
+        """Pick the ``in`` strategy by list length, see :class:`InListThresholds`."""
+        size = len(values)
+        thresholds = self.in_thresholds
+
+        if thresholds.temp_table is not None and size >= thresholds.temp_table:
+            table = sa.Table(
+                f"charter_in_{uuid.uuid4().hex}",
+                sa.MetaData(),
+                sa.Column("value", column.type, primary_key=True),
+                prefixes=["TEMPORARY"],
+                info={_TEMP_TABLE_VALUES: list(dict.fromkeys(values))},
+            )
+            return column.in_(sa.select(table.c.value))
+
+        if thresholds.values is not None and size >= thresholds.values:
+            return _InValues(column, values)
+
+        if thresholds.literal is not None and size < thresholds.literal:
+            return column.in_(
+                sa.bindparam(None, list(values), expanding=True, literal_execute=True)
+            )
+
+        return column.in_(values)
+
+    @staticmethod
+    @contextmanager
+    def temp_tables(
+        connection: sa.Connection, statement: sa.ClauseElement
+    ) -> Iterator[None]:
+        """Create and fill the temporary ``in`` tables a statement refers to.
+
+        The tables are dropped on exit. Statements without such tables are
+        left untouched, so it is safe to wrap every execution::
+
+            stmt = sa.select(User).where(backend.transform(operations))
+            with backend.temp_tables(connection, stmt):
+                rows = connection.execute(stmt).all()
+
+        Args:
+            connection: Connection the statement is executed on
+            statement: Statement built from the backend's criteria
+        """
+        tables = _find_temp_tables(statement)
+        _create_temp_tables(connection, tables)
+        try:
+            yield
+        finally:
+            _drop_temp_tables(connection, tables)
+
+    def stream(
+        self,
+        session: Session | sa.Connection,
+        operations: Sequence[Operation],
+        *,
+        statement: sa.Select[Any] | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Sequence[Any]]:
+        """Execute operations and yield the results in batches.
+
+        Rows are fetched ``batch_size`` at a time from a server-side cursor
+        (``yield_per``), so memory stays bounded however many rows match.
+        Temporary ``in`` tables live until the iteration ends.
+
+        Args:
+            session: Session or connection to execute on
+            operations: Sequence of operations to transform
+            statement: Select to filter, ``select(entity)`` by default
+            batch_size: Number of rows per batch
+
+        Yields:
+            Entity instances for the default statement, rows otherwise
+        """
+        stmt, scalars = self._stream_statement(operations, statement)
+        connection = session.connection() if isinstance(session, Session) else session
+        with self.temp_tables(connection, stmt):
+            result = session.execute(stmt, execution_options={"yield_per": batch_size})
+            try:
+                yield from (result.scalars() if scalars else result).partitions()
+            finally:
+                result.close()
+
+    async def astream(
+        self,
+        session: "AsyncSession | AsyncConnection",
+        operations: Sequence[Operation],
+        *,
+        statement: sa.Select[Any] | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Any]]:
+        """Execute operations and yield the results in batches, asynchronously.
+
+        Same as :meth:`stream`, for ``async for`` over an ``AsyncSession`` or
+        ``AsyncConnection``.
+
+        Args:
+            session: Session or connection to execute on
+            operations: Sequence of operations to transform
+            statement: Select to filter, ``select(entity)`` by default
+            batch_size: Number of rows per batch
+
+        Yields:
+            Entity instances for the default statement, rows otherwise
+        """
+        stmt, scalars = self._stream_statement(operations, statement)
+        if hasattr(session, "sync_session"):
+            connection = await session.connection()
+        else:
+            connection = session
+
+        tables = _find_temp_tables(stmt)
+        await connection.run_sync(_create_temp_tables, tables)
+        try:
+            result = await session.stream(
+                stmt, execution_options={"yield_per": batch_size}
+            )
+            try:
+                async for partition in (
+                    result.scalars() if scalars else result
+                ).partitions():
+                    yield partition
+            finally:
+                await result.close()
+        finally:
+            await connection.run_sync(_drop_temp_tables, tables)
+
+    def _stream_statement(
+        self, operations: Sequence[Operation], statement: sa.Select[Any] | None
+    ) -> tuple[sa.Select[Any], bool]:
+        """Build the filtered statement and whether it selects the entity."""
+        if statement is None:
+            return sa.select(self.entity).where(self.transform(operations)), True
+        return statement.where(self.transform(operations)), False
+
     def _transform_contains(
         self,
         column: ColumnElement[Any],
         contains_data: ContainsData,
     ) -> ColumnElement[bool]:
+        if isinstance(contains_data.value, Param):
+            return self._transform_contains_param(column, contains_data)
+
         pattern = f"%{contains_data.value}%"
 
         if contains_data.ignore_case:
             return self.generate_contains_ignore_case(column, pattern)
         return column.like(pattern)
 
+    def _transform_contains_param(
+        self,
+        column: ColumnElement[Any],
+        contains_data: ContainsData,
+    ) -> ColumnElement[bool]:
+        param = cast(Param, contains_data.value)
+        pattern = "%" + sa.bindparam(param.name, type_=sa.String()) + "%"
+
+        if not contains_data.ignore_case:
+            return column.like(pattern)
+        if self.use_lower_like:
+            return func.lower(column).like(func.lower(pattern))
+        return column.ilike(pattern)
+
     def _transform_regex(
         self,
         column: ColumnElement[Any],
-        pattern: str,
+        pattern: str | ColumnElement[Any],
     ) -> ColumnElement[bool]:
         """Transform regex operation to SQLAlchemy regex operator."""
         # Note: REGEXP operator may not be available in all databases
         # PostgreSQL uses ~, MySQL uses REGEXP, SQLite uses REGEXP (with extension)
-        return column.op("REGEXP")(pattern)
+        if not (self.regex_prefix_range and isinstance(pattern, str)):
+            return column.op("REGEXP")(pattern)
+
+        prefix = literal_prefix(pattern)
+        if prefix is None:
+            return column.op("REGEXP")(pattern)
+
+        criteria = [column >= prefix.prefix]
+        if prefix.upper_bound is not None:
+            criteria.append(column < prefix.upper_bound)
+        if not prefix.exact:
+            criteria.append(column.op("REGEXP")(pattern))
+        return self._and(criteria)
 
     def _get_column(self, field_name: str) -> Column[Any]:
         """Get column attribute from entity."""
-        column = self.entity.__mapper__.columns.get(field_name)
+        return self._get_field_path(field_name).column
+
+    def _get_field_path(self, field_name: str) -> _FieldPath:
+        path = self.fields.get(field_name)
+        if path is None and "." in field_name:
+            path = _walk_field_path(self.entity, field_name)
 
-        if column is None:
+        if path is None:
             raise AttributeError(
                 f"Object of type {self.entity.__class__}"
                 f" has no attribute '{field_name}'"
             )
-        return column
+        return path
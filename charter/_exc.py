@@ -20,3 +20,31 @@ class OperationError(CharterError):
 
 class UnsupportedOperationError(OperationError):
     """Exception raised for unsupported operations in a backend."""
+
+
+class ParseError(CharterError):
+    """Exception raised when a filter document cannot be parsed."""
+
+
+class PayloadTooLargeError(ParseError):
+    """Exception raised when a filter document exceeds a size limit."""
+
+
+class SerializationError(CharterError):
+    """Exception raised when operations cannot be serialized or deserialized."""
+
+
+class SargabilityWarning(UserWarning):
+    """Warning for an operation the backend renders in a form no index can serve.
+
+    Attributes:
+        field: Field of the operation
+        operator: Operator of the operation
+        reason: What the backend renders that defeats the index
+    """
+
+    def __init__(self, field: str, operator: str, reason: str) -> None:
+        super().__init__(f"Operator '{operator}' on field '{field}' {reason}")
+        self.field = field
+        self.operator = operator
+        self.reason = reason
@@ -0,0 +1,134 @@
+"""Loading operations from the JSON filter format.
+
+Each operation is an object with a single key naming the operator::
+
+    {"or": [{"gte": ["created_at", "2025-06-01"]}, {"in": ["id", [1, 2]]}]}
+
+Leaf operators take a ``[field, value]`` pair, logic operators take a list
+of operations. ``elem_match`` takes a field and a list of operations on the
+fields of the array elements::
+
+    {"elem_match": ["items", [{"eq": ["sku", "A1"]}, {"gte": ["qty", 2]}]]}
+"""
+
+from typing import Annotated, Any, TypedDict, Union, cast
+
+from pydantic import (
+    AfterValidator,
+    ConfigDict,
+    Discriminator,
+    Field,
+    Tag,
+    TypeAdapter,
+)
+
+from charter._ops import (
+    ContainsData,
+    LogicOperatorNode,
+    LogicOperators,
+    Operation,
+    OperatorNode,
+    Operators,
+    _check_operator_value,
+)
+
+type _Field = Annotated[str, Field(min_length=1)]
+
+_VALUE_TYPES: dict[Operators, Any] = {
+    Operators.EQ: tuple[_Field, Any],
+    Operators.NEQ: tuple[_Field, Any],
+    Operators.IN: tuple[_Field, Annotated[list[Any], Field(min_length=1)]],
+    Operators.GT: tuple[_Field, Any],
+    Operators.GTE: tuple[_Field, Any],
+    Operators.LT: tuple[_Field, Any],
+    Operators.LTE: tuple[_Field, Any],
+    Operators.CONTAINS: tuple[
+        _Field, Annotated[str, Field(min_length=1)] | ContainsData
+    ],
+    Operators.REGEX: tuple[_Field, str],
+    Operators.ANY: tuple[_Field, Annotated[list[Any], Field(min_length=1)]],
+    Operators.ALL: tuple[_Field, Annotated[list[Any], Field(min_length=1)]],
+    Operators.ELEM_MATCH: tuple[
+        _Field, Annotated[list["JsonOperation"], Field(min_length=1)]
+    ],
+}
+
+
+def _operation_tag(value: Any) -> str | None:
+    """Pick the union member by the single key of the JSON object."""
+    if isinstance(value, dict) and len(value) == 1:
+        return cast(str, next(iter(value)))
+    return None
+
+
+def _typed_dict(name: str, key: str, value_type: Any) -> type:
+    schema = TypedDict(name, {key: value_type})  # type: ignore[misc]
+    schema.__pydantic_config__ = ConfigDict(extra="forbid")  # type: ignore[attr-defined]
+    return schema
+
+
+def _operator_member(operator: Operators) -> Any:
+    def build(data: dict[str, tuple[str, Any]]) -> OperatorNode:
+        field, value = data[operator.value]
+        return OperatorNode(operator, field, _check_operator_value(operator, value))
+
+    schema = _typed_dict(
+        f"{operator.name.title()}Json", operator.value, _VALUE_TYPES[operator]
+    )
+    return Annotated[schema, AfterValidator(build), Tag(operator.value)]
+
+
+def _logic_member(operator: LogicOperators) -> Any:
+    def build(data: dict[str, list[Operation]]) -> LogicOperatorNode:
+        return LogicOperatorNode(operator, data[operator.value])
+
+    schema = _typed_dict(
+        f"{operator.name.title()}Json",
+        operator.value,
+        Annotated[list["JsonOperation"], Field(min_length=1)],
+    )
+    return Annotated[schema, AfterValidator(build), Tag(operator.value)]
+
+
+_MEMBERS = tuple(
+    [_operator_member(op) for op in Operators]
+    + [_logic_member(op) for op in LogicOperators]
+)
+
+type JsonOperation = Annotated[
+    Union[_MEMBERS],  # type: ignore[valid-type]  # noqa: UP007
+    Discriminator(_operation_tag),
+]
+
+_adapter: TypeAdapter[Operation | list[Operation]] = TypeAdapter(
+    Annotated[
+        Annotated[JsonOperation, Tag("operation")]
+        | Annotated[list[JsonOperation], Tag("list")],
+        Discriminator(lambda value: "list" if isinstance(value, list) else "operation"),
+    ],
+    config=ConfigDict(title="Filter"),
+)
+
+
+def from_json(data: str | bytes | bytearray) -> list[Operation]:
+    """Validate operations straight from a JSON document.
+
+    The document is either a single operation or a list of them. Parsing and
+    validation both happen in pydantic-core, without an intermediate
+    ``json.loads`` result. Since the document is validated here, the result
+    is built from the unvalidated :class:`OperatorNode` and
+    :class:`LogicOperatorNode` types.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Operations ready to pass to ``Backend.transform``
+
+    Raises:
+        pydantic.ValidationError: If the document is not a valid filter
+    """
+    result = _adapter.validate_json(data)
+    if isinstance(result, list):
+        return result
+    return [result]
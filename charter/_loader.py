@@ -0,0 +1,208 @@
+"""Coalescing of concurrent point lookups into batched ``in`` queries.
+
+Coroutines that each look up rows by key, such as ``p.eq("id", x)``, cost a
+round trip apiece. :class:`BatchLoader` collects the ``eq`` and ``in``
+lookups on the same field made within one event loop iteration (or a short
+window), runs a single ``in`` query for all their keys and hands every
+caller the rows matching its own lookup.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Sequence
+from typing import Any, cast
+
+from charter._backends.python import Accessor, _get_auto
+from charter._ops import (
+    Operation,
+    OperationType,
+    Operator,
+    OperatorNode,
+    Operators,
+    Param,
+)
+
+type Fetch[T] = Callable[[list[Operation]], Awaitable[Iterable[T]]]
+
+
+class _Batch:
+    """Keys requested on one field and the lookups waiting for them."""
+
+    __slots__ = ("keys", "waiters", "handle")
+
+    def __init__(self) -> None:
+        self.keys: dict[Hashable, None] = {}
+        self.waiters: list[tuple[tuple[Hashable, ...], asyncio.Future[Any]]] = []
+        self.handle: asyncio.TimerHandle | asyncio.Handle | None = None
+
+
+class BatchLoader[T]:
+    """Merges concurrent ``eq``/``in`` lookups on a field into one query.
+
+    A loader belongs to the event loop it is first used on; create one per
+    request scope when rows must not be shared between callers.
+
+    Example:
+        >>> async def fetch(operations):
+        ...     stmt = sa.select(User).where(backend.transform(operations))
+        ...     return (await session.scalars(stmt)).all()
+        >>> users = BatchLoader(fetch, accessor="attribute")
+        >>> [user] = await users.load(p.eq("id", 42))
+    """
+
+    def __init__(
+        self,
+        fetch: Fetch[T],
+        *,
+        accessor: Accessor | Callable[[T, str], Any] = "auto",
+        window: float = 0.0,
+        max_batch_size: int = 1000,
+    ) -> None:
+        """Initialize the loader.
+
+        Args:
+            fetch: Coroutine function running the operations through a
+                backend and returning the matching rows
+            accessor: How the looked up field is read from rows: ``"item"``
+                for mappings, ``"attribute"`` for objects, ``"auto"`` to pick
+                per row, or a function of the row and the field name
+            window: Seconds to wait for more lookups before querying; ``0``
+                waits for the current event loop iteration only
+            max_batch_size: Maximum number of keys in one ``in`` query. A
+                full batch is queried right away.
+        """
+        if window < 0:
+            raise ValueError("window must not be negative")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.fetch = fetch
+        self.accessor = accessor
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._get = _accessor(accessor)
+        self._batches: dict[str, _Batch] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, operation: Operation) -> list[T]:
+        """Load the rows matching an operation.
+
+        ``eq`` and ``in`` on a field are batched with the other lookups on
+        that field; any other operation, or a key that is ``None`` or not
+        hashable, is fetched on its own.
+
+        Args:
+            operation: Lookup to run
+
+        Returns:
+            Matching rows, in the order ``fetch`` returned them
+        """
+        keys = _lookup_keys(operation)
+        if keys is None:
+            return list(await self.fetch([operation]))
+        if not keys:
+            return []
+
+        field = cast(Operator, operation).field
+        future: asyncio.Future[list[T]] = asyncio.get_running_loop().create_future()
+        batch = self._batches.get(field)
+        if batch is None:
+            batch = self._batches[field] = _Batch()
+            batch.handle = self._schedule(field)
+        batch.keys.update(dict.fromkeys(keys))
+        batch.waiters.append((keys, future))
+        if len(batch.keys) >= self.max_batch_size:
+            self._dispatch(field)
+        return await future
+
+    def _schedule(self, field: str) -> asyncio.TimerHandle | asyncio.Handle:
+        loop = asyncio.get_running_loop()
+        if self.window:
+            return loop.call_later(self.window, self._dispatch, field)
+        return loop.call_soon(self._dispatch, field)
+
+    def _dispatch(self, field: str) -> None:
+        batch = self._batches.pop(field, None)
+        if batch is None:
+            return
+        if batch.handle is not None:
+            batch.handle.cancel()
+        task = asyncio.ensure_future(self._run(field, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, field: str, batch: _Batch) -> None:
+        try:
+            rows = await self.fetch(
+                [OperatorNode(Operators.IN, field, list(batch.keys))]
+            )
+            keyed = [(self._get(row, field), row) for row in rows]
+        except asyncio.CancelledError:
+            for _, future in batch.waiters:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch.waiters:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_key: dict[Hashable, list[T]] = {}
+        for key, row in keyed:
+            try:
+                by_key.setdefault(key, []).append(row)
+            except TypeError:
+                continue
+        for keys, future in batch.waiters:
+            if future.done():
+                continue
+            if len(keys) == 1:
+                future.set_result(list(by_key.get(keys[0], ())))
+            else:
+                wanted = set(keys)
+                future.set_result(
+                    [row for key, row in keyed if _is_hashable(key) and key in wanted]
+                )
+
+
+def _accessor(
+    accessor: Accessor | Callable[[Any, str], Any],
+) -> Callable[[Any, str], Any]:
+    if callable(accessor):
+        return accessor
+    match accessor:
+        case "auto":
+            return _get_auto
+        case "item":
+            return lambda row, field: row.get(field)
+        case "attribute":
+            return lambda row, field: getattr(row, field, None)
+        case _:
+            raise ValueError(f"Unknown accessor: {accessor}")
+
+
+def _lookup_keys(operation: Operation) -> tuple[Hashable, ...] | None:
+    """Return the distinct keys of an ``eq``/``in`` lookup, ``None`` otherwise."""
+    if operation.operation_type is not OperationType.OPERATOR:
+        return None
+    op = cast(Operator, operation)
+    if op.operator == Operators.EQ:
+        values: Sequence[Any] = [op.value]
+    elif op.operator == Operators.IN and isinstance(op.value, Sequence):
+        values = op.value
+    else:
+        return None
+
+    try:
+        keys = tuple(dict.fromkeys(values))
+    except TypeError:
+        return None
+    if any(key is None or isinstance(key, Param) for key in keys):
+        return None
+    return keys
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
@@ -1,8 +1,19 @@
-from collections.abc import Sequence
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, Sequence
+from collections.abc import Set as AbstractSet
 from enum import Enum, StrEnum
-from typing import Any, Literal, Self
+from typing import Annotated, Any, ClassVar, Literal, cast
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    GetCoreSchemaHandler,
+    PrivateAttr,
+    ValidationInfo,
+    field_validator,
+)
+from pydantic_core import CoreSchema, core_schema
+
+from charter._exc import UnsupportedOperationError
 
 
 class OperationType(Enum):
@@ -22,6 +33,9 @@ class Operators(StrEnum):
     LTE = "lte"
     CONTAINS = "contains"
     REGEX = "regex"
+    ANY = "any"
+    ALL = "all"
+    ELEM_MATCH = "elem_match"
 
 
 class LogicOperators(StrEnum):
@@ -33,13 +47,71 @@ class LogicOperators(StrEnum):
 ALL_OPERATORS = {op.value for op in Operators}
 ALL_LOGIC_OPERATORS = {op.value for op in LogicOperators}
 
+# Operators whose value is a list of values, or a ``Param`` bound to one.
+SEQUENCE_OPERATORS = frozenset({Operators.IN, Operators.ANY, Operators.ALL})
+
+
+class Param(BaseModel, frozen=True):
+    """Placeholder for a value that is bound after transformation.
+
+    Example:
+        >>> p.gte("age", Param("min_age"))
+    """
+
+    name: str = Field(min_length=1)
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name=name)
+
 
 class ContainsData(BaseModel):
-    value: str = Field(min_length=1)
+    value: Annotated[str, Field(min_length=1)] | Param
     ignore_case: bool = False
 
 
-class Operator(BaseModel):
+def _check_operator_value(operator: Operators, value: Any) -> Any:
+    """Validate ``value`` against ``operator`` and return its normalized form."""
+    if operator in SEQUENCE_OPERATORS and not isinstance(value, Param):
+        if isinstance(value, str) or not isinstance(value, Sequence):
+            raise TypeError(
+                f"Operator '{operator.value}' requires a sequence value, got {value}"
+            )
+        if len(value) == 0:
+            raise ValueError(
+                f"Operator '{operator.value}' requires a non-empty sequence"
+            )
+
+    if operator == Operators.CONTAINS and not isinstance(value, ContainsData):
+        if not isinstance(value, str | Param):
+            raise TypeError(
+                f"Operator '{operator.value}' requires a"
+                f" ContainsData, Param or string value, got {value}"
+            )
+        else:
+            value = ContainsData(value=value)
+
+    if operator == Operators.ELEM_MATCH:
+        if getattr(value, "operation_type", None) in OperationType:
+            value = [value]
+        if (
+            isinstance(value, str)
+            or not isinstance(value, Sequence)
+            or any(
+                getattr(item, "operation_type", None) not in OperationType
+                for item in value
+            )
+        ):
+            raise TypeError(
+                f"Operator '{operator.value}' requires operations, got {value}"
+            )
+        if len(value) == 0:
+            raise ValueError(f"Operator '{operator.value}' requires an operation")
+        value = tuple(validate_operation(operation) for operation in value)
+
+    return value
+
+
+class Operator(BaseModel, frozen=True):
     operator: Operators
     field: str = Field(min_length=1)
     value: Any
@@ -48,34 +120,23 @@ class Operator(BaseModel):
         OperationType.OPERATOR, init=False
     )
 
-    @model_validator(mode="after")
-    def _validate_value(self) -> Self:
-        if self.operator == Operators.IN:
-            if isinstance(self.value, str) or not isinstance(self.value, Sequence):
-                raise TypeError(
-                    f"Operator '{self.operator.value}' requires a sequence value, "
-                    f"got {self.value}"
-                )
-            if len(self.value) == 0:
-                raise ValueError(
-                    f"Operator '{self.operator.value}' requires a non-empty sequence"
-                )
-
-        if self.operator == Operators.CONTAINS and not isinstance(
-            self.value, ContainsData
-        ):
-            if not isinstance(self.value, str):
-                raise TypeError(
-                    f"Operator '{self.operator.value}' requires a"
-                    f" ContainsData or string value, got {self.value}"
-                )
-            else:
-                self.value = ContainsData(value=self.value)
+    _hash: int | None = PrivateAttr(None)
+
+    @field_validator("value")
+    @classmethod
+    def _validate_value(cls, value: Any, info: ValidationInfo) -> Any:
+        if "operator" not in info.data:
+            return value
+        return _check_operator_value(info.data["operator"], value)
 
-        return self
+    def __hash__(self) -> int:
+        return operation_hash(self)
 
+    def __eq__(self, other: object) -> bool:
+        return operations_equal(self, other)
 
-class LogicOperator(BaseModel):
+
+class LogicOperator(BaseModel, frozen=True):
     operator: LogicOperators
     operations: Sequence["Operation"] = Field(min_length=1)
 
@@ -83,5 +144,462 @@ class LogicOperator(BaseModel):
         OperationType.LOGIC, init=False
     )
 
+    _hash: int | None = PrivateAttr(None)
+
+    @field_validator("operations")
+    @classmethod
+    def _freeze_operations(cls, operations: Sequence["Operation"]) -> Sequence[Any]:
+        return tuple(operations)
+
+    def __hash__(self) -> int:
+        return operation_hash(self)
+
+    def __eq__(self, other: object) -> bool:
+        return operations_equal(self, other)
+
+
+def _immutable_setattr(self: Any, name: str, value: Any) -> None:
+    # The hash is computed lazily and cached once known.
+    if name == "_hash":
+        object.__setattr__(self, name, value)
+        return
+    raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+def _immutable_delattr(self: Any, name: str) -> None:
+    raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+class OperatorNode:
+    """Slotted, unvalidated counterpart of :class:`Operator`.
+
+    Construction performs no checks; pass the node through
+    :func:`validate_operation` when it comes from an untrusted source.
+    """
+
+    __slots__ = ("operator", "field", "value", "_hash")
+
+    operation_type: ClassVar[Literal[OperationType.OPERATOR]] = OperationType.OPERATOR
+
+    operator: Operators
+    field: str
+    value: Any
+    _hash: int | None
+
+    def __init__(self, operator: Operators, field: str, value: Any) -> None:
+        _set_operator(self, operator)
+        _set_field(self, field)
+        _set_value(self, value)
+        _set_hash(self, None)
+
+    __setattr__ = _immutable_setattr
+    __delattr__ = _immutable_delattr
+
+    def __hash__(self) -> int:
+        return operation_hash(self)
+
+    def __eq__(self, other: object) -> bool:
+        return operations_equal(self, other)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (self.operator, self.field, self.value))
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(operator={self.operator!r},"
+            f" field={self.field!r}, value={self.value!r})"
+        )
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        return core_schema.is_instance_schema(cls)
+
+
+class LogicOperatorNode:
+    """Slotted, unvalidated counterpart of :class:`LogicOperator`."""
+
+    __slots__ = ("operator", "operations", "_hash")
+
+    operation_type: ClassVar[Literal[OperationType.LOGIC]] = OperationType.LOGIC
+
+    operator: LogicOperators
+    operations: Sequence["Operation"]
+    _hash: int | None
+
+    def __init__(
+        self, operator: LogicOperators, operations: Sequence["Operation"]
+    ) -> None:
+        _set_logic_operator(self, operator)
+        _set_operations(self, tuple(operations))
+        _set_logic_hash(self, None)
+
+    __setattr__ = _immutable_setattr
+    __delattr__ = _immutable_delattr
+
+    def __hash__(self) -> int:
+        return operation_hash(self)
+
+    def __eq__(self, other: object) -> bool:
+        return operations_equal(self, other)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (self.operator, self.operations))
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(operator={self.operator!r},"
+            f" operations={self.operations!r})"
+        )
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        return core_schema.is_instance_schema(cls)
+
+
+type Operation = Operator | LogicOperator | OperatorNode | LogicOperatorNode
+
+
+def _slot_setters(cls: type, *names: str) -> list[Callable[[Any, Any], None]]:
+    return [getattr(cls, name).__set__ for name in names]
+
+
+# Nodes fill their slots through the descriptors, bypassing ``__setattr__``.
+_set_operator, _set_field, _set_value, _set_hash = _slot_setters(
+    OperatorNode, "operator", "field", "value", "_hash"
+)
+_set_logic_operator, _set_operations, _set_logic_hash = _slot_setters(
+    LogicOperatorNode, "operator", "operations", "_hash"
+)
+
+
+def fold_operations[T](
+    operations: Iterable["Operation"],
+    leaf: Callable[["Operator"], T],
+    logic: Callable[["LogicOperator", list[T]], T],
+) -> list[T]:
+    """Fold operation trees bottom-up, keeping pending nodes on an explicit stack.
 
-type Operation = Operator | LogicOperator
+    ``leaf`` is called for every operator, and ``logic`` for every logic
+    operator with the results of its operations, in order, once they are
+    all known. Trees of any depth are folded in time linear in their size,
+    without recursion.
+
+    Args:
+        operations: Roots of the trees to fold
+        leaf: Builds the result of an operator
+        logic: Combines the results of a logic operator's operations
+
+    Returns:
+        Result for each of ``operations``, in order
+
+    Raises:
+        UnsupportedOperationError: If an operation has an unknown type or
+            logic operator
+    """
+    results: list[T] = []
+    stack: list[tuple[LogicOperator, Iterator[Operation], list[T]]] = []
+    pending = iter(operations)
+
+    while True:
+        for operation in pending:
+            operation_type = getattr(operation, "operation_type", None)
+            match operation_type:
+                case OperationType.OPERATOR:
+                    results.append(leaf(cast(Operator, operation)))
+                case OperationType.LOGIC:
+                    logic_op = cast(LogicOperator, operation)
+                    _check_logic_operator(logic_op)
+                    stack.append((logic_op, pending, results))
+                    pending, results = iter(logic_op.operations), []
+                    break
+                case _:
+                    raise UnsupportedOperationError(
+                        f"Unsupported operation type: {operation_type}"
+                    )
+        else:
+            if not stack:
+                return results
+            logic_op, pending, parent = stack.pop()
+            parent.append(logic(logic_op, results))
+            results = parent
+
+
+def fold_logic_operator[T](
+    operation: "LogicOperator",
+    leaf: Callable[["Operator"], T],
+    logic: Callable[["LogicOperator", list[T]], T],
+) -> T:
+    """Fold a single logic operator, see :func:`fold_operations`."""
+    _check_logic_operator(operation)
+    return logic(operation, fold_operations(operation.operations, leaf, logic))
+
+
+def _check_logic_operator(operation: "LogicOperator") -> None:
+    if operation.operator not in ALL_LOGIC_OPERATORS:
+        raise UnsupportedOperationError(
+            f"Unsupported logic operator: {operation.operator}"
+        )
+
+
+def validate_operation(operation: Operation) -> Operation:
+    """Run the :class:`Operator`/:class:`LogicOperator` checks on a node tree.
+
+    Pydantic models are returned as is, since they were validated on
+    construction. Nodes are checked and returned with their values
+    normalized (e.g. a ``contains`` string becomes ``ContainsData``).
+
+    Raises:
+        TypeError: If a value has the wrong type for its operator
+        ValueError: If a field, value or operand list is empty
+        UnsupportedOperationError: If a node has an unknown operation type
+            or logic operator
+    """
+    (result,) = fold_operations(
+        [operation], _validate_operator, _validate_logic_operator
+    )
+    return result
+
+
+def _validate_operator(operation: Operator) -> Operation:
+    if isinstance(operation, Operator):
+        return operation
+
+    operator = Operators(operation.operator)
+    if not isinstance(operation.field, str) or not operation.field:
+        raise ValueError(
+            f"Operator '{operator.value}' requires a non-empty field name,"
+            f" got {operation.field!r}"
+        )
+    return OperatorNode(
+        operator,
+        operation.field,
+        _check_operator_value(operator, operation.value),
+    )
+
+
+def _validate_logic_operator(
+    operation: LogicOperator, operations: list[Operation]
+) -> Operation:
+    if isinstance(operation, LogicOperator):
+        return operation
+
+    logic_operator = LogicOperators(operation.operator)
+    if not operations:
+        raise ValueError(
+            f"Logic operator '{logic_operator.value}' requires at least one operation"
+        )
+    return LogicOperatorNode(logic_operator, operations)
+
+
+_SCALAR_TYPES = frozenset({int, float, bool, str, bytes, type(None)})
+
+
+def structural_key(operation: Operation) -> Hashable:
+    """Build a hashable key describing the structure and values of an operation.
+
+    Two operations get equal keys only if every node has the same type,
+    operator, field and value, so the key can stand in for the tree in
+    caches. Scalar values are tagged with their type to keep ``1``, ``1.0``
+    and ``True`` apart. The key is a flat tuple listing the nodes in
+    post-order, so hashing and comparing it never recurses, however deep
+    the tree.
+
+    Raises:
+        TypeError: If the tree holds a value that cannot be hashed
+    """
+    key: list[Hashable] = []
+
+    def leaf(op: Operator) -> None:
+        key.append(
+            (OperationType.OPERATOR, op.operator, op.field, _freeze_value(op.value))
+        )
+
+    def logic(op: LogicOperator, operations: list[None]) -> None:
+        key.append((OperationType.LOGIC, op.operator, len(operations)))
+
+    try:
+        fold_operations([operation], leaf, logic)
+    except UnsupportedOperationError as e:
+        raise TypeError(str(e)) from e
+    return tuple(key)
+
+
+def _freeze_value(value: Any) -> Hashable:
+    if type(value) in _SCALAR_TYPES:
+        return (type(value), value)
+
+    match value:
+        case ContainsData():
+            return (ContainsData, value.value, value.ignore_case)
+        case Operator() | OperatorNode() | LogicOperator() | LogicOperatorNode():
+            return (OperationType, structural_key(value))
+        case str() | bytes():
+            return (type(value), value)
+        case Mapping():
+            return (
+                type(value),
+                tuple((_freeze_value(k), _freeze_value(v)) for k, v in value.items()),
+            )
+        case AbstractSet():
+            return (type(value), frozenset(_freeze_value(item) for item in value))
+        case Sequence():
+            return (type(value), tuple(_freeze_value(item) for item in value))
+        case _:
+            hash(value)
+            return (type(value), value)
+
+
+def operation_hash(operation: Operation) -> int:
+    """Hash the structure and values of an operation.
+
+    Operations equal by :func:`operations_equal` hash alike. The hash of
+    every node is computed once and cached on it, so rehashing a tree, or a
+    tree built from already hashed subtrees, only visits the new nodes.
+
+    Raises:
+        TypeError: If the tree holds a value that cannot be hashed
+    """
+    if operation._hash is not None:
+        return operation._hash
+
+    stack: list[tuple[Operation, bool]] = [(operation, False)]
+    while stack:
+        node, children_hashed = stack.pop()
+        if node._hash is not None:
+            continue
+        if node.operation_type is OperationType.OPERATOR:
+            leaf = cast(Operator, node)
+            key: Hashable = (
+                OperationType.OPERATOR,
+                leaf.operator,
+                leaf.field,
+                _freeze_value(leaf.value),
+            )
+        elif children_hashed:
+            logic = cast(LogicOperator, node)
+            key = (
+                OperationType.LOGIC,
+                logic.operator,
+                tuple(child._hash for child in logic.operations),
+            )
+        else:
+            stack.append((node, True))
+            stack.extend(
+                (child, False) for child in cast(LogicOperator, node).operations
+            )
+            continue
+        # The models are frozen to type checkers; the cache is private state.
+        setattr(node, "_hash", hash(key))  # noqa: B010
+    return cast(int, operation._hash)
+
+
+def operations_equal(first: Operation, second: object) -> bool:
+    """Compare the structure and values of two operations.
+
+    Models and nodes with the same content are equal, and values are told
+    apart by type like in :func:`structural_key`. Identical subtrees are
+    skipped, so comparing trees that share them, such as interned ones, is
+    cheap. The trees are walked without recursion.
+    """
+    if first is second:
+        return True
+    if getattr(second, "operation_type", None) not in OperationType:
+        return False
+
+    stack: list[tuple[Any, Any]] = [(first, second)]
+    while stack:
+        a, b = stack.pop()
+        if a is b:
+            continue
+        if a.operation_type is not b.operation_type or a.operator != b.operator:
+            return False
+        try:
+            if operation_hash(a) != operation_hash(b):
+                return False
+        except TypeError:
+            pass
+
+        if a.operation_type is OperationType.OPERATOR:
+            if a.field != b.field or not _values_equal(a.value, b.value):
+                return False
+        elif len(a.operations) != len(b.operations):
+            return False
+        else:
+            stack.extend(zip(a.operations, b.operations, strict=True))
+    return True
+
+
+def _values_equal(first: Any, second: Any) -> bool:
+    try:
+        return bool(_freeze_value(first) == _freeze_value(second))
+    except TypeError:
+        return type(first) is type(second) and bool(first == second)
+
+
+class Interner:
+    """Table of shared operation nodes (hash consing).
+
+    Interning a tree returns an equal tree in which every subtree equal to
+    one interned before is that very object. Repeated sub-predicates are
+    then stored once, and trees built from the table compare by identity.
+    Values must not be mutated once interned. Operations holding unhashable
+    values are returned as is.
+
+    Example:
+        >>> interner = Interner()
+        >>> p = Predicate(interner=interner)
+        >>> p.eq("tenant_id", 7) is p.eq("tenant_id", 7)
+        True
+    """
+
+    def __init__(self) -> None:
+        self._nodes: dict[Operation, Operation] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def intern(self, operation: Operation) -> Operation:
+        """Return the shared operation equal to ``operation``.
+
+        Args:
+            operation: Operation to intern, with its subtrees
+
+        Returns:
+            Equal operation from the table; untouched nodes are added to it
+            as they are
+        """
+        if self._is_interned(operation):
+            return operation
+        (result,) = fold_operations([operation], self._intern_node, self._intern_logic)
+        return result
+
+    def clear(self) -> None:
+        """Drop all interned operations."""
+        self._nodes.clear()
+
+    def _is_interned(self, operation: Operation) -> bool:
+        try:
+            return self._nodes.get(operation) is operation
+        except TypeError:
+            return False
+
+    def _intern_node(self, operation: Operation) -> Operation:
+        """Intern an operation whose operations are interned already."""
+        try:
+            return self._nodes.setdefault(operation, operation)
+        except TypeError:
+            return operation
+
+    def _intern_logic(
+        self, operation: LogicOperator, operations: list[Operation]
+    ) -> Operation:
+        if any(
+            new is not old
+            for new, old in zip(operations, operation.operations, strict=True)
+        ):
+            return self._intern_node(LogicOperatorNode(operation.operator, operations))
+        return self._intern_node(operation)
@@ -0,0 +1,368 @@
+"""Backend-independent rewrites of operation trees.
+
+:func:`optimize` returns an equivalent, usually smaller tree, so every
+backend gets shallower criteria: nested ``and``/``or`` chains such as the
+ones built by repeated ``Predicate.and_`` calls become a single flat node.
+"""
+
+import datetime
+from collections.abc import Callable, Collection, Hashable, Sequence
+from decimal import Decimal
+from typing import Any, Literal, NamedTuple, cast
+
+from charter._ops import (
+    LogicOperator,
+    LogicOperatorNode,
+    LogicOperators,
+    Operation,
+    OperationType,
+    Operator,
+    OperatorNode,
+    Operators,
+    Param,
+    _freeze_value,
+    fold_operations,
+)
+
+_LOWER_BOUNDS = {Operators.GT, Operators.GTE}
+_UPPER_BOUNDS = {Operators.LT, Operators.LTE}
+# Values whose order is the same in Python and in every database.
+_ORDERED_TYPES = (int, float, Decimal, datetime.date)
+
+# Operator satisfied exactly where the key is not, among non-null values.
+_INVERSES = {
+    Operators.EQ: Operators.NEQ,
+    Operators.NEQ: Operators.EQ,
+    Operators.GT: Operators.LTE,
+    Operators.GTE: Operators.LT,
+    Operators.LT: Operators.GTE,
+    Operators.LTE: Operators.GT,
+}
+
+type NullSemantics = Literal["sql", "boolean", "mongo"]
+
+
+class _Node(NamedTuple):
+    """An optimized operation with its interned structural key."""
+
+    operation: Operation
+    key: Hashable
+    # Optimized operations of a logic operator, ``None`` for an operator.
+    operations: list["_Node"] | None
+
+
+def optimize(operations: Sequence[Operation]) -> list[Operation]:
+    """Rewrite operations into an equivalent, flatter form.
+
+    The top-level sequence is treated as an implicit ``and``. The rewrites
+    are:
+
+    - nested ``and`` in ``and`` (or ``not``) and ``or`` in ``or`` are
+      flattened into their parent
+    - duplicate siblings are removed
+    - ``eq``/``in`` siblings of an ``or`` on the same field are merged
+      into one ``in``
+    - ``gt``/``gte`` and ``lt``/``lte`` siblings of an ``and`` on the same
+      field are reduced to the tightest lower and upper bound, placed next
+      to each other, for numbers, dates and datetimes; strings are ordered
+      by the database's collation and are left alone
+    - ``and`` and ``or`` with a single operation are replaced by it
+
+    Rewritten nodes are built as :class:`OperatorNode` and
+    :class:`LogicOperatorNode`; untouched leaves are returned as is.
+    ``Param`` values and ``None`` are never merged. The tree is walked
+    without recursion, in time linear in its size.
+
+    Args:
+        operations: Operations to optimize
+
+    Returns:
+        Optimized operations
+    """
+    optimizer = _Optimizer()
+    nodes = fold_operations(operations, optimizer.leaf, optimizer.logic)
+    return [node.operation for node in optimizer.simplify(LogicOperators.AND, nodes)]
+
+
+class _Optimizer:
+    def __init__(self) -> None:
+        # Maps the shallow key of a node, whose operations are given by
+        # their own interned keys, to a small integer. Equal subtrees get
+        # equal keys without hashing whole subtrees at every level.
+        self.keys: dict[Hashable, int] = {}
+
+    def leaf(self, op: Operator) -> _Node:
+        return _Node(op, self._leaf_key(op), None)
+
+    def logic(self, op: LogicOperator, nodes: list[_Node]) -> _Node:
+        nodes = self.simplify(op.operator, nodes)
+        if len(nodes) == 1 and op.operator != LogicOperators.NOT:
+            return nodes[0]
+
+        key = self._intern(
+            (OperationType.LOGIC, op.operator, tuple(node.key for node in nodes))
+        )
+        operation = LogicOperatorNode(op.operator, [node.operation for node in nodes])
+        return _Node(operation, key, nodes)
+
+    def simplify(self, operator: LogicOperators, nodes: list[_Node]) -> list[_Node]:
+        # The operations of ``not`` are joined with ``and``.
+        joined_by = (
+            LogicOperators.OR if operator == LogicOperators.OR else LogicOperators.AND
+        )
+
+        flat: list[_Node] = []
+        for node in nodes:
+            if (
+                node.operations is not None
+                and cast(LogicOperator, node.operation).operator == joined_by
+            ):
+                flat.extend(node.operations)
+            else:
+                flat.append(node)
+
+        if joined_by is LogicOperators.OR:
+            return _merge_in(_dedupe(flat), self.leaf)
+        return _merge_ranges(_dedupe(flat))
+
+    def _leaf_key(self, op: Operator) -> Hashable:
+        try:
+            return self._intern(
+                (OperationType.OPERATOR, op.operator, op.field, _freeze_value(op.value))
+            )
+        except TypeError:
+            # Unhashable values are never equal to anything else.
+            return object()
+
+    def _intern(self, key: Hashable) -> int:
+        return self.keys.setdefault(key, len(self.keys))
+
+
+def _dedupe(nodes: list[_Node]) -> list[_Node]:
+    seen: set[Hashable] = set()
+    unique: list[_Node] = []
+    for node in nodes:
+        if node.key not in seen:
+            seen.add(node.key)
+            unique.append(node)
+    return unique
+
+
+def _merge_in(
+    nodes: list[_Node], make_leaf: Callable[[Operator], _Node]
+) -> list[_Node]:
+    """Merge ``eq`` and ``in`` operations on the same field into one ``in``."""
+    groups: dict[str, list[Operator]] = {}
+    for node in nodes:
+        if _is_in_candidate(node.operation):
+            leaf = cast(Operator, node.operation)
+            groups.setdefault(leaf.field, []).append(leaf)
+
+    merged: list[_Node] = []
+    for node in nodes:
+        if not _is_in_candidate(node.operation):
+            merged.append(node)
+            continue
+
+        leaf = cast(Operator, node.operation)
+        group = groups[leaf.field]
+        if len(group) == 1:
+            merged.append(node)
+        elif group[0] is leaf:
+            in_leaf = OperatorNode(Operators.IN, leaf.field, _in_values(group))
+            merged.append(make_leaf(cast(Operator, in_leaf)))
+    return merged
+
+
+def _is_in_candidate(op: Operation) -> bool:
+    if op.operation_type is not OperationType.OPERATOR:
+        return False
+    leaf = cast(Operator, op)
+    if leaf.operator == Operators.EQ:
+        return leaf.value is not None and not isinstance(leaf.value, Param)
+    return leaf.operator == Operators.IN and not isinstance(leaf.value, Param)
+
+
+def _in_values(group: list[Operator]) -> list[Any]:
+    seen: set[Any] = set()
+    values: list[Any] = []
+    for leaf in group:
+        for value in [leaf.value] if leaf.operator == Operators.EQ else leaf.value:
+            try:
+                key = _freeze_value(value)
+            except TypeError:
+                values.append(value)
+                continue
+            if key not in seen:
+                seen.add(key)
+                values.append(value)
+    return values
+
+
+def _merge_ranges(nodes: list[_Node]) -> list[_Node]:
+    """Keep the tightest lower and upper bound per field, next to each other."""
+    bounds: dict[str, tuple[list[_Node], list[_Node]]] = {}
+    for node in nodes:
+        if _is_bound(node.operation):
+            leaf = cast(Operator, node.operation)
+            lower, upper = bounds.setdefault(leaf.field, ([], []))
+            (lower if leaf.operator in _LOWER_BOUNDS else upper).append(node)
+
+    merged: list[_Node] = []
+    for node in nodes:
+        if not _is_bound(node.operation):
+            merged.append(node)
+            continue
+
+        leaf = cast(Operator, node.operation)
+        if leaf.field in bounds:
+            lower, upper = bounds.pop(leaf.field)
+            merged.extend(_tightest(lower, lower=True))
+            merged.extend(_tightest(upper, lower=False))
+    return merged
+
+
+def _is_bound(op: Operation) -> bool:
+    if op.operation_type is not OperationType.OPERATOR:
+        return False
+    leaf = cast(Operator, op)
+    # Strings are left alone: the database orders them by its collation,
+    # which Python's code point order need not match.
+    return (
+        leaf.operator in _LOWER_BOUNDS or leaf.operator in _UPPER_BOUNDS
+    ) and isinstance(leaf.value, _ORDERED_TYPES)
+
+
+def _tightest(group: list[_Node], *, lower: bool) -> list[_Node]:
+    """Pick the most restrictive bound, or keep all if they can't be compared."""
+    leaves = [cast(Operator, node.operation) for node in group]
+    if len(group) < 2 or len({_kind(leaf.value) for leaf in leaves}) > 1:
+        return group
+
+    strict = Operators.GT if lower else Operators.LT
+    best = 0
+    try:
+        for index, leaf in enumerate(leaves[1:], start=1):
+            value = leaves[best].value
+            tighter = leaf.value > value if lower else leaf.value < value
+            if tighter or (leaf.value == value and leaf.operator == strict):
+                best = index
+    except TypeError:
+        return group
+    return [group[best]]
+
+
+def _kind(value: Any) -> type:
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return float
+    return type(value)
+
+
+class _Polarized(NamedTuple):
+    """An operation rewritten as is and negated."""
+
+    positive: Operation
+    negative: Operation
+
+
+def push_down_not(
+    operations: Sequence[Operation],
+    *,
+    null_semantics: NullSemantics,
+    array_fields: Collection[str] = (),
+) -> list[Operation]:
+    """Rewrite operations so that ``not`` only wraps operators it can't invert.
+
+    ``not`` is pushed through ``and`` and ``or`` with De Morgan's laws,
+    double negations cancel out, and negated ``eq``, ``neq``, ``gt``,
+    ``gte``, ``lt`` and ``lte`` become their inverse operator. ``in``,
+    ``contains`` and ``regex`` keep their ``not``, which backends render as
+    ``NOT IN``, ``$nin`` and the like. Index lookups can then be used for
+    every inverted operator.
+
+    Inverting an operator depends on how the backend negates a null field:
+
+    - ``"sql"``: a comparison with null is unknown, and so is its negation;
+      ``not gt(age, 1)`` becomes ``lte(age, 1)``. Use it for
+      :class:`SQLAlchemyBackend`.
+    - ``"boolean"``: ``not`` holds wherever the operation does not, nulls
+      included; ``not gt(age, 1)`` becomes
+      ``or(lte(age, 1), eq(age, None))``. Use it for the Python and NumPy
+      backends.
+    - ``"mongo"``: ``$ne`` already matches null and missing fields, so
+      ``eq`` and ``neq`` are swapped as they are. Range operators keep their
+      ``not``, since MongoDB only compares values of the same type and
+      ``not gt(age, 1)`` also matches an ``age`` that is a string. Use it
+      for :class:`PymongoBackend`.
+
+    ``eq`` and ``neq`` with ``None`` are inverted alike in all of them. The
+    tree is walked without recursion, in time linear in its size.
+
+    An operator matches an array field when any element matches, so
+    ``not gt(tags, 1)`` means "no element is greater than 1" while
+    ``lte(tags, 1)`` means "some element is at most 1". Operators on fields
+    that may hold arrays must therefore keep their ``not`` under ``"sql"``
+    and ``"boolean"``: list those fields in ``array_fields``. The swap of
+    ``eq`` and ``neq`` done under ``"mongo"`` holds on arrays as well.
+
+    Args:
+        operations: Operations to rewrite
+        null_semantics: How the target backend negates null fields
+        array_fields: Fields that may hold arrays, whose operators are never
+            inverted
+
+    Returns:
+        Equivalent operations
+    """
+    if null_semantics not in ("sql", "boolean", "mongo"):
+        raise ValueError(f"Unknown null semantics: {null_semantics}")
+    kept = frozenset(array_fields)
+
+    def leaf(op: Operator) -> _Polarized:
+        if op.field in kept:
+            return _Polarized(op, LogicOperatorNode(LogicOperators.NOT, [op]))
+        return _Polarized(op, _invert(op, null_semantics))
+
+    def logic(op: LogicOperator, polarized: list[_Polarized]) -> _Polarized:
+        positives = [p.positive for p in polarized]
+        negatives = [p.negative for p in polarized]
+        match op.operator:
+            case LogicOperators.AND:
+                return _Polarized(
+                    _join(LogicOperators.AND, positives),
+                    _join(LogicOperators.OR, negatives),
+                )
+            case LogicOperators.OR:
+                return _Polarized(
+                    _join(LogicOperators.OR, positives),
+                    _join(LogicOperators.AND, negatives),
+                )
+            case _:
+                return _Polarized(
+                    _join(LogicOperators.OR, negatives),
+                    _join(LogicOperators.AND, positives),
+                )
+
+    return [p.positive for p in fold_operations(operations, leaf, logic)]
+
+
+def _invert(op: Operator, null_semantics: NullSemantics) -> Operation:
+    inverse = _INVERSES.get(op.operator)
+    equality = op.operator in (Operators.EQ, Operators.NEQ)
+    if inverse is None or (null_semantics == "mongo" and not equality):
+        return LogicOperatorNode(LogicOperators.NOT, [op])
+
+    inverted = OperatorNode(inverse, op.field, op.value)
+    if null_semantics != "boolean" or op.value is None:
+        return inverted
+    # These never hold on a null field, so under boolean semantics their
+    # negation does.
+    return LogicOperatorNode(
+        LogicOperators.OR, [inverted, OperatorNode(Operators.EQ, op.field, None)]
+    )
+
+
+def _join(operator: LogicOperators, operations: list[Operation]) -> Operation:
+    if len(operations) == 1:
+        return operations[0]
+    return LogicOperatorNode(operator, operations)
@@ -0,0 +1,234 @@
+"""Keyset (seek) pagination.
+
+Instead of skipping ``offset`` rows, the next page is selected by comparing
+the sort keys with the values of the last row of the previous page::
+
+    (a > x) OR (a = x AND b > y)
+
+which an index on the sort keys answers without reading the skipped rows.
+The predicate is built from operations, so it combines with any filter and
+transforms through every backend.
+"""
+
+import base64
+import binascii
+import datetime
+import json
+import uuid
+from collections.abc import Sequence
+from decimal import Decimal
+from typing import Any, NamedTuple
+
+from charter._exc import ParseError
+from charter._ops import (
+    LogicOperatorNode,
+    LogicOperators,
+    Operation,
+    OperatorNode,
+    Operators,
+)
+
+
+class SortKey(NamedTuple):
+    """Field of a sort order and its direction."""
+
+    field: str
+    descending: bool = False
+
+
+class Keyset:
+    """Sort order for keyset pagination, with cursor tokens for its values.
+
+    The sort keys must not be null, and together they must be unique, which
+    usually means ending them with the primary key.
+
+    Example:
+        >>> keyset = Keyset("-created_at", "id")
+        >>> operations = keyset.filter(operations, request.cursor)
+        >>> ...
+        >>> next_cursor = keyset.encode([last.created_at, last.id])
+    """
+
+    keys: tuple[SortKey, ...]
+
+    def __init__(self, *keys: str | SortKey) -> None:
+        """Initialize the sort order.
+
+        Args:
+            keys: Sort keys, most significant first. A field name prefixed
+                with ``-`` sorts in descending order.
+        """
+        if not keys:
+            raise ValueError("Keyset requires at least one sort key")
+        self.keys = tuple(_sort_key(key) for key in keys)
+
+    def after(self, values: Sequence[Any]) -> Operation:
+        """Build the predicate selecting the rows after ``values``.
+
+        The expanded form is preceded by a bound on the first key, so a
+        planner without row-value comparisons still gets an index range.
+
+        Args:
+            values: Values of the sort keys in the last row of a page
+
+        Returns:
+            Seek predicate
+        """
+        self._check_values(values)
+
+        branches: list[Operation] = []
+        for index, (key, value) in enumerate(zip(self.keys, values, strict=True)):
+            equal: list[Operation] = [
+                OperatorNode(Operators.EQ, prior.field, prior_value)
+                for prior, prior_value in zip(self.keys[:index], values, strict=False)
+            ]
+            seek = OperatorNode(
+                Operators.LT if key.descending else Operators.GT, key.field, value
+            )
+            if equal:
+                branches.append(LogicOperatorNode(LogicOperators.AND, [*equal, seek]))
+            else:
+                branches.append(seek)
+
+        if len(branches) == 1:
+            return branches[0]
+
+        first = self.keys[0]
+        bound = OperatorNode(
+            Operators.LTE if first.descending else Operators.GTE, first.field, values[0]
+        )
+        return LogicOperatorNode(
+            LogicOperators.AND, [bound, LogicOperatorNode(LogicOperators.OR, branches)]
+        )
+
+    def filter(
+        self, operations: Sequence[Operation], cursor: str | None
+    ) -> list[Operation]:
+        """Add the seek predicate of ``cursor`` to ``operations``.
+
+        Args:
+            operations: Filter of the listing
+            cursor: Token from :meth:`encode`, ``None`` for the first page
+
+        Returns:
+            Operations selecting the page after ``cursor``
+
+        Raises:
+            ParseError: If the cursor is invalid or was issued for another
+                sort order
+        """
+        if cursor is None:
+            return list(operations)
+        return [*operations, self.after(self.decode(cursor))]
+
+    def encode(self, values: Sequence[Any]) -> str:
+        """Encode the sort key values of a row as an opaque cursor token.
+
+        Tokens are URL-safe but not signed; a client can forge one, which
+        only selects a different page.
+
+        Args:
+            values: Values of the sort keys in the last row of a page.
+                JSON types, ``datetime``, ``date``, ``Decimal``, ``UUID`` and
+                ``bytes`` are supported.
+
+        Returns:
+            Cursor token
+        """
+        self._check_values(values)
+        payload = json.dumps(
+            {"k": self._signature(), "v": [_encode_value(value) for value in values]},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+    def decode(self, cursor: str) -> list[Any]:
+        """Decode a cursor token into sort key values.
+
+        Args:
+            cursor: Token from :meth:`encode`
+
+        Returns:
+            Values of the sort keys
+
+        Raises:
+            ParseError: If the cursor is invalid or was issued for another
+                sort order
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw, object_hook=_decode_value)
+            signature, values = payload["k"], payload["v"]
+        except (
+            binascii.Error,
+            ArithmeticError,
+            ValueError,
+            TypeError,
+            KeyError,
+        ) as e:
+            raise ParseError("Invalid cursor") from e
+
+        if signature != self._signature():
+            raise ParseError("Cursor does not match the sort order")
+        if (
+            not isinstance(values, list)
+            or len(values) != len(self.keys)
+            or None in values
+        ):
+            raise ParseError("Invalid cursor")
+        return values
+
+    def _signature(self) -> list[str]:
+        return [f"-{key.field}" if key.descending else key.field for key in self.keys]
+
+    def _check_values(self, values: Sequence[Any]) -> None:
+        if len(values) != len(self.keys):
+            raise ValueError(
+                f"Expected {len(self.keys)} sort key values, got {len(values)}"
+            )
+        if any(value is None for value in values):
+            raise ValueError("Sort key values must not be None")
+
+
+def _sort_key(key: str | SortKey) -> SortKey:
+    if isinstance(key, SortKey):
+        return key
+    if key.startswith("-"):
+        return SortKey(key[1:], descending=True)
+    return SortKey(key)
+
+
+# Tagged encodings of the values JSON has no type for.
+_TAGS: dict[str, Any] = {
+    "$datetime": datetime.datetime.fromisoformat,
+    "$date": datetime.date.fromisoformat,
+    "$decimal": Decimal,
+    "$uuid": uuid.UUID,
+    "$bytes": base64.b64decode,
+}
+
+
+def _encode_value(value: Any) -> Any:
+    match value:
+        case bool() | int() | float() | str():
+            return value
+        case datetime.datetime():
+            return {"$datetime": value.isoformat()}
+        case datetime.date():
+            return {"$date": value.isoformat()}
+        case Decimal():
+            return {"$decimal": str(value)}
+        case uuid.UUID():
+            return {"$uuid": str(value)}
+        case bytes():
+            return {"$bytes": base64.b64encode(value).decode()}
+        case _:
+            raise TypeError(f"Cursor value of type {type(value)} is not supported")
+
+
+def _decode_value(obj: dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        ((tag, value),) = obj.items()
+        if tag in _TAGS:
+            return _TAGS[tag](value)
+    return obj
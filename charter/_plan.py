@@ -0,0 +1,176 @@
+"""Ordering of operations by the indexes of a table or collection.
+
+Most databases plan a conjunction the same way whatever the order of its
+terms, but backends that evaluate it in order, and the people reading the
+generated queries, benefit from the most selective indexed terms first.
+"""
+
+import warnings
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, Self, cast
+
+from charter._backends.interface import Backend
+from charter._exc import SargabilityWarning
+from charter._ops import (
+    LogicOperator,
+    LogicOperatorNode,
+    LogicOperators,
+    Operation,
+    OperationType,
+    Operator,
+    Operators,
+    fold_operations,
+)
+
+_EQUALITIES = {Operators.EQ, Operators.IN}
+_RANGES = {Operators.GT, Operators.GTE, Operators.LT, Operators.LTE}
+
+# Rank of the operations that stay in place, after the indexed ones.
+_UNINDEXED = 2
+
+
+class IndexPlanner:
+    """Reorders operations for a set of indexes and flags non-sargable ones.
+
+    Within every ``and`` (and the implicit one at the top level), equality
+    on the leading key of an index comes first, then ranges on a leading key
+    and equality on other indexed keys, then everything else, each group
+    keeping its original order.
+
+    Example:
+        >>> planner = IndexPlanner.from_sqlalchemy(User)
+        >>> operations = planner.plan(operations, backend)
+    """
+
+    indexes: tuple[tuple[str, ...], ...]
+
+    def __init__(self, indexes: Iterable[Sequence[str]]) -> None:
+        """Initialize the planner.
+
+        Args:
+            indexes: Fields of each index, in index order
+        """
+        self.indexes = tuple(tuple(keys) for keys in indexes if keys)
+        self.leading_keys = frozenset(keys[0] for keys in self.indexes)
+        self.indexed_keys = frozenset(key for keys in self.indexes for key in keys)
+
+    @classmethod
+    def from_sqlalchemy(cls, entity: Any) -> Self:
+        """Collect the primary key, unique constraints and indexes of a model.
+
+        Columns are named by their mapped attribute. An index expression
+        other than a mapped column ends the usable prefix of the index.
+
+        Args:
+            entity: SQLAlchemy model class
+        """
+        import sqlalchemy as sa
+
+        mapper = entity.__mapper__
+        table = entity.__table__
+        constraints = [table.primary_key, *table.indexes]
+        constraints += [
+            constraint
+            for constraint in table.constraints
+            if isinstance(constraint, sa.UniqueConstraint)
+        ]
+
+        indexes = []
+        for constraint in constraints:
+            keys = []
+            for expression in getattr(constraint, "expressions", constraint.columns):
+                if not isinstance(expression, sa.Column):
+                    break
+                try:
+                    keys.append(mapper.get_property_by_column(expression).key)
+                except sa.orm.exc.UnmappedColumnError:
+                    break
+            indexes.append(keys)
+        return cls(indexes)
+
+    @classmethod
+    def from_mongo(
+        cls,
+        indexes: Mapping[str, Mapping[str, Any]] | Iterable[Sequence[tuple[str, Any]]],
+    ) -> Self:
+        """Collect MongoDB index keys.
+
+        Text index keys can't serve a field condition and end the usable
+        prefix of an index.
+
+        Args:
+            indexes: Result of ``Collection.index_information()``, or a list
+                of key specifications such as ``[("age", 1), ("name", -1)]``
+        """
+        if isinstance(indexes, Mapping):
+            specs: Iterable[Sequence[tuple[str, Any]]] = [
+                info["key"] for info in indexes.values()
+            ]
+        else:
+            specs = indexes
+
+        keys = []
+        for spec in specs:
+            fields = []
+            for field, kind in spec:
+                if kind == "text":
+                    break
+                fields.append(field)
+            keys.append(fields)
+        return cls(keys)
+
+    def plan(
+        self, operations: Sequence[Operation], backend: Backend[Any] | None = None
+    ) -> list[Operation]:
+        """Reorder operations and warn about the ones no index can serve.
+
+        Args:
+            operations: Operations to reorder
+            backend: Backend the operations are meant for. Each operator it
+                renders in a non-sargable form emits a
+                :class:`SargabilityWarning`.
+
+        Returns:
+            Equivalent operations; untouched nodes are returned as is
+        """
+        flagged: list[tuple[Operator, str]] = []
+
+        def leaf(op: Operator) -> Operation:
+            if backend is not None:
+                reason = backend.non_sargable_reason(op)
+                if reason is not None:
+                    flagged.append((op, reason))
+            return op
+
+        def logic(op: LogicOperator, operations: list[Operation]) -> Operation:
+            if op.operator != LogicOperators.OR:
+                operations = self._order(operations)
+            if all(
+                new is old for new, old in zip(operations, op.operations, strict=True)
+            ):
+                return op
+            return LogicOperatorNode(op.operator, operations)
+
+        planned = self._order(fold_operations(operations, leaf, logic))
+        for op, reason in flagged:
+            warnings.warn(
+                SargabilityWarning(op.field, op.operator, reason), stacklevel=2
+            )
+        return planned
+
+    def _order(self, operations: list[Operation]) -> list[Operation]:
+        return sorted(operations, key=self._rank)
+
+    def _rank(self, op: Operation) -> int:
+        if op.operation_type is not OperationType.OPERATOR:
+            return _UNINDEXED
+
+        leaf = cast(Operator, op)
+        if leaf.operator in _EQUALITIES:
+            if leaf.field in self.leading_keys:
+                return 0
+            if leaf.field in self.indexed_keys:
+                return 1
+        elif leaf.operator in _RANGES and leaf.field in self.leading_keys:
+            return 1
+        return _UNINDEXED
@@ -1,56 +1,153 @@
 from collections.abc import Sequence
-from typing import Any
+from typing import Any, Generic, Literal, cast, overload
+
+from typing_extensions import TypeVar
 
 from charter._ops import (
     ContainsData,
+    Interner,
     LogicOperator,
+    LogicOperatorNode,
     LogicOperators,
     Operation,
     Operator,
+    OperatorNode,
     Operators,
+    Param,
+)
+
+# Types built by a ``Predicate``, pydantic models unless ``validate=False``.
+OperatorT = TypeVar(
+    "OperatorT", bound=Operator | OperatorNode, default=Operator, covariant=True
 )
+LogicOperatorT = TypeVar(
+    "LogicOperatorT",
+    bound=LogicOperator | LogicOperatorNode,
+    default=LogicOperator,
+    covariant=True,
+)
+
+
+class Predicate(Generic[OperatorT, LogicOperatorT]):  # noqa: UP046
+    """Factory for operation trees.
+
+    Args:
+        validate: Build validated pydantic models. Pass ``False`` on trusted
+            code paths to build slotted :class:`OperatorNode` and
+            :class:`LogicOperatorNode` objects without running validation.
+        interner: Table returning a shared object for every operation equal
+            to one built before, see :class:`Interner`
+    """
+
+    @overload
+    def __init__(
+        self: "Predicate[Operator, LogicOperator]",
+        *,
+        validate: Literal[True] = True,
+        interner: Interner | None = None,
+    ) -> None: ...
+
+    @overload
+    def __init__(
+        self: "Predicate[OperatorNode, LogicOperatorNode]",
+        *,
+        validate: Literal[False],
+        interner: Interner | None = None,
+    ) -> None: ...
 
+    @overload
+    def __init__(
+        self: "Predicate[Operator | OperatorNode, LogicOperator | LogicOperatorNode]",
+        *,
+        validate: bool,
+        interner: Interner | None = None,
+    ) -> None: ...
 
-class Predicate:
-    def or_(self, *operations: Operation) -> LogicOperator:
-        return LogicOperator(operator=LogicOperators.OR, operations=operations)
+    def __init__(
+        self, *, validate: bool = True, interner: Interner | None = None
+    ) -> None:
+        self.validate = validate
+        self.interner = interner
 
-    def and_(self, *operations: Operation) -> LogicOperator:
-        return LogicOperator(operator=LogicOperators.AND, operations=operations)
+    def _operator(self, operator: Operators, field: str, value: Any) -> OperatorT:
+        op: Operator | OperatorNode
+        if self.validate:
+            op = Operator(operator=operator, field=field, value=value)
+        else:
+            op = OperatorNode(operator, field, value)
+        if self.interner is not None:
+            return cast(OperatorT, self.interner._intern_node(op))
+        return cast(OperatorT, op)
 
-    def not_(self, *operations: Operation) -> LogicOperator:
-        return LogicOperator(operator=LogicOperators.NOT, operations=operations)
+    def _logic(
+        self, operator: LogicOperators, operations: Sequence[Operation]
+    ) -> LogicOperatorT:
+        if self.interner is not None:
+            operations = [self.interner.intern(op) for op in operations]
 
-    def eq(self, field: str, value: Any) -> Operator:
-        return Operator(operator=Operators.EQ, field=field, value=value)
+        op: LogicOperator | LogicOperatorNode
+        if self.validate:
+            op = LogicOperator(operator=operator, operations=operations)
+        else:
+            op = LogicOperatorNode(operator, operations)
+        if self.interner is not None:
+            return cast(LogicOperatorT, self.interner._intern_node(op))
+        return cast(LogicOperatorT, op)
 
-    def neq(self, field: str, value: Any) -> Operator:
-        return Operator(operator=Operators.NEQ, field=field, value=value)
+    def or_(self, *operations: Operation) -> LogicOperatorT:
+        return self._logic(LogicOperators.OR, operations)
 
-    def in_(self, field: str, values: Sequence[Any]) -> Operator:
-        return Operator(operator=Operators.IN, field=field, value=values)
+    def and_(self, *operations: Operation) -> LogicOperatorT:
+        return self._logic(LogicOperators.AND, operations)
 
-    def not_in(self, field: str, values: Sequence[Any]) -> LogicOperator:
+    def not_(self, *operations: Operation) -> LogicOperatorT:
+        return self._logic(LogicOperators.NOT, operations)
+
+    def eq(self, field: str, value: Any) -> OperatorT:
+        return self._operator(Operators.EQ, field, value)
+
+    def neq(self, field: str, value: Any) -> OperatorT:
+        return self._operator(Operators.NEQ, field, value)
+
+    def in_(self, field: str, values: Sequence[Any] | Param) -> OperatorT:
+        return self._operator(Operators.IN, field, values)
+
+    def not_in(self, field: str, values: Sequence[Any] | Param) -> LogicOperatorT:
         return self.not_(self.in_(field, values))
 
-    def gt(self, field: str, value: Any) -> Operator:
-        return Operator(operator=Operators.GT, field=field, value=value)
+    def gt(self, field: str, value: Any) -> OperatorT:
+        return self._operator(Operators.GT, field, value)
+
+    def gte(self, field: str, value: Any) -> OperatorT:
+        return self._operator(Operators.GTE, field, value)
+
+    def lt(self, field: str, value: Any) -> OperatorT:
+        return self._operator(Operators.LT, field, value)
+
+    def lte(self, field: str, value: Any) -> OperatorT:
+        return self._operator(Operators.LTE, field, value)
+
+    def contains(
+        self, field: str, value: str | Param, ignore_case: bool = False
+    ) -> OperatorT:
+        if self.validate:
+            data = ContainsData(value=value, ignore_case=ignore_case)
+        else:
+            data = ContainsData.model_construct(value=value, ignore_case=ignore_case)
+        return self._operator(Operators.CONTAINS, field, data)
 
-    def gte(self, field: str, value: Any) -> Operator:
-        return Operator(operator=Operators.GTE, field=field, value=value)
+    def regex(self, field: str, pattern: str | Param) -> OperatorT:
+        return self._operator(Operators.REGEX, field, pattern)
 
-    def lt(self, field: str, value: Any) -> Operator:
-        return Operator(operator=Operators.LT, field=field, value=value)
+    def any_(self, field: str, values: Sequence[Any] | Param) -> OperatorT:
+        return self._operator(Operators.ANY, field, values)
 
-    def lte(self, field: str, value: Any) -> Operator:
-        return Operator(operator=Operators.LTE, field=field, value=value)
+    def all_(self, field: str, values: Sequence[Any] | Param) -> OperatorT:
+        return self._operator(Operators.ALL, field, values)
 
-    def contains(self, field: str, value: str, ignore_case: bool = False) -> Operator:
-        return Operator(
-            operator=Operators.CONTAINS,
-            field=field,
-            value=ContainsData(value=value, ignore_case=ignore_case),
-        )
+    def elem_match(self, field: str, *operations: Operation) -> OperatorT:
+        """Match an array field with an element matching all ``operations``.
 
-    def regex(self, field: str, pattern: str) -> Operator:
-        return Operator(operator=Operators.REGEX, field=field, value=pattern)
+        The fields of ``operations`` name keys of the array elements.
+        """
+        return self._operator(Operators.ELEM_MATCH, field, operations)
@@ -0,0 +1,124 @@
+"""Literal prefixes of anchored regular expressions.
+
+A pattern such as ``^ACME-2025`` only matches strings starting with
+``ACME-2025``, which form the range ``['ACME-2025', 'ACME-2026')``. Unlike
+the regular expression, the range can be answered from an index.
+
+Only a conservative subset of the syntax is understood: anything that is
+not a plain or escaped literal character ends the prefix, and a pattern with
+an alternation at the top level has none.
+"""
+
+from typing import NamedTuple
+
+_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+# Quantifiers that allow zero repetitions of the preceding character.
+_OPTIONAL = frozenset("*?{")
+
+_MAX_CODE_POINT = 0x10FFFF
+_SURROGATES = range(0xD800, 0xE000)
+
+
+class RegexPrefix(NamedTuple):
+    """Literal prefix every match of a pattern starts with."""
+
+    prefix: str
+    # Smallest string greater than every string starting with ``prefix``,
+    # ``None`` if there is none.
+    upper_bound: str | None
+    # Whether the pattern matches exactly the strings starting with
+    # ``prefix``, so the range can replace it.
+    exact: bool
+
+
+def literal_prefix(pattern: str) -> RegexPrefix | None:
+    """Extract the literal prefix of an anchored pattern.
+
+    Args:
+        pattern: Regular expression, matched with ``search`` semantics
+
+    Returns:
+        Prefix with its range bound, or ``None`` if the pattern is not
+        anchored or starts with anything but a literal
+    """
+    if pattern.startswith("^"):
+        position = 1
+    elif pattern.startswith("\\A"):
+        position = 2
+    else:
+        return None
+    if _has_top_level_alternation(pattern):
+        return None
+
+    chars: list[str] = []
+    exact = True
+    while position < len(pattern):
+        char = pattern[position]
+        if char == "\\":
+            escaped = pattern[position + 1 : position + 2]
+            # Escaped letters and digits are classes, anchors or references.
+            if not escaped or escaped.isalnum():
+                exact = False
+                break
+            literal, width = escaped, 2
+        elif char in _METACHARACTERS:
+            exact = False
+            break
+        else:
+            literal, width = char, 1
+
+        following = pattern[position + width : position + width + 1]
+        if following and following in _OPTIONAL:
+            exact = False
+            break
+        chars.append(literal)
+        position += width
+        if following == "+":
+            exact = False
+            break
+
+    if not chars:
+        return None
+    prefix = "".join(chars)
+    return RegexPrefix(prefix, _upper_bound(prefix), exact)
+
+
+def _upper_bound(prefix: str) -> str | None:
+    """Increment the last character that has a successor, dropping the rest."""
+    chars = list(prefix)
+    while chars:
+        code_point = ord(chars.pop()) + 1
+        if code_point in _SURROGATES:
+            code_point = _SURROGATES.stop
+        if code_point <= _MAX_CODE_POINT:
+            return "".join(chars) + chr(code_point)
+    return None
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    depth = 0
+    in_class = False
+    position = 0
+    while position < len(pattern):
+        char = pattern[position]
+        if char == "\\":
+            position += 2
+            continue
+
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # A ``]`` right after ``[`` or ``[^`` is a literal.
+            if pattern[position + 1 : position + 2] == "^":
+                position += 1
+            if pattern[position + 1 : position + 2] == "]":
+                position += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+        position += 1
+    return False
@@ -0,0 +1,538 @@
+"""Serialization of operation trees for caches and service boundaries.
+
+:func:`to_bytes` writes a compact binary encoding: field names are stored
+once in a table and referenced by index, values carry a type tag, and
+lists of integers or floats are packed as fixed-width arrays, integers in
+the narrowest width that holds them. Nodes
+are written in post-order, so both directions walk trees of any depth
+without recursion.
+
+:func:`canonical_json` writes the JSON filter format with the children of
+``and``, ``or`` and ``not`` and the values of ``in``, ``any`` and ``all`` in
+a canonical order, so equivalent filters get the same string, suitable as a
+cache key.
+"""
+
+import datetime
+import hashlib
+import json
+import struct
+import sys
+import uuid
+from array import array
+from collections.abc import Mapping, Sequence
+from decimal import Decimal
+from enum import IntEnum
+from typing import Any, NamedTuple
+
+from charter._exc import SerializationError, UnsupportedOperationError
+from charter._ops import (
+    SEQUENCE_OPERATORS,
+    ContainsData,
+    LogicOperator,
+    LogicOperatorNode,
+    LogicOperators,
+    Operation,
+    Operator,
+    OperatorNode,
+    Operators,
+    Param,
+    _check_operator_value,
+    fold_operations,
+)
+
+_MAGIC = b"CHB\x01"
+
+# Node codes are part of the format; never renumber them.
+_OPERATOR_CODES = {
+    Operators.EQ: 0x00,
+    Operators.NEQ: 0x01,
+    Operators.IN: 0x02,
+    Operators.GT: 0x03,
+    Operators.GTE: 0x04,
+    Operators.LT: 0x05,
+    Operators.LTE: 0x06,
+    Operators.CONTAINS: 0x07,
+    Operators.REGEX: 0x08,
+    Operators.ANY: 0x09,
+    Operators.ALL: 0x0A,
+    Operators.ELEM_MATCH: 0x0B,
+}
+_LOGIC_CODES = {
+    LogicOperators.AND: 0x10,
+    LogicOperators.OR: 0x11,
+    LogicOperators.NOT: 0x12,
+}
+_OPERATORS_BY_CODE = {code: op for op, code in _OPERATOR_CODES.items()}
+_LOGIC_BY_CODE = {code: op for op, code in _LOGIC_CODES.items()}
+
+
+class _Tag(IntEnum):
+    """Type tag of a value, part of the format."""
+
+    NONE = 0x00
+    FALSE = 0x01
+    TRUE = 0x02
+    INT = 0x03
+    FLOAT = 0x04
+    STR = 0x05
+    BYTES = 0x06
+    LIST = 0x07
+    TUPLE = 0x08
+    INT_LIST = 0x09
+    FLOAT_LIST = 0x0A
+    ARRAY = 0x0B
+    PARAM = 0x0C
+    CONTAINS = 0x0D
+    DATETIME = 0x0E
+    DATE = 0x0F
+    DECIMAL = 0x10
+    UUID = 0x11
+    MAP = 0x12
+    # Operations of ``elem_match``, as a nested encoding.
+    OPERATIONS = 0x13
+
+
+# Fixed-width array types for packed integer lists, narrowest first.
+_INT_TYPECODES = (("b", 8), ("h", 16), ("i", 32), ("q", 64))
+# Array types whose item size differs between platforms.
+_PORTABLE_TYPECODES = {"l": "q", "L": "Q"}
+_DOUBLE = struct.Struct("<d")
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def to_bytes(operations: Sequence[Operation]) -> bytes:
+    """Encode operations in the compact binary format.
+
+    Args:
+        operations: Operations to encode
+
+    Returns:
+        Encoded operations, decoded by :func:`from_bytes`
+
+    Raises:
+        SerializationError: If a value has a type the format can't hold
+    """
+    fields: dict[str, int] = {}
+    body = bytearray()
+
+    def leaf(op: Operator) -> None:
+        try:
+            body.append(_OPERATOR_CODES[op.operator])
+        except KeyError:
+            raise UnsupportedOperationError(
+                f"Unsupported operator: {op.operator}"
+            ) from None
+        _write_uint(body, fields.setdefault(op.field, len(fields)))
+        if op.operator == Operators.ELEM_MATCH:
+            nested = to_bytes(op.value)
+            body.append(_Tag.OPERATIONS)
+            _write_uint(body, len(nested))
+            body.extend(nested)
+        else:
+            _write_value(body, op.value)
+
+    def logic(op: LogicOperator, operations: list[None]) -> None:
+        body.append(_LOGIC_CODES[op.operator])
+        _write_uint(body, len(operations))
+
+    fold_operations(operations, leaf, logic)
+
+    data = bytearray(_MAGIC)
+    _write_uint(data, len(fields))
+    for field in fields:
+        _write_str(data, field)
+    _write_uint(data, len(operations))
+    data += body
+    return bytes(data)
+
+
+def from_bytes(data: bytes | bytearray | memoryview) -> list[Operation]:
+    """Decode operations encoded by :func:`to_bytes`.
+
+    Pydantic models come back as :class:`OperatorNode` and
+    :class:`LogicOperatorNode`, with the same structure and values. The
+    values are checked as in :func:`charter.from_json`.
+
+    Args:
+        data: Encoded operations
+
+    Returns:
+        Decoded operations
+
+    Raises:
+        SerializationError: If the data is not a valid encoding
+    """
+    reader = _Reader(data)
+    try:
+        if reader.read(len(_MAGIC)) != _MAGIC:
+            raise SerializationError("Not a charter binary filter")
+        fields = [reader.read_str() for _ in range(reader.read_uint())]
+        root_count = reader.read_uint()
+
+        stack: list[Operation] = []
+        while not reader.at_end():
+            code = reader.read_byte()
+            if code in _OPERATORS_BY_CODE:
+                operator = _OPERATORS_BY_CODE[code]
+                field = fields[reader.read_uint()]
+                value = _check_operator_value(operator, reader.read_value())
+                stack.append(OperatorNode(operator, field, value))
+            elif code in _LOGIC_BY_CODE:
+                count = reader.read_uint()
+                if not 0 < count <= len(stack):
+                    raise SerializationError("Invalid number of operations")
+                operations = stack[-count:]
+                del stack[-count:]
+                stack.append(LogicOperatorNode(_LOGIC_BY_CODE[code], operations))
+            else:
+                raise SerializationError(f"Unknown node code: {code:#04x}")
+    except (
+        ArithmeticError,
+        IndexError,
+        UnicodeDecodeError,
+        TypeError,
+        ValueError,
+    ) as e:
+        # ``ArithmeticError`` covers ``decimal.InvalidOperation``.
+        raise SerializationError(f"Invalid binary filter: {e}") from e
+    except RecursionError as e:
+        raise SerializationError("Binary filter values are nested too deeply") from e
+
+    if len(stack) != root_count:
+        raise SerializationError("Invalid number of operations")
+    return stack
+
+
+def canonical_json(operations: Sequence[Operation]) -> str:
+    """Write operations as canonical JSON, usable as a cache key.
+
+    The top level is a list, as accepted by :func:`charter.from_json`.
+    Children of ``and``, ``or`` and ``not`` (whose operations are implicitly
+    joined with ``and``) are sorted by a digest of their canonical form, and
+    the values of ``in``, ``any`` and ``all`` are sorted and deduplicated, so
+    the order in which a filter was built does not change its key. Other
+    rewrites, such as flattening nested ``and``, are left to
+    :func:`charter.optimize`.
+
+    ``Param`` and values JSON has no type for are written as single-key
+    objects: ``{"$param": name}``, ``{"$datetime": ...}``, ``{"$date": ...}``,
+    ``{"$decimal": ...}``, ``{"$uuid": ...}`` and ``{"$bytes": ...}``. A
+    mapping value that could be mistaken for one is wrapped in ``{"$map": ...}``.
+
+    Args:
+        operations: Operations to write
+
+    Returns:
+        Canonical JSON document
+
+    Raises:
+        SerializationError: If a value has a type that can't be written
+    """
+
+    def leaf(op: Operator) -> _Canonical:
+        text = _leaf_json(op)
+        return _Canonical(_digest(text.encode()), [text])
+
+    def logic(op: LogicOperator, operations: list[_Canonical]) -> _Canonical:
+        return _combine(LogicOperators(op.operator), operations)
+
+    root = _combine(None, fold_operations(operations, leaf, logic))
+    return "".join(_flatten(root))
+
+
+class _Canonical(NamedTuple):
+    """Canonical form of a subtree: its digest and its text in pieces."""
+
+    digest: bytes
+    parts: list["str | _Canonical"]
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _combine(
+    operator: LogicOperators | None, operations: list[_Canonical]
+) -> _Canonical:
+    """Join sorted children into a logic operator, or the top-level list."""
+    operations = sorted(operations, key=lambda child: child.digest)
+
+    parts: list[str | _Canonical] = ["[" if operator is None else f'{{"{operator}":[']
+    for index, child in enumerate(operations):
+        if index:
+            parts.append(",")
+        parts.append(child)
+    parts.append("]" if operator is None else "]}")
+
+    tag = b"" if operator is None else operator.encode()
+    digest = _digest(tag + b"".join(child.digest for child in operations))
+    return _Canonical(digest, parts)
+
+
+def _flatten(root: _Canonical) -> list[str]:
+    """Concatenate the pieces of a canonical form without recursion."""
+    text: list[str] = []
+    stack = [iter(root.parts)]
+    while stack:
+        for part in stack[-1]:
+            if isinstance(part, str):
+                text.append(part)
+            else:
+                stack.append(iter(part.parts))
+                break
+        else:
+            stack.pop()
+    return text
+
+
+def _leaf_json(op: Operator) -> str:
+    value = op.value
+    if op.operator in SEQUENCE_OPERATORS and not isinstance(value, Param):
+        if all(type(item) is int for item in value):
+            items = [str(item) for item in sorted(set(value))]
+        else:
+            items = sorted({_dumps(_json_value(item)) for item in value})
+        return f'{{"{op.operator}":[{_dumps(op.field)},[{",".join(items)}]]}}'
+    if op.operator == Operators.ELEM_MATCH:
+        operations = canonical_json(value)
+        return f'{{"{op.operator}":[{_dumps(op.field)},{operations}]}}'
+    if isinstance(value, ContainsData):
+        data: Any = _json_value(value.value)
+        if value.ignore_case:
+            data = {"value": data, "ignore_case": True}
+    else:
+        data = _json_value(value)
+    return _dumps({str(op.operator): [op.field, data]})
+
+
+_dumps = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False
+).encode
+
+
+def _json_value(value: Any) -> Any:
+    match value:
+        case None | bool() | int() | float() | str():
+            return value
+        case Param():
+            return {"$param": value.name}
+        case datetime.datetime():
+            return {"$datetime": value.isoformat()}
+        case datetime.date():
+            return {"$date": value.isoformat()}
+        case Decimal():
+            return {"$decimal": str(value)}
+        case uuid.UUID():
+            return {"$uuid": str(value)}
+        case bytes():
+            return {"$bytes": value.hex()}
+        case Mapping():
+            mapping = {str(k): _json_value(v) for k, v in value.items()}
+            # Keep a mapping apart from the tagged values it could pass for.
+            if len(mapping) == 1 and next(iter(mapping)).startswith("$"):
+                return {"$map": mapping}
+            return mapping
+        case Sequence() | array():
+            return [_json_value(item) for item in value]
+        case _:
+            raise SerializationError(f"Value of type {type(value)} can't be serialized")
+
+
+def _write_uint(buffer: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _write_str(buffer: bytearray, value: str) -> None:
+    encoded = value.encode()
+    _write_uint(buffer, len(encoded))
+    buffer += encoded
+
+
+def _write_packed(buffer: bytearray, tag: int, typecode: str, values: Any) -> None:
+    """Write values as a little-endian array of ``typecode`` items."""
+    typecode = _PORTABLE_TYPECODES.get(typecode, typecode)
+    packed = array(typecode, values)
+    if _BIG_ENDIAN:
+        packed.byteswap()
+    buffer.append(tag)
+    buffer.append(ord(typecode))
+    _write_uint(buffer, len(packed))
+    buffer += packed.tobytes()
+
+
+def _int_typecode(values: list[int]) -> str | None:
+    """Pick the narrowest fixed-width array type holding all values."""
+    low, high = min(values), max(values)
+    for typecode, bits in _INT_TYPECODES:
+        if -(2 ** (bits - 1)) <= low and high < 2 ** (bits - 1):
+            return typecode
+    return None
+
+
+def _write_value(buffer: bytearray, value: Any) -> None:
+    value_type = type(value)
+    if value is None:
+        buffer.append(_Tag.NONE)
+    elif value_type is bool:
+        buffer.append(_Tag.TRUE if value else _Tag.FALSE)
+    elif value_type is int:
+        buffer.append(_Tag.INT)
+        _write_uint(buffer, (value << 1) if value >= 0 else ((-value) << 1) - 1)
+    elif value_type is float:
+        buffer.append(_Tag.FLOAT)
+        buffer += _DOUBLE.pack(value)
+    elif value_type is str:
+        buffer.append(_Tag.STR)
+        _write_str(buffer, value)
+    elif value_type is list:
+        if value and all(type(item) is int for item in value):
+            typecode = _int_typecode(value)
+            if typecode is not None:
+                _write_packed(buffer, _Tag.INT_LIST, typecode, value)
+                return
+        elif value and all(type(item) is float for item in value):
+            _write_packed(buffer, _Tag.FLOAT_LIST, "d", value)
+            return
+        _write_sequence(buffer, _Tag.LIST, value)
+    elif value_type is tuple:
+        _write_sequence(buffer, _Tag.TUPLE, value)
+    elif value_type is array:
+        _write_packed(buffer, _Tag.ARRAY, value.typecode, value)
+    elif isinstance(value, Param):
+        buffer.append(_Tag.PARAM)
+        _write_str(buffer, value.name)
+    elif isinstance(value, ContainsData):
+        buffer.append(_Tag.CONTAINS)
+        buffer.append(_Tag.TRUE if value.ignore_case else _Tag.FALSE)
+        _write_value(buffer, value.value)
+    elif isinstance(value, bytes):
+        buffer.append(_Tag.BYTES)
+        _write_uint(buffer, len(value))
+        buffer += value
+    elif isinstance(value, datetime.datetime):
+        buffer.append(_Tag.DATETIME)
+        _write_str(buffer, value.isoformat())
+    elif isinstance(value, datetime.date):
+        buffer.append(_Tag.DATE)
+        _write_str(buffer, value.isoformat())
+    elif isinstance(value, Decimal):
+        buffer.append(_Tag.DECIMAL)
+        _write_str(buffer, str(value))
+    elif isinstance(value, uuid.UUID):
+        buffer.append(_Tag.UUID)
+        buffer += value.bytes
+    elif isinstance(value, dict):
+        buffer.append(_Tag.MAP)
+        _write_uint(buffer, len(value))
+        for key, item in value.items():
+            _write_value(buffer, key)
+            _write_value(buffer, item)
+    else:
+        raise SerializationError(f"Value of type {value_type} can't be serialized")
+
+
+def _write_sequence(buffer: bytearray, tag: int, values: Sequence[Any]) -> None:
+    buffer.append(tag)
+    _write_uint(buffer, len(values))
+    for item in values:
+        _write_value(buffer, item)
+
+
+class _Reader:
+    """Cursor over encoded data; reading past the end raises ``IndexError``."""
+
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
+        self.data = memoryview(data).cast("B")
+        self.position = 0
+
+    def at_end(self) -> bool:
+        return self.position >= len(self.data)
+
+    def read_byte(self) -> int:
+        byte = self.data[self.position]
+        self.position += 1
+        return byte
+
+    def read(self, size: int) -> bytes:
+        end = self.position + size
+        if end > len(self.data):
+            raise IndexError("unexpected end of data")
+        chunk = self.data[self.position : end].tobytes()
+        self.position = end
+        return chunk
+
+    def read_uint(self) -> int:
+        result = 0
+        shift = 0
+        while True:
+            byte = self.read_byte()
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read_str(self) -> str:
+        return self.read(self.read_uint()).decode()
+
+    def read_packed(self) -> array[Any]:
+        values = array(chr(self.read_byte()))
+        count = self.read_uint()
+        values.frombytes(self.read(count * values.itemsize))
+        if _BIG_ENDIAN:
+            values.byteswap()
+        return values
+
+    def read_value(self) -> Any:
+        tag = self.read_byte()
+        match tag:
+            case _Tag.NONE:
+                return None
+            case _Tag.FALSE:
+                return False
+            case _Tag.TRUE:
+                return True
+            case _Tag.INT:
+                zigzag = self.read_uint()
+                return zigzag >> 1 if not zigzag & 1 else -((zigzag + 1) >> 1)
+            case _Tag.FLOAT:
+                return _DOUBLE.unpack(self.read(_DOUBLE.size))[0]
+            case _Tag.STR:
+                return self.read_str()
+            case _Tag.BYTES:
+                return self.read(self.read_uint())
+            case _Tag.LIST:
+                return [self.read_value() for _ in range(self.read_uint())]
+            case _Tag.TUPLE:
+                return tuple(self.read_value() for _ in range(self.read_uint()))
+            case _Tag.INT_LIST:
+                return self.read_packed().tolist()
+            case _Tag.FLOAT_LIST:
+                return self.read_packed().tolist()
+            case _Tag.ARRAY:
+                return self.read_packed()
+            case _Tag.PARAM:
+                return Param(self.read_str())
+            case _Tag.CONTAINS:
+                ignore_case = self.read_byte() == _Tag.TRUE
+                return ContainsData(value=self.read_value(), ignore_case=ignore_case)
+            case _Tag.DATETIME:
+                return datetime.datetime.fromisoformat(self.read_str())
+            case _Tag.DATE:
+                return datetime.date.fromisoformat(self.read_str())
+            case _Tag.DECIMAL:
+                return Decimal(self.read_str())
+            case _Tag.UUID:
+                return uuid.UUID(bytes=self.read(16))
+            case _Tag.MAP:
+                return {
+                    self.read_value(): self.read_value()
+                    for _ in range(self.read_uint())
+                }
+            case _Tag.OPERATIONS:
+                return tuple(from_bytes(self.read(self.read_uint())))
+            case _:
+                raise SerializationError(f"Unknown value tag: {tag:#04x}")
@@ -0,0 +1,205 @@
+"""Splitting of operation trees between a backend and in-process filtering.
+
+Fields computed in Python, or operators a database lacks, can't be sent to a
+backend. :func:`split` sends the backend the most selective filter it can
+run, one that every matching row passes, and keeps whatever that filter
+does not settle as a residual evaluated on the fetched rows.
+"""
+
+from collections.abc import Callable, Collection, Sequence
+from typing import Any, NamedTuple
+
+from charter._backends.python import Accessor, PythonBackend
+from charter._ops import (
+    ALL_OPERATORS,
+    LogicOperator,
+    LogicOperatorNode,
+    LogicOperators,
+    Operation,
+    Operator,
+    OperatorNode,
+    Operators,
+    fold_operations,
+)
+
+
+class Capabilities(NamedTuple):
+    """What a backend can evaluate, as seen by :func:`split`.
+
+    Example:
+        >>> sqlite = Capabilities(
+        ...     fields=SQLAlchemyBackend(User).fields,
+        ...     operators=ALL_OPERATORS - {Operators.REGEX},
+        ... )
+    """
+
+    # Fields the backend knows; ``None`` for every field.
+    fields: Collection[str] | None = None
+    operators: Collection[str] = ALL_OPERATORS
+
+    def supports(self, op: Operator) -> bool:
+        """Whether the backend can evaluate an operator."""
+        return op.operator in self.operators and (
+            self.fields is None or op.field in self.fields
+        )
+
+
+class Split(NamedTuple):
+    """Operations to run on a backend and to check on the rows it returns.
+
+    A row matches the original operations if and only if it matches both
+    lists, each joined by ``and``.
+    """
+
+    pushdown: list[Operation]
+    residual: list[Operation]
+
+    def residual_predicate(
+        self, accessor: Accessor = "auto", *, dotted_paths: bool = True
+    ) -> Callable[[Any], bool]:
+        """Compile the residual operations into a function of a row.
+
+        Args:
+            accessor: How field values are read from rows, as for
+                :class:`PythonBackend`
+            dotted_paths: Whether dotted fields, such as JSON paths, are
+                read one segment at a time, as for :class:`PythonBackend`
+
+        Returns:
+            Function returning whether a row matches the residual operations
+        """
+        return PythonBackend(accessor, dotted_paths=dotted_paths).transform(
+            self.residual
+        )
+
+
+class _Bounds(NamedTuple):
+    """Pushable operations bounding a subtree from above and from below.
+
+    Rows matching the subtree all match ``upper``, and rows matching
+    ``lower`` all match the subtree. ``upper`` is ``None`` where no pushable
+    operation is implied, meaning "every row", and ``lower`` is ``None``
+    where none implies the subtree, meaning "no row". ``fields`` are the
+    fields of the pushable operators in the subtree.
+    """
+
+    upper: Operation | None
+    lower: Operation | None
+    exact: bool
+    fields: tuple[str, ...]
+
+
+def split(operations: Sequence[Operation], capabilities: Capabilities) -> Split:
+    """Split operations into a part for a backend and a residual part.
+
+    Operations the backend fully supports are pushed down unchanged. Of any
+    other operation, the backend gets the tightest pushable relaxation, found
+    by treating unsupported operators as unknown: under ``or`` they can
+    match anything, so ``or(x, unsupported)`` is dropped, while under
+    ``and`` they only narrow the result, so ``and(x, unsupported)`` is
+    relaxed to ``x``. Under ``not`` the roles swap, and rows where a field
+    of the negated part is null are let through, since the backend may find
+    such comparisons unknown where the residual finds them false. The
+    operation itself is then kept in the residual.
+
+    Example:
+        >>> result = split(operations, Capabilities(fields={"age", "name"}))
+        >>> matches = result.residual_predicate("attribute")
+        >>> for batch in backend.stream(session, result.pushdown):
+        ...     rows = [row for row in batch if matches(row)]
+
+    Args:
+        operations: Sequence of operations to split
+        capabilities: What the backend can evaluate
+
+    Returns:
+        Operations for the backend and operations to evaluate in-process
+    """
+
+    def leaf(op: Operator) -> _Bounds:
+        if capabilities.supports(op):
+            return _Bounds(op, op, True, (op.field,))
+        return _Bounds(None, None, False, ())
+
+    pushdown: list[Operation] = []
+    residual: list[Operation] = []
+    for operation, bounds in zip(
+        operations, fold_operations(operations, leaf, _bound_logic), strict=True
+    ):
+        if bounds.exact:
+            pushdown.append(operation)
+            continue
+        if bounds.upper is not None:
+            pushdown.append(bounds.upper)
+        residual.append(operation)
+    return Split(pushdown, residual)
+
+
+def _bound_logic(op: LogicOperator, operands: list[_Bounds]) -> _Bounds:
+    exact = all(operand.exact for operand in operands)
+    uppers = [operand.upper for operand in operands]
+    lowers = [operand.lower for operand in operands]
+    fields = tuple(dict.fromkeys(f for operand in operands for f in operand.fields))
+    if (
+        exact
+        and all(
+            upper is operation
+            for upper, operation in zip(uppers, op.operations, strict=True)
+        )
+        and op.operator != LogicOperators.NOT
+    ):
+        return _Bounds(op, op, True, fields)
+
+    match op.operator:
+        case LogicOperators.AND:
+            upper = _any_of(LogicOperators.AND, uppers)
+            lower = _all_of(lowers)
+        case LogicOperators.OR:
+            upper = _all_of(uppers, LogicOperators.OR)
+            lower = _any_of(LogicOperators.OR, lowers)
+        case _:
+            # ``not`` of the operands joined by ``and``, whose bounds swap.
+            negated = _all_of(lowers)
+            upper = None if negated is None else _negate_nullable(negated, fields)
+            lower = _any_of(LogicOperators.AND, uppers)
+            lower = None if lower is None else _negate(lower)
+    return _Bounds(upper, lower, exact, fields)
+
+
+def _any_of(
+    operator: LogicOperators, operations: list[Operation | None]
+) -> Operation | None:
+    """Join the known operations, ``None`` if there are none."""
+    known = [operation for operation in operations if operation is not None]
+    if not known:
+        return None
+    if len(known) == 1:
+        return known[0]
+    return LogicOperatorNode(operator, known)
+
+
+def _all_of(
+    operations: list[Operation | None],
+    operator: LogicOperators = LogicOperators.AND,
+) -> Operation | None:
+    """Join the operations, ``None`` if any of them is unknown."""
+    if any(operation is None for operation in operations):
+        return None
+    return _any_of(operator, operations)
+
+
+def _negate(operation: Operation) -> Operation:
+    return LogicOperatorNode(LogicOperators.NOT, [operation])
+
+
+def _negate_nullable(operation: Operation, fields: tuple[str, ...]) -> Operation:
+    """Negate a lower bound into an upper bound, keeping rows with nulls.
+
+    A backend with SQL semantics finds a comparison with null unknown, and
+    so its negation, and drops the row, while the residual, evaluated in
+    Python, finds the comparison false and its negation true. Rows where any
+    of ``fields``, covering those of ``operation``, is null are therefore
+    let through; on the others both agree.
+    """
+    nulls = [OperatorNode(Operators.EQ, field, None) for field in fields]
+    return LogicOperatorNode(LogicOperators.OR, [_negate(operation), *nulls])
@@ -0,0 +1,406 @@
+"""Incremental loading of large documents in the JSON filter format.
+
+The document is read chunk by chunk from a file-like object or an iterable
+of byte strings, so it is never held in memory as a whole. Numeric ``in``
+lists are stored in :class:`array.array` instead of a list of Python
+objects, and the size limits are checked while reading, so an oversized
+payload is rejected before the rest of it is consumed.
+"""
+
+import json
+import re
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any, BinaryIO, NoReturn, cast
+
+from charter._exc import ParseError, PayloadTooLargeError
+from charter._json import _adapter
+from charter._ops import (
+    ALL_LOGIC_OPERATORS,
+    ALL_OPERATORS,
+    ContainsData,
+    LogicOperatorNode,
+    LogicOperators,
+    Operation,
+    OperatorNode,
+    Operators,
+    _check_operator_value,
+)
+
+_WHITESPACE = b" \t\r\n"
+_NUMBER_CHARS = re.compile(rb"[-+0-9.eE]*")
+_NUMBER = re.compile(rb"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][+-]?[0-9]+)?")
+_INT_RUN = re.compile(rb"(?:[ \t\r\n]*-?(?:0|[1-9][0-9]*)[ \t\r\n]*,)+")
+_LITERALS = {b"t": (b"true", True), b"f": (b"false", False), b"n": (b"null", None)}
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+# Largest magnitude up to which every integer is exactly representable
+# as a float.
+_FLOAT_EXACT = 2**53
+
+
+def from_json_stream(
+    source: BinaryIO | Iterable[bytes],
+    *,
+    chunk_size: int = 65536,
+    max_bytes: int | None = None,
+    max_in_length: int | None = None,
+    max_depth: int = 64,
+) -> list[Operation]:
+    """Load operations from a JSON document read incrementally.
+
+    Accepts the same format as :func:`charter.from_json`. Lists of integers
+    or floats given to ``in`` are stored as ``array.array('q')`` and
+    ``array.array('d')`` respectively; other lists stay Python lists.
+
+    Args:
+        source: Binary file-like object or iterable of byte chunks
+        chunk_size: Number of bytes requested per read from a file-like source
+        max_bytes: Maximum document size in bytes
+        max_in_length: Maximum number of values in a single ``in`` list
+        max_depth: Maximum nesting depth of logic operators and values
+
+    Returns:
+        Operations ready to pass to ``Backend.transform``
+
+    Raises:
+        PayloadTooLargeError: If a size limit is exceeded
+        ParseError: If the document is not a valid filter
+    """
+    if hasattr(source, "read"):
+        chunks = _read_chunks(source, chunk_size)  # type: ignore[arg-type]
+    else:
+        chunks = iter(source)
+
+    parser = _StreamParser(
+        chunks,
+        max_bytes=max_bytes,
+        max_in_length=max_in_length,
+        max_depth=max_depth,
+    )
+    return parser.parse()
+
+
+def _floats_exact(values: array[int]) -> bool:
+    return not values or (min(values) >= -_FLOAT_EXACT and max(values) <= _FLOAT_EXACT)
+
+
+def _read_chunks(source: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    while chunk := source.read(chunk_size):
+        yield chunk
+
+
+class _StreamParser:
+    def __init__(
+        self,
+        chunks: Iterator[bytes],
+        *,
+        max_bytes: int | None,
+        max_in_length: int | None,
+        max_depth: int,
+    ) -> None:
+        self.chunks = chunks
+        self.max_bytes = max_bytes
+        self.max_in_length = max_in_length
+        self.max_depth = max_depth
+
+        self.buffer = b""
+        self.pos = 0
+        # Absolute offset of ``buffer[0]`` in the document.
+        self.offset = 0
+        self.eof = False
+
+    def parse(self) -> list[Operation]:
+        if self._peek() == b"[":
+            self.pos += 1
+            operations = [self._parse_operation()]
+            while self._next_separator(b"]"):
+                operations.append(self._parse_operation())
+        else:
+            operations = [self._parse_operation()]
+
+        if self._peek() != b"":
+            self._error("Unexpected data after the end of the document")
+        return operations
+
+    # Operations
+
+    def _parse_operation(self) -> Operation:
+        """Parse one operation, keeping open logic operators on a stack."""
+        stack: list[tuple[LogicOperators, list[Operation]]] = []
+
+        while True:
+            key = self._parse_key()
+            if key in ALL_LOGIC_OPERATORS:
+                if len(stack) >= self.max_depth:
+                    raise PayloadTooLargeError(
+                        f"Document exceeds the maximum depth of {self.max_depth}"
+                    )
+                self._expect(b"[")
+                if self._peek() == b"]":
+                    self._error(f"Logic operator '{key}' requires operations")
+                stack.append((LogicOperators(key), []))
+                continue
+
+            node: Operation = self._parse_leaf(key)
+            self._expect(b"}")
+
+            while stack:
+                operator, operations = stack[-1]
+                operations.append(node)
+                if self._next_separator(b"]"):
+                    break
+                self._expect(b"}")
+                stack.pop()
+                node = LogicOperatorNode(operator, operations)
+            else:
+                return node
+
+    def _parse_key(self) -> str:
+        self._expect(b"{")
+        if self._peek() != b'"':
+            self._error("Expected an operator name")
+        key = self._parse_string()
+        self._expect(b":")
+        return key
+
+    def _parse_leaf(self, key: str) -> OperatorNode:
+        if key not in ALL_OPERATORS:
+            self._error(f"Unknown operator '{key}'")
+        operator = Operators(key)
+
+        self._expect(b"[")
+        if self._peek() != b'"':
+            self._error(f"Operator '{key}' requires a field name")
+        field = self._parse_string()
+        if not field:
+            self._error(f"Operator '{key}' requires a non-empty field name")
+        self._expect(b",")
+
+        match operator:
+            case Operators.IN:
+                value: Any = self._parse_in_values()
+            case Operators.CONTAINS:
+                value = self._parse_value(1)
+                if isinstance(value, dict):
+                    value = self._convert(lambda: ContainsData(**value))
+            case Operators.REGEX:
+                value = self._parse_value(1)
+                if not isinstance(value, str):
+                    self._error(f"Operator '{key}' requires a string pattern")
+            case Operators.ELEM_MATCH:
+                operations = self._parse_value(1)
+                value = self._convert(lambda: _adapter.validate_python(operations))
+            case _:
+                value = self._parse_value(1)
+
+        self._expect(b"]")
+        return OperatorNode(
+            operator,
+            field,
+            self._convert(lambda: _check_operator_value(operator, value)),
+        )
+
+    def _parse_in_values(self) -> Any:
+        """Parse an ``in`` list, packing numbers into an ``array.array``."""
+        self._expect(b"[")
+        if self._peek() == b"]":
+            self._error("Operator 'in' requires a non-empty list")
+
+        values: Any = array("q")
+        while True:
+            if isinstance(values, array) and values.typecode == "q":
+                self._extend_ints(values)
+            value = self._parse_value(1)
+            values = self._append_compact(values, value)
+            self._check_in_length(values)
+            if not self._next_separator(b"]"):
+                return values
+
+    def _extend_ints(self, values: array[int]) -> None:
+        """Consume the run of ``<int>,`` items available in the buffer at once."""
+        run = _INT_RUN.match(self.buffer, self.pos)
+        if run is None:
+            return
+
+        ints = [int(item) for item in run.group().split(b",")[:-1]]
+        if min(ints) < _INT64_MIN or max(ints) > _INT64_MAX:
+            return
+
+        values.extend(ints)
+        self.pos = run.end()
+        self._check_in_length(values)
+
+    def _check_in_length(self, values: Any) -> None:
+        if self.max_in_length is not None and len(values) > self.max_in_length:
+            raise PayloadTooLargeError(
+                f"Operator 'in' list exceeds the maximum length of {self.max_in_length}"
+            )
+
+    def _append_compact(self, values: Any, value: Any) -> Any:
+        if isinstance(values, array):
+            is_int = type(value) is int
+            if values.typecode == "q" and is_int:
+                if _INT64_MIN <= value <= _INT64_MAX:
+                    values.append(value)
+                    return values
+            elif type(value) is float or (is_int and abs(value) <= _FLOAT_EXACT):
+                if values.typecode == "q" and _floats_exact(values):
+                    values = array("d", values)
+                if values.typecode == "d":
+                    values.append(value)
+                    return values
+            values = values.tolist()
+        values.append(value)
+        return values
+
+    # Values
+
+    def _parse_value(self, depth: int) -> Any:
+        if depth > self.max_depth:
+            raise PayloadTooLargeError(
+                f"Document exceeds the maximum depth of {self.max_depth}"
+            )
+
+        char = self._peek()
+        if char == b'"':
+            return self._parse_string()
+        if char == b"[":
+            self.pos += 1
+            items: list[Any] = []
+            if self._peek() == b"]":
+                self.pos += 1
+                return items
+            items.append(self._parse_value(depth + 1))
+            while self._next_separator(b"]"):
+                items.append(self._parse_value(depth + 1))
+            return items
+        if char == b"{":
+            self.pos += 1
+            obj: dict[str, Any] = {}
+            if self._peek() == b"}":
+                self.pos += 1
+                return obj
+            while True:
+                if self._peek() != b'"':
+                    self._error("Expected an object key")
+                key = self._parse_string()
+                self._expect(b":")
+                obj[key] = self._parse_value(depth + 1)
+                if not self._next_separator(b"}"):
+                    return obj
+        if char in _LITERALS:
+            return self._parse_literal(char)
+        return self._parse_number()
+
+    def _parse_string(self) -> str:
+        # Offset from the opening quote that is already known not to close
+        # the string; ``_fill`` may move the buffer under ``self.pos``.
+        scanned = 1
+        while True:
+            end = self.buffer.find(b'"', self.pos + scanned)
+            if end == -1:
+                scanned = len(self.buffer) - self.pos
+                if not self._fill():
+                    self._error("Unterminated string")
+                continue
+
+            backslashes = 0
+            while self.buffer[end - 1 - backslashes] == ord("\\"):
+                backslashes += 1
+            if backslashes % 2:
+                scanned = end + 1 - self.pos
+                continue
+            break
+
+        raw = self.buffer[self.pos + 1 : end]
+        self.pos = end + 1
+        try:
+            if b"\\" in raw:
+                return str(json.loads(b'"' + raw + b'"'))
+            return raw.decode()
+        except ValueError:
+            self._error("Invalid string")
+
+    def _parse_number(self) -> int | float:
+        while True:
+            token = cast(re.Match[bytes], _NUMBER_CHARS.match(self.buffer, self.pos))
+            if token.end() < len(self.buffer) or not self._fill():
+                break
+
+        match = _NUMBER.fullmatch(token.group())
+        if match is None:
+            self._error("Expected a value")
+        self.pos = token.end()
+        if match.group(1) or match.group(2):
+            return float(match.group())
+        return int(match.group())
+
+    def _parse_literal(self, char: bytes) -> Any:
+        literal, value = _LITERALS[char]
+        while len(self.buffer) - self.pos < len(literal) and self._fill():
+            pass
+        if self.buffer[self.pos : self.pos + len(literal)] != literal:
+            self._error("Invalid literal")
+        self.pos += len(literal)
+        return value
+
+    # Tokens
+
+    def _peek(self) -> bytes:
+        """Skip whitespace and return the next byte without consuming it."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos : self.pos + 1]
+            if not self._fill():
+                return b""
+
+    def _expect(self, char: bytes) -> None:
+        if self._peek() != char:
+            self._error(f"Expected '{char.decode()}'")
+        self.pos += 1
+
+    def _next_separator(self, closing: bytes) -> bool:
+        """Consume ``,`` (returns ``True``) or ``closing`` (returns ``False``)."""
+        char = self._peek()
+        if char == b",":
+            self.pos += 1
+            return True
+        if char == closing:
+            self.pos += 1
+            return False
+        self._error(f"Expected ',' or '{closing.decode()}'")
+
+    def _fill(self) -> bool:
+        """Read the next chunk, dropping the consumed part of the buffer."""
+        if self.eof:
+            return False
+
+        for chunk in self.chunks:
+            if chunk:
+                break
+        else:
+            self.eof = True
+            return False
+
+        read = self.offset + len(self.buffer) + len(chunk)
+        if self.max_bytes is not None and read > self.max_bytes:
+            raise PayloadTooLargeError(
+                f"Document exceeds the maximum size of {self.max_bytes} bytes"
+            )
+
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def _convert(self, build: Any) -> Any:
+        try:
+            return build()
+        except (TypeError, ValueError) as e:
+            self._error(str(e))
+
+    def _error(self, message: str) -> NoReturn:
+        raise ParseError(f"{message} at byte {self.offset + self.pos}")
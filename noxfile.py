@@ -27,3 +27,16 @@ def test_pymongo(session: nox.Session) -> None:
         env={"UV_PROJECT_ENVIRONMENT": session.virtualenv.location},
     )
     session.run("pytest")
+
+
+@nox.session(venv_backend="uv", python=PYTHON_TESTING_VERSIONS)
+def test_numpy(session: nox.Session) -> None:
+    session.run(
+        "uv",
+        "sync",
+        "--extra=test",
+        "--extra=numpy",
+        f"--python={session.virtualenv.location}",
+        env={"UV_PROJECT_ENVIRONMENT": session.virtualenv.location},
+    )
+    session.run("pytest")
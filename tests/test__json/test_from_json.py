@@ -0,0 +1,149 @@
+import json
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from charter._json import from_json
+from charter._ops import (
+    ContainsData,
+    LogicOperatorNode,
+    LogicOperators,
+    OperatorNode,
+    Operators,
+)
+from tests.test_predicate.test_performance import best_time
+
+
+class TestFromJson:
+    def test_docs_example(self) -> None:
+        result = from_json(
+            b"""
+            {
+                "or": [
+                    {
+                        "and": [
+                            {"gte": ["created_at", "2025-06-01T00:00:00"]},
+                            {"lte": ["created_at", "2025-06-03T00:00:00"]}
+                        ]
+                    },
+                    {
+                        "and": [
+                            {"gte": ["updated_at", "2025-06-04T00:00:00"]},
+                            {"lte": ["updated_at", "2025-06-05T00:00:00"]}
+                        ]
+                    }
+                ]
+            }
+            """
+        )
+
+        assert len(result) == 1
+        root = result[0]
+        assert isinstance(root, LogicOperatorNode)
+        assert root.operator == LogicOperators.OR
+        branch = root.operations[0]
+        assert isinstance(branch, LogicOperatorNode)
+        assert branch.operator == LogicOperators.AND
+        leaf = branch.operations[0]
+        assert isinstance(leaf, OperatorNode)
+        assert (leaf.operator, leaf.field, leaf.value) == (
+            Operators.GTE,
+            "created_at",
+            "2025-06-01T00:00:00",
+        )
+
+    @pytest.mark.parametrize(
+        "document, expected",
+        [
+            ('{"eq": ["name", "John"]}', ("name", Operators.EQ, "John")),
+            ('{"neq": ["deleted_at", null]}', ("deleted_at", Operators.NEQ, None)),
+            ('{"in": ["id", [1, 2]]}', ("id", Operators.IN, [1, 2])),
+            ('{"gt": ["age", 18]}', ("age", Operators.GT, 18)),
+            ('{"gte": ["age", 18.5]}', ("age", Operators.GTE, 18.5)),
+            ('{"lt": ["age", 65]}', ("age", Operators.LT, 65)),
+            ('{"lte": ["age", 65]}', ("age", Operators.LTE, 65)),
+            ('{"regex": ["email", "^a"]}', ("email", Operators.REGEX, "^a")),
+            ('{"any": ["tags", ["a", "b"]]}', ("tags", Operators.ANY, ["a", "b"])),
+            ('{"all": ["tags", ["a"]]}', ("tags", Operators.ALL, ["a"])),
+            (
+                '{"contains": ["bio", "dev"]}',
+                ("bio", Operators.CONTAINS, ContainsData(value="dev")),
+            ),
+            (
+                '{"contains": ["bio", {"value": "dev", "ignore_case": true}]}',
+                (
+                    "bio",
+                    Operators.CONTAINS,
+                    ContainsData(value="dev", ignore_case=True),
+                ),
+            ),
+        ],
+    )
+    def test_operators(
+        self, document: str, expected: tuple[str, Operators, Any]
+    ) -> None:
+        (op,) = from_json(document)
+
+        assert isinstance(op, OperatorNode)
+        assert (op.field, op.operator, op.value) == expected
+
+    def test_elem_match(self) -> None:
+        (op,) = from_json(
+            '{"elem_match": ["items", [{"eq": ["sku", "a"]}, {"gt": ["qty", 2]}]]}'
+        )
+
+        assert isinstance(op, OperatorNode)
+        assert op.operator == Operators.ELEM_MATCH
+        assert [(item.operator, item.field, item.value) for item in op.value] == [
+            (Operators.EQ, "sku", "a"),
+            (Operators.GT, "qty", 2),
+        ]
+
+    def test_list_document(self) -> None:
+        result = from_json('[{"eq": ["a", 1]}, {"not": [{"in": ["b", [2]]}]}]')
+
+        assert len(result) == 2
+        assert isinstance(result[1], LogicOperatorNode)
+        assert result[1].operator == LogicOperators.NOT
+
+    @pytest.mark.parametrize(
+        "document",
+        [
+            '{"eq": ["name"]}',
+            '{"eq": ["", 1]}',
+            '{"unknown": ["name", 1]}',
+            '{"eq": ["a", 1], "gt": ["b", 2]}',
+            '{"in": ["id", []]}',
+            '{"in": ["id", 1]}',
+            '{"contains": ["bio", ""]}',
+            '{"regex": ["email", 1]}',
+            '{"any": ["tags", []]}',
+            '{"elem_match": ["items", []]}',
+            '{"elem_match": ["items", [1]]}',
+            '{"and": []}',
+            '{"or": [{"eq": ["a", 1]}, 3]}',
+            "3",
+            "{invalid",
+        ],
+    )
+    def test_invalid_documents(self, document: str) -> None:
+        with pytest.raises(ValidationError):
+            from_json(document)
+
+
+class TestFromJsonPerformance:
+    def test_large_document(self) -> None:
+        document = json.dumps(
+            {
+                "and": [
+                    {"or": [{"eq": [f"field_{i}", i]}, {"in": ["id", [i, i + 1]]}]}
+                    for i in range(1000)
+                ]
+            }
+        ).encode()
+
+        assert best_time(lambda: from_json(document)) < 0.1
+        (result,) = from_json(document)
+        assert isinstance(result, LogicOperatorNode)
+        assert len(result.operations) == 1000
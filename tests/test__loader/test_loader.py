@@ -0,0 +1,190 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from charter import BatchLoader
+from charter._backends.python import PythonBackend
+from charter._ops import Operation, structural_key
+from charter._predicate import Predicate
+
+p = Predicate()
+
+
+@dataclass
+class User:
+    id: int
+    team: str
+
+
+USERS = [User(i, "ab"[i % 2]) for i in range(10)]
+
+
+class FakeStore:
+    """Runs operations through the Python backend, recording every query."""
+
+    def __init__(self, records: list[Any]) -> None:
+        self.records = records
+        self.queries: list[list[Operation]] = []
+        self.backend = PythonBackend()
+
+    async def fetch(self, operations: list[Operation]) -> list[Any]:
+        self.queries.append(operations)
+        await asyncio.sleep(0)
+        predicate = self.backend.transform(operations)
+        return [record for record in self.records if predicate(record)]
+
+
+def run[T](main: Callable[[], Awaitable[T]]) -> T:
+    return asyncio.run(main())
+
+
+class TestBatchLoader:
+    def test_coalesces_lookups(self) -> None:
+        store = FakeStore(USERS)
+        loader = BatchLoader(store.fetch)
+
+        async def main() -> list[list[User]]:
+            return await asyncio.gather(
+                loader.load(p.eq("id", 3)),
+                loader.load(p.eq("id", 1)),
+                loader.load(p.in_("id", [1, 5, 42])),
+                loader.load(p.eq("id", 42)),
+                loader.load(p.eq("id", 3)),
+            )
+
+        results = run(main)
+        assert [[user.id for user in rows] for rows in results] == [
+            [3],
+            [1],
+            [1, 5],
+            [],
+            [3],
+        ]
+        assert [structural_key(op) for op in store.queries[0]] == [
+            structural_key(p.in_("id", [3, 1, 5, 42]))
+        ]
+        assert len(store.queries) == 1
+
+    def test_batches_per_field(self) -> None:
+        store = FakeStore(USERS)
+        loader = BatchLoader(store.fetch)
+
+        async def main() -> list[list[User]]:
+            return await asyncio.gather(
+                loader.load(p.eq("id", 0)),
+                loader.load(p.eq("team", "b")),
+                loader.load(p.eq("id", 2)),
+            )
+
+        results = run(main)
+        assert [len(rows) for rows in results] == [1, 5, 1]
+        assert len(store.queries) == 2
+
+    def test_sequential_lookups_are_not_merged(self) -> None:
+        store = FakeStore(USERS)
+        loader = BatchLoader(store.fetch)
+
+        async def main() -> None:
+            await loader.load(p.eq("id", 0))
+            await loader.load(p.eq("id", 1))
+
+        run(main)
+        assert len(store.queries) == 2
+
+    def test_window(self) -> None:
+        store = FakeStore(USERS)
+        loader = BatchLoader(store.fetch, window=0.01)
+
+        async def main() -> list[list[User]]:
+            first = asyncio.ensure_future(loader.load(p.eq("id", 0)))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(loader.load(p.eq("id", 1)))
+            return [await first, await second]
+
+        assert [len(rows) for rows in run(main)] == [1, 1]
+        assert len(store.queries) == 1
+
+    def test_max_batch_size(self) -> None:
+        store = FakeStore(USERS)
+        loader = BatchLoader(store.fetch, max_batch_size=3)
+
+        async def main() -> list[list[User]]:
+            return await asyncio.gather(*(loader.load(p.eq("id", i)) for i in range(7)))
+
+        results = run(main)
+        assert [[user.id for user in rows] for rows in results] == [
+            [i] for i in range(7)
+        ]
+        assert [len(query[0].value) for query in store.queries] == [3, 3, 1]  # type: ignore[union-attr]
+
+    @pytest.mark.parametrize(
+        "operation",
+        [p.gt("id", 7), p.eq("id", None), p.eq("id", [1]), p.not_(p.eq("id", 1))],
+    )
+    def test_other_operations_pass_through(self, operation: Operation) -> None:
+        store = FakeStore(USERS)
+        loader = BatchLoader(store.fetch)
+
+        run(lambda: loader.load(operation))
+        assert store.queries == [[operation]]
+
+    def test_accessor(self) -> None:
+        documents = [{"_id": i} for i in range(5)]
+        store = FakeStore(documents)
+
+        async def fetch(operations: list[Operation]) -> list[dict[str, int]]:
+            store.queries.append(operations)
+            return [d for d in documents if d["_id"] in operations[0].value]  # type: ignore[union-attr]
+
+        loader = BatchLoader(fetch, accessor=lambda document, field: document["_id"])
+
+        async def main() -> list[list[dict[str, int]]]:
+            return await asyncio.gather(
+                loader.load(p.eq("id", 1)), loader.load(p.eq("id", 4))
+            )
+
+        assert run(main) == [[{"_id": 1}], [{"_id": 4}]]
+
+    def test_error_reaches_every_caller(self) -> None:
+        async def fetch(operations: list[Operation]) -> list[Any]:
+            raise RuntimeError("connection lost")
+
+        loader: BatchLoader[Any] = BatchLoader(fetch)
+
+        async def main() -> list[Any]:
+            return await asyncio.gather(
+                loader.load(p.eq("id", 1)),
+                loader.load(p.eq("id", 2)),
+                return_exceptions=True,
+            )
+
+        errors = run(main)
+        assert all(isinstance(error, RuntimeError) for error in errors)
+
+    def test_cancelled_caller(self) -> None:
+        store = FakeStore(USERS)
+        loader = BatchLoader(store.fetch)
+
+        async def main() -> list[User]:
+            cancelled = asyncio.ensure_future(loader.load(p.eq("id", 1)))
+            kept = asyncio.ensure_future(loader.load(p.eq("id", 2)))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            return await kept
+
+        assert [user.id for user in run(main)] == [2]
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"window": -1}, "window must not be negative"),
+            ({"max_batch_size": 0}, "max_batch_size must be at least 1"),
+            ({"accessor": "index"}, "Unknown accessor: index"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: dict[str, Any], message: str) -> None:
+        with pytest.raises(ValueError, match=message):
+            BatchLoader(FakeStore([]).fetch, **kwargs)
@@ -2,7 +2,20 @@ from typing import Any
 
 import pytest
 
-from charter._ops import ContainsData, OperationType, Operator, Operators
+from charter._exc import UnsupportedOperationError
+from charter._ops import (
+    ContainsData,
+    LogicOperator,
+    LogicOperatorNode,
+    LogicOperators,
+    OperationType,
+    Operator,
+    OperatorNode,
+    Operators,
+    fold_operations,
+    validate_operation,
+)
+from charter._predicate import Predicate
 
 
 class TestOperator:
@@ -36,6 +49,25 @@ class TestOperator:
         with pytest.raises(TypeError):
             Operator(operator=Operators.CONTAINS, field="description", value=value)
 
+    @pytest.mark.parametrize("operator", [Operators.ANY, Operators.ALL])
+    def test_any_all_empty_sequence(self, operator: Operators) -> None:
+        with pytest.raises(ValueError):
+            Operator(operator=operator, field="tags", value=[])
+
+    def test_elem_match_single_operation(self) -> None:
+        inner = Operator(operator=Operators.EQ, field="sku", value="a")
+        op = Operator(operator=Operators.ELEM_MATCH, field="items", value=inner)
+        assert op.value == (inner,)
+
+    @pytest.mark.parametrize("value", [None, "sku", [1], [{"eq": ["sku", "a"]}]])
+    def test_elem_match_invalid_value(self, value: Any) -> None:
+        with pytest.raises(TypeError, match="requires operations"):
+            Operator(operator=Operators.ELEM_MATCH, field="items", value=value)
+
+    def test_elem_match_empty_value(self) -> None:
+        with pytest.raises(ValueError, match="requires an operation"):
+            Operator(operator=Operators.ELEM_MATCH, field="items", value=[])
+
     def test_operation_type(self) -> None:
         op = Operator(operator=Operators.EQ, field="name", value="test")
         assert op.operation_type == OperationType.OPERATOR
@@ -54,8 +86,6 @@ class TestContainsData:
 
 class TestLogicOperator:
     def test_init(self) -> None:
-        from charter._ops import LogicOperator, LogicOperators
-
         op = LogicOperator(
             operator=LogicOperators.AND,
             operations=[
@@ -67,14 +97,10 @@ class TestLogicOperator:
         assert len(op.operations) == 2
 
     def test_empty_operations(self) -> None:
-        from charter._ops import LogicOperator, LogicOperators
-
         with pytest.raises(ValueError):
             LogicOperator(operator=LogicOperators.OR, operations=[])
 
     def test_operation_type(self) -> None:
-        from charter._ops import LogicOperator, LogicOperators
-
         op = LogicOperator(
             operator=LogicOperators.OR,
             operations=[
@@ -82,3 +108,97 @@ class TestLogicOperator:
             ],
         )
         assert op.operation_type == OperationType.LOGIC
+
+
+class TestOperatorNode:
+    def test_init(self) -> None:
+        op = OperatorNode(Operators.EQ, "name", "test")
+        assert op.operator == Operators.EQ
+        assert op.field == "name"
+        assert op.value == "test"
+        assert op.operation_type == OperationType.OPERATOR
+
+    def test_slots(self) -> None:
+        op = OperatorNode(Operators.EQ, "name", "test")
+        assert not hasattr(op, "__dict__")
+        with pytest.raises(AttributeError):
+            op.extra = 1  # type: ignore[attr-defined]
+
+    def test_nested_in_logic_operator(self) -> None:
+        node = OperatorNode(Operators.GT, "age", 18)
+        op = LogicOperator(operator=LogicOperators.AND, operations=[node])
+        assert op.operations[0] is node
+
+
+class TestValidateOperation:
+    def test_returns_models_unchanged(self) -> None:
+        op = Operator(operator=Operators.EQ, field="name", value="test")
+        assert validate_operation(op) is op
+
+    def test_normalizes_contains(self) -> None:
+        node = LogicOperatorNode(
+            LogicOperators.AND,
+            [OperatorNode(Operators.CONTAINS, "bio", "dev")],
+        )
+        validated = validate_operation(node)
+        assert isinstance(validated, LogicOperatorNode)
+        inner = validated.operations[0]
+        assert isinstance(inner, OperatorNode)
+        assert inner.value == ContainsData(value="dev")
+
+    @pytest.mark.parametrize("field", ["", None])
+    def test_invalid_field(self, field: Any) -> None:
+        with pytest.raises(ValueError):
+            validate_operation(OperatorNode(Operators.EQ, field, "test"))
+
+    def test_in_non_sequence(self) -> None:
+        with pytest.raises(TypeError):
+            validate_operation(OperatorNode(Operators.IN, "tags", "value"))
+
+    def test_empty_operations(self) -> None:
+        with pytest.raises(ValueError):
+            validate_operation(LogicOperatorNode(LogicOperators.OR, []))
+
+    def test_invalid_nested_operation(self) -> None:
+        with pytest.raises(ValueError):
+            validate_operation(
+                LogicOperatorNode(
+                    LogicOperators.NOT,
+                    [OperatorNode(Operators.IN, "tags", [])],
+                )
+            )
+
+
+class TestFoldOperations:
+    def test_post_order(self) -> None:
+        p = Predicate(validate=False)
+        operations = [
+            p.or_(p.eq("a", 1), p.not_(p.eq("b", 2))),
+            p.eq("c", 3),
+        ]
+
+        visited: list[str] = []
+
+        def leaf(op: Any) -> str:
+            visited.append(op.field)
+            return str(op.field)
+
+        def logic(op: Any, results: list[str]) -> str:
+            visited.append(op.operator.value)
+            return f"{op.operator.value}({', '.join(results)})"
+
+        assert fold_operations(operations, leaf, logic) == ["or(a, not(b))", "c"]
+        assert visited == ["a", "b", "not", "or", "c"]
+
+    def test_invalid_logic_operator(self) -> None:
+        node = LogicOperatorNode("xor", [])  # type: ignore[arg-type]
+        with pytest.raises(
+            UnsupportedOperationError, match="Unsupported logic operator: xor"
+        ):
+            fold_operations([node], lambda op: op, lambda op, results: op)
+
+    def test_invalid_operation_type(self) -> None:
+        with pytest.raises(
+            UnsupportedOperationError, match="Unsupported operation type: None"
+        ):
+            fold_operations([{"eq": ["a", 1]}], lambda op: op, lambda op, r: op)  # type: ignore[list-item]
@@ -0,0 +1,249 @@
+import copy
+import pickle
+import random
+import time
+from typing import Any
+
+import pydantic
+import pytest
+
+from charter import Interner
+from charter._ops import (
+    LogicOperator,
+    LogicOperatorNode,
+    LogicOperators,
+    Operation,
+    Operator,
+    OperatorNode,
+    Operators,
+    operation_hash,
+    operations_equal,
+    structural_key,
+)
+from charter._predicate import Predicate
+from tests.test__optimize.test_push_down_not import random_tree
+
+
+class TestImmutability:
+    def test_operator_frozen(self) -> None:
+        op = Operator(operator=Operators.EQ, field="a", value=1)
+        with pytest.raises(pydantic.ValidationError, match="frozen"):
+            op.value = 2  # type: ignore[misc]
+
+    def test_logic_operator_frozen(self) -> None:
+        op = LogicOperator(
+            operator=LogicOperators.AND,
+            operations=[Operator(operator=Operators.EQ, field="a", value=1)],
+        )
+        assert isinstance(op.operations, tuple)
+        with pytest.raises(pydantic.ValidationError, match="frozen"):
+            op.operator = LogicOperators.OR  # type: ignore[misc]
+
+    @pytest.mark.parametrize(
+        "node, name",
+        [
+            (OperatorNode(Operators.EQ, "a", 1), "value"),
+            (
+                LogicOperatorNode(
+                    LogicOperators.AND, [OperatorNode(Operators.EQ, "a", 1)]
+                ),
+                "operations",
+            ),
+        ],
+    )
+    def test_node_frozen(self, node: Operation, name: str) -> None:
+        with pytest.raises(AttributeError, match="is immutable"):
+            setattr(node, name, None)
+        with pytest.raises(AttributeError, match="is immutable"):
+            delattr(node, name)
+
+    def test_logic_node_copies_operations(self) -> None:
+        operations: list[Operation] = [OperatorNode(Operators.EQ, "a", 1)]
+        node = LogicOperatorNode(LogicOperators.AND, operations)
+        operations.append(OperatorNode(Operators.EQ, "b", 2))
+        assert len(node.operations) == 1
+
+    @pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy])
+    def test_copy(self, clone: Any) -> None:
+        node = LogicOperatorNode(
+            LogicOperators.OR, [OperatorNode(Operators.IN, "a", [1])]
+        )
+        assert clone(node) == node
+
+    def test_pickle(self) -> None:
+        node = LogicOperatorNode(
+            LogicOperators.OR, [OperatorNode(Operators.IN, "a", [1])]
+        )
+        assert pickle.loads(pickle.dumps(node)) == node
+
+
+class TestHashing:
+    @pytest.mark.parametrize("validate", [True, False])
+    def test_equal_trees(self, validate: bool) -> None:
+        p = Predicate(validate=validate)
+        first = p.and_(p.eq("a", 1), p.or_(p.in_("b", [1, 2]), p.contains("c", "x")))
+        second = p.and_(p.eq("a", 1), p.or_(p.in_("b", [1, 2]), p.contains("c", "x")))
+        assert first is not second
+        assert first == second
+        assert hash(first) == hash(second)
+        assert {first: 1}[second] == 1
+
+    def test_nodes_and_models_are_equal(self) -> None:
+        model = Predicate().not_(Predicate().eq("a", 1))
+        node = Predicate(validate=False).not_(Predicate(validate=False).eq("a", 1))
+        assert model == node
+        assert hash(model) == hash(node)
+
+    def test_elem_match_operations(self) -> None:
+        model = Predicate().elem_match("a", Predicate().eq("b", 1))
+        nodes = Predicate(validate=False)
+        node = nodes.elem_match("a", nodes.eq("b", 1))
+        assert model == node
+        assert hash(model) == hash(node)
+
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            (1, 1.0),
+            (1, True),
+            (1, "1"),
+            ([1, 2], (1, 2)),
+            ([1, 2], [2, 1]),
+        ],
+    )
+    def test_values_are_distinguished(self, first: Any, second: Any) -> None:
+        p = Predicate(validate=False)
+        assert p.eq("a", first) != p.eq("a", second)
+
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            (
+                OperatorNode(Operators.EQ, "a", 1),
+                OperatorNode(Operators.NEQ, "a", 1),
+            ),
+            (
+                OperatorNode(Operators.EQ, "a", 1),
+                OperatorNode(Operators.EQ, "b", 1),
+            ),
+            (
+                LogicOperatorNode(
+                    LogicOperators.AND, [OperatorNode(Operators.EQ, "a", 1)]
+                ),
+                LogicOperatorNode(
+                    LogicOperators.OR, [OperatorNode(Operators.EQ, "a", 1)]
+                ),
+            ),
+            (
+                LogicOperatorNode(
+                    LogicOperators.AND, [OperatorNode(Operators.EQ, "a", 1)]
+                ),
+                OperatorNode(Operators.EQ, "a", 1),
+            ),
+            (
+                OperatorNode(
+                    Operators.ELEM_MATCH, "a", (OperatorNode(Operators.EQ, "b", 1),)
+                ),
+                OperatorNode(
+                    Operators.ELEM_MATCH, "a", (OperatorNode(Operators.EQ, "b", 2),)
+                ),
+            ),
+        ],
+    )
+    def test_different_trees(self, first: Operation, second: Operation) -> None:
+        assert first != second
+        assert not operations_equal(first, second)
+
+    def test_other_types(self) -> None:
+        assert OperatorNode(Operators.EQ, "a", 1) != ("eq", "a", 1)
+        assert not operations_equal(OperatorNode(Operators.EQ, "a", 1), None)
+
+    def test_unhashable_value(self) -> None:
+        first = OperatorNode(Operators.EQ, "a", _Unhashable())
+        with pytest.raises(TypeError):
+            hash(first)
+        assert first == first
+        assert first != OperatorNode(Operators.EQ, "a", 1)
+
+    def test_matches_structural_key(self) -> None:
+        rng = random.Random(0)
+        trees = [random_tree(rng, 3) for _ in range(300)]
+        for first, second in zip(trees, trees[1:], strict=False):
+            same = structural_key(first) == structural_key(second)
+            assert (first == second) is same
+            if same:
+                assert hash(first) == hash(second)
+
+    def test_deep_tree(self) -> None:
+        def build() -> Operation:
+            operation: Operation = OperatorNode(Operators.EQ, "a", 0)
+            for i in range(10000):
+                operation = LogicOperatorNode(
+                    LogicOperators.NOT,
+                    [
+                        LogicOperatorNode(
+                            LogicOperators.AND,
+                            [operation, OperatorNode(Operators.GT, "a", i)],
+                        )
+                    ],
+                )
+            return operation
+
+        first, second = build(), build()
+        assert hash(first) == hash(second)
+        assert first == second
+
+    def test_hash_is_cached(self) -> None:
+        p = Predicate(validate=False)
+        shared = p.and_(*(p.eq(f"f{i}", i) for i in range(10000)))
+        hash(shared)
+
+        start_time = time.perf_counter()
+        for i in range(1000):
+            operation_hash(p.or_(shared, p.eq("a", i)))
+        elapsed = time.perf_counter() - start_time
+
+        assert elapsed < 0.1
+
+
+class _Unhashable:
+    __hash__ = None  # type: ignore[assignment]
+
+
+class TestInterner:
+    def test_predicate_shares_nodes(self) -> None:
+        interner = Interner()
+        p = Predicate(interner=interner)
+        first = p.and_(p.eq("tenant_id", 7), p.gt("age", 18))
+        second = p.and_(p.eq("tenant_id", 7), p.gt("age", 18))
+        assert first is second
+        assert p.eq("tenant_id", 7) is first.operations[0]  # type: ignore[union-attr]
+        assert len(interner) == 3
+
+    def test_intern_tree(self) -> None:
+        interner = Interner()
+        p = Predicate(validate=False)
+        leaf = interner.intern(p.eq("a", 1))
+        tree = interner.intern(p.or_(p.eq("a", 1), p.not_(p.eq("a", 1))))
+
+        assert tree.operations[0] is leaf  # type: ignore[union-attr]
+        assert tree.operations[1].operations[0] is leaf  # type: ignore[union-attr]
+        assert interner.intern(p.or_(p.eq("a", 1), p.not_(p.eq("a", 1)))) is tree
+        assert interner.intern(tree) is tree
+
+    def test_untouched_nodes_are_kept(self) -> None:
+        p = Predicate(validate=False)
+        tree = p.and_(p.eq("a", 1), p.eq("b", 2))
+        assert Interner().intern(tree) is tree
+
+    def test_unhashable_values(self) -> None:
+        interner = Interner()
+        node = OperatorNode(Operators.EQ, "a", _Unhashable())
+        assert interner.intern(node) is node
+        assert len(interner) == 0
+
+    def test_clear(self) -> None:
+        interner = Interner()
+        interner.intern(OperatorNode(Operators.EQ, "a", 1))
+        interner.clear()
+        assert len(interner) == 0
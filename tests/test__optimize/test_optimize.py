@@ -0,0 +1,234 @@
+import datetime
+import random
+import time
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from charter import optimize
+from charter._backends.python import PythonBackend
+from charter._ops import (
+    LogicOperators,
+    Operation,
+    OperationType,
+    Operators,
+    Param,
+    structural_key,
+)
+from charter._predicate import Predicate
+
+p = Predicate()
+
+
+def keys(operations: list[Operation]) -> list[Any]:
+    return [structural_key(op) for op in operations]
+
+
+def depth(operation: Operation) -> int:
+    if operation.operation_type is OperationType.OPERATOR:
+        return 1
+    return 1 + max(depth(child) for child in operation.operations)  # type: ignore[union-attr]
+
+
+class TestOptimize:
+    @pytest.mark.parametrize(
+        "operations, expected",
+        [
+            ([], []),
+            ([p.eq("a", 1)], [p.eq("a", 1)]),
+            (
+                [p.and_(p.and_(p.eq("a", 1), p.eq("b", 2)), p.eq("c", 3))],
+                [p.eq("a", 1), p.eq("b", 2), p.eq("c", 3)],
+            ),
+            (
+                [p.or_(p.or_(p.eq("a", 1), p.eq("b", 2)), p.eq("c", 3))],
+                [p.or_(p.eq("a", 1), p.eq("b", 2), p.eq("c", 3))],
+            ),
+            (
+                [p.not_(p.and_(p.eq("a", 1), p.eq("b", 2)))],
+                [p.not_(p.eq("a", 1), p.eq("b", 2))],
+            ),
+            (
+                [p.or_(p.and_(p.eq("a", 1), p.eq("b", 2)), p.eq("c", 3))],
+                [p.or_(p.and_(p.eq("a", 1), p.eq("b", 2)), p.eq("c", 3))],
+            ),
+            ([p.and_(p.eq("a", 1))], [p.eq("a", 1)]),
+            ([p.or_(p.eq("a", 1))], [p.eq("a", 1)]),
+            ([p.not_(p.eq("a", 1))], [p.not_(p.eq("a", 1))]),
+        ],
+    )
+    def test_flatten_and_fold(
+        self, operations: list[Operation], expected: list[Operation]
+    ) -> None:
+        assert keys(optimize(operations)) == keys(expected)
+
+    @pytest.mark.parametrize(
+        "operations, expected",
+        [
+            ([p.eq("a", 1), p.eq("a", 1)], [p.eq("a", 1)]),
+            ([p.eq("a", 1), p.eq("a", 1.0)], [p.eq("a", 1), p.eq("a", 1.0)]),
+            (
+                [p.or_(p.gt("a", 1), p.not_(p.eq("b", 2)), p.not_(p.eq("b", 2)))],
+                [p.or_(p.gt("a", 1), p.not_(p.eq("b", 2)))],
+            ),
+            ([p.or_(p.eq("a", 1), p.eq("a", 1))], [p.eq("a", 1)]),
+        ],
+    )
+    def test_dedupe(
+        self, operations: list[Operation], expected: list[Operation]
+    ) -> None:
+        assert keys(optimize(operations)) == keys(expected)
+
+    @pytest.mark.parametrize(
+        "operations, expected",
+        [
+            ([p.or_(p.eq("a", 1), p.eq("a", 2))], [p.in_("a", [1, 2])]),
+            (
+                [p.or_(p.eq("a", 1), p.eq("b", 2), p.in_("a", [2, 3, 1]))],
+                [p.or_(p.in_("a", [1, 2, 3]), p.eq("b", 2))],
+            ),
+            (
+                [p.or_(p.eq("a", None), p.eq("a", 1))],
+                [p.or_(p.eq("a", None), p.eq("a", 1))],
+            ),
+            (
+                [p.or_(p.eq("a", Param("a")), p.eq("a", 1))],
+                [p.or_(p.eq("a", Param("a")), p.eq("a", 1))],
+            ),
+            (
+                [p.or_(p.eq("a", 1), p.or_(p.eq("a", 2), p.eq("a", 3)))],
+                [p.in_("a", [1, 2, 3])],
+            ),
+            (
+                [p.and_(p.eq("a", 1), p.eq("a", 2))],
+                [p.eq("a", 1), p.eq("a", 2)],
+            ),
+        ],
+    )
+    def test_merge_in(
+        self, operations: list[Operation], expected: list[Operation]
+    ) -> None:
+        assert keys(optimize(operations)) == keys(expected)
+
+    @pytest.mark.parametrize(
+        "operations, expected",
+        [
+            (
+                [p.gt("a", 1), p.eq("b", 1), p.gt("a", 5), p.lt("a", 10)],
+                [p.gt("a", 5), p.lt("a", 10), p.eq("b", 1)],
+            ),
+            ([p.gte("a", 5), p.gt("a", 5)], [p.gt("a", 5)]),
+            ([p.gt("a", 5), p.gte("a", 5)], [p.gt("a", 5)]),
+            ([p.lte("a", 5), p.lt("a", 5.0)], [p.lt("a", 5.0)]),
+            ([p.lt("a", 10), p.lte("a", 3)], [p.lte("a", 3)]),
+            ([p.lt("a", 10), p.gt("a", 3)], [p.gt("a", 3), p.lt("a", 10)]),
+            ([p.gt("a", "b"), p.gt("a", "c")], [p.gt("a", "b"), p.gt("a", "c")]),
+            ([p.gte("a", "a"), p.gte("a", "B")], [p.gte("a", "a"), p.gte("a", "B")]),
+            (
+                [
+                    p.gt("a", datetime.date(2025, 1, 1)),
+                    p.gt("a", datetime.date(2025, 6, 1)),
+                ],
+                [p.gt("a", datetime.date(2025, 6, 1))],
+            ),
+            (
+                [p.lt("a", Decimal("1.5")), p.lt("a", Decimal(1))],
+                [p.lt("a", Decimal(1))],
+            ),
+            ([p.gt("a", 1), p.gt("a", "c")], [p.gt("a", 1), p.gt("a", "c")]),
+            ([p.gt("a", True), p.gt("a", 2)], [p.gt("a", True), p.gt("a", 2)]),
+            (
+                [p.gt("a", Param("a")), p.gt("a", 1)],
+                [p.gt("a", Param("a")), p.gt("a", 1)],
+            ),
+            (
+                [p.or_(p.gt("a", 1), p.gt("a", 5))],
+                [p.or_(p.gt("a", 1), p.gt("a", 5))],
+            ),
+            (
+                [p.not_(p.gt("a", 1), p.gt("a", 5))],
+                [p.not_(p.gt("a", 5))],
+            ),
+        ],
+    )
+    def test_merge_ranges(
+        self, operations: list[Operation], expected: list[Operation]
+    ) -> None:
+        assert keys(optimize(operations)) == keys(expected)
+
+    def test_rewritten_nodes_are_slotted(self) -> None:
+        result = optimize([p.or_(p.eq("a", 1), p.eq("a", 2), p.gt("b", 1))])
+
+        assert len(result) == 1
+        assert result[0].operator == LogicOperators.OR
+        merged = result[0].operations[0]  # type: ignore[union-attr]
+        assert merged.operator == Operators.IN
+        assert not hasattr(merged, "__dict__")
+
+    def test_unhashable_values_are_kept(self) -> None:
+        class Unhashable:
+            __hash__ = None  # type: ignore[assignment]
+
+        value = Unhashable()
+        operations = [p.or_(p.eq("a", value), p.eq("a", value))]
+
+        result = optimize(operations)
+
+        assert result[0].operator == Operators.IN
+        assert result[0].value == [value, value]
+
+    def test_deeply_nested_and_is_flattened(self) -> None:
+        operation: Operation = p.eq("base", "value")
+        for i in range(100):
+            operation = p.and_(operation, p.eq(f"field_{i}", i))
+
+        result = optimize([operation])
+
+        assert len(result) == 101
+        assert all(depth(op) == 1 for op in result)
+
+    def test_equivalent_on_random_trees(self) -> None:
+        rng = random.Random(0)
+        records = [
+            {"a": rng.choice([None, 0, 1, 2, 3]), "b": rng.choice([None, 0, 1, 2, 3])}
+            for _ in range(200)
+        ]
+
+        def leaf() -> Operation:
+            field = rng.choice("ab")
+            match rng.randrange(4):
+                case 0:
+                    return p.eq(field, rng.choice([None, 0, 1, 2, 3]))
+                case 1:
+                    return p.in_(field, rng.sample(range(4), 2))
+                case 2:
+                    return p.gt(field, rng.randrange(4))
+                case _:
+                    return p.lte(field, rng.randrange(4))
+
+        def tree(level: int) -> Operation:
+            if level == 0 or rng.random() < 0.3:
+                return leaf()
+            operator = rng.choice([p.and_, p.or_, p.not_])
+            return operator(*(tree(level - 1) for _ in range(rng.randint(1, 4))))
+
+        backend = PythonBackend(accessor="item")
+        for _ in range(300):
+            operations = [tree(4) for _ in range(rng.randint(1, 3))]
+            original = backend.transform(operations)
+            optimized = backend.transform(optimize(operations))
+            assert [original(r) for r in records] == [optimized(r) for r in records]
+
+
+class TestOptimizePerformance:
+    def test_large_flat_or_of_eq(self) -> None:
+        operation = p.or_(*(p.eq("id", i) for i in range(10000)))
+
+        start_time = time.time()
+        result = optimize([operation])
+        end_time = time.time()
+
+        assert end_time - start_time < 0.5
+        assert result[0].operator == Operators.IN
+        assert result[0].value == list(range(10000))
@@ -0,0 +1,253 @@
+import itertools
+import random
+import time
+from typing import Any, cast
+
+import pytest
+
+from charter import push_down_not
+from charter._backends.python import PythonBackend
+from charter._ops import (
+    LogicOperator,
+    LogicOperators,
+    Operation,
+    OperationType,
+    Operator,
+    OperatorNode,
+    Operators,
+    structural_key,
+)
+from charter._predicate import Predicate
+
+p = Predicate()
+
+
+def random_tree(rng: random.Random, level: int) -> Operation:
+    if level == 0 or rng.random() < 0.3:
+        field = rng.choice("ab")
+        match rng.randrange(6):
+            case 0:
+                return p.eq(field, rng.choice([None, 0, 1, 2, 3]))
+            case 1:
+                return p.neq(field, rng.choice([None, 0, 1, 2, 3]))
+            case 2:
+                return p.in_(field, rng.sample(range(4), 2))
+            case 3:
+                return p.gt(field, rng.randrange(4))
+            case 4:
+                return p.gte(field, rng.randrange(4))
+            case _:
+                return p.lt(field, rng.randrange(4))
+    operator = rng.choice([p.and_, p.or_, p.not_, p.not_])
+    return operator(*(random_tree(rng, level - 1) for _ in range(rng.randint(1, 3))))
+
+
+def negated_operations(operations: list[Operation]) -> list[Operation]:
+    """Collect the operations wrapped in ``not``, without recursion."""
+    negated: list[Operation] = []
+    stack = list(operations)
+    while stack:
+        operation = stack.pop()
+        if operation.operation_type is OperationType.LOGIC:
+            if operation.operator == LogicOperators.NOT:  # type: ignore[union-attr]
+                negated.extend(operation.operations)  # type: ignore[union-attr]
+            stack.extend(operation.operations)  # type: ignore[union-attr]
+    return negated
+
+
+def multikey_match(operation: Operation, record: dict[str, Any]) -> bool:
+    """Evaluate like MongoDB: an operator matches an array if any element does.
+
+    A missing field reads as null, and ``neq`` matches where ``eq`` does not.
+    """
+    if operation.operation_type is OperationType.LOGIC:
+        logic = cast(LogicOperator, operation)
+        results = [multikey_match(op, record) for op in logic.operations]
+        match logic.operator:
+            case LogicOperators.AND:
+                return all(results)
+            case LogicOperators.OR:
+                return any(results)
+            case _:
+                return not all(results)
+
+    op = cast(Operator, operation)
+    value = record.get(op.field)
+    if op.operator == Operators.NEQ:
+        return not multikey_match(
+            OperatorNode(Operators.EQ, op.field, op.value), record
+        )
+    items = value if isinstance(value, list) else [value]
+    match op.operator:
+        case Operators.EQ:
+            return value == op.value or op.value in items
+        case Operators.IN:
+            return any(item in op.value for item in items)
+        case Operators.GT:
+            return any(item is not None and item > op.value for item in items)
+        case Operators.GTE:
+            return any(item is not None and item >= op.value for item in items)
+        case Operators.LT:
+            return any(item is not None and item < op.value for item in items)
+        case Operators.LTE:
+            return any(item is not None and item <= op.value for item in items)
+        case _:
+            raise NotImplementedError(op.operator)
+
+
+class TestPushDownNot:
+    @pytest.mark.parametrize(
+        "operations, expected",
+        [
+            ([], []),
+            ([p.eq("a", 1)], [p.eq("a", 1)]),
+            ([p.not_(p.eq("a", 1))], [p.neq("a", 1)]),
+            ([p.not_(p.neq("a", 1))], [p.eq("a", 1)]),
+            ([p.not_(p.gt("a", 1))], [p.lte("a", 1)]),
+            ([p.not_(p.gte("a", 1))], [p.lt("a", 1)]),
+            ([p.not_(p.lt("a", 1))], [p.gte("a", 1)]),
+            ([p.not_(p.lte("a", 1))], [p.gt("a", 1)]),
+            ([p.not_(p.eq("a", None))], [p.neq("a", None)]),
+            ([p.not_in("a", [1, 2])], [p.not_in("a", [1, 2])]),
+            ([p.not_(p.contains("a", "x"))], [p.not_(p.contains("a", "x"))]),
+            ([p.not_(p.not_(p.eq("a", 1)))], [p.eq("a", 1)]),
+            (
+                [p.not_(p.and_(p.eq("a", 1), p.gt("b", 2)))],
+                [p.or_(p.neq("a", 1), p.lte("b", 2))],
+            ),
+            (
+                [p.not_(p.eq("a", 1), p.gt("b", 2))],
+                [p.or_(p.neq("a", 1), p.lte("b", 2))],
+            ),
+            (
+                [p.not_(p.or_(p.eq("a", 1), p.not_in("b", [2])))],
+                [p.and_(p.neq("a", 1), p.in_("b", [2]))],
+            ),
+        ],
+    )
+    def test_sql(self, operations: list[Operation], expected: list[Operation]) -> None:
+        result = push_down_not(operations, null_semantics="sql")
+        assert [structural_key(op) for op in result] == [
+            structural_key(op) for op in expected
+        ]
+
+    @pytest.mark.parametrize(
+        "operations, expected",
+        [
+            ([p.not_(p.gt("a", 1))], [p.or_(p.lte("a", 1), p.eq("a", None))]),
+            ([p.not_(p.neq("a", 1))], [p.or_(p.eq("a", 1), p.eq("a", None))]),
+            ([p.not_(p.eq("a", None))], [p.neq("a", None)]),
+            ([p.not_(p.neq("a", None))], [p.eq("a", None)]),
+            ([p.not_in("a", [1])], [p.not_in("a", [1])]),
+        ],
+    )
+    def test_boolean(
+        self, operations: list[Operation], expected: list[Operation]
+    ) -> None:
+        result = push_down_not(operations, null_semantics="boolean")
+        assert [structural_key(op) for op in result] == [
+            structural_key(op) for op in expected
+        ]
+
+    @pytest.mark.parametrize(
+        "operations, expected",
+        [
+            ([p.not_(p.eq("a", 1))], [p.neq("a", 1)]),
+            ([p.not_(p.neq("a", 1))], [p.eq("a", 1)]),
+            ([p.not_(p.neq("a", None))], [p.eq("a", None)]),
+            ([p.not_(p.gt("a", 1))], [p.not_(p.gt("a", 1))]),
+            (
+                [p.not_(p.or_(p.eq("a", 1), p.lt("b", 2)))],
+                [p.and_(p.neq("a", 1), p.not_(p.lt("b", 2)))],
+            ),
+        ],
+    )
+    def test_mongo(
+        self, operations: list[Operation], expected: list[Operation]
+    ) -> None:
+        result = push_down_not(operations, null_semantics="mongo")
+        assert [structural_key(op) for op in result] == [
+            structural_key(op) for op in expected
+        ]
+
+    def test_mongo_equivalent_on_random_trees(self) -> None:
+        rng = random.Random(0)
+        values: list[Any] = [None, 0, 1, 2, 3, [], [1, 3], [None, 2]]
+        records = [{"a": a, "b": b} for a, b in itertools.product(values, repeat=2)]
+        records += [{"a": value} for value in values] + [{}]
+
+        for _ in range(300):
+            operations = [random_tree(rng, 4) for _ in range(rng.randint(1, 3))]
+            result = push_down_not(operations, null_semantics="mongo")
+            for record in records:
+                assert all(multikey_match(op, record) for op in operations) == all(
+                    multikey_match(op, record) for op in result
+                )
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            p.not_(p.gt("a", 1)),
+            p.not_(p.neq("a", 1)),
+            p.not_(p.or_(p.lte("a", 0), p.eq("b", 1))),
+        ],
+    )
+    def test_array_fields(self, operation: Operation) -> None:
+        records = [
+            {"a": [0, 5], "b": 1},
+            {"a": [0], "b": 2},
+            {"a": [None, 5], "b": 2},
+            {"a": [], "b": None},
+            {"a": 3, "b": 2},
+            {"a": None, "b": 2},
+        ]
+        (result,) = push_down_not(
+            [operation], null_semantics="boolean", array_fields={"a"}
+        )
+        assert all(op.field == "a" for op in negated_operations([result]))
+        assert [multikey_match(result, r) for r in records] == [
+            multikey_match(operation, r) for r in records
+        ]
+
+        # Inverting the operators on ``a`` changes the result.
+        (inverted,) = push_down_not([operation], null_semantics="boolean")
+        assert [multikey_match(inverted, r) for r in records] != [
+            multikey_match(operation, r) for r in records
+        ]
+
+    def test_unknown_null_semantics(self) -> None:
+        with pytest.raises(ValueError, match="Unknown null semantics: ternary"):
+            push_down_not([], null_semantics="ternary")  # type: ignore[arg-type]
+
+    def test_equivalent_on_random_trees(self) -> None:
+        rng = random.Random(0)
+        records = [
+            {"a": rng.choice([None, 0, 1, 2, 3]), "b": rng.choice([None, 0, 1, 2, 3])}
+            for _ in range(200)
+        ]
+
+        backend = PythonBackend(accessor="item")
+        for _ in range(300):
+            operations = [random_tree(rng, 4) for _ in range(rng.randint(1, 3))]
+            result = push_down_not(operations, null_semantics="boolean")
+            original = backend.transform(operations)
+            rewritten = backend.transform(result)
+            assert [original(r) for r in records] == [rewritten(r) for r in records]
+            assert all(
+                op.operation_type is OperationType.OPERATOR
+                for op in negated_operations(result)
+            )
+
+
+class TestPushDownNotPerformance:
+    def test_deep_tree(self) -> None:
+        operation: Operation = p.eq("a", 0)
+        for i in range(10000):
+            operation = p.not_(p.and_(operation, p.gt("a", i)))
+
+        start_time = time.time()
+        (result,) = push_down_not([operation], null_semantics="sql")
+        end_time = time.time()
+
+        assert end_time - start_time < 1.0
+        assert negated_operations([result]) == []
@@ -0,0 +1,174 @@
+import base64
+import datetime
+import random
+import uuid
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from charter import Keyset, SortKey
+from charter._backends.python import PythonBackend
+from charter._exc import ParseError
+from charter._ops import Operation, structural_key
+from charter._predicate import Predicate
+
+p = Predicate()
+
+
+def paginate(
+    keyset: Keyset, records: list[dict[str, Any]], page_size: int
+) -> list[dict[str, Any]]:
+    """Page through ``records`` in memory, following the cursors."""
+
+    def sort_key(record: dict[str, Any]) -> tuple[Any, ...]:
+        return tuple(
+            -record[key.field] if key.descending else record[key.field]
+            for key in keyset.keys
+        )
+
+    backend = PythonBackend(accessor="item")
+    seen: list[dict[str, Any]] = []
+    cursor = None
+    while True:
+        predicate = backend.transform(keyset.filter([p.neq("a", -1)], cursor))
+        page = sorted(filter(predicate, records), key=sort_key)[:page_size]
+        if not page:
+            return seen
+        seen.extend(page)
+        cursor = keyset.encode([page[-1][key.field] for key in keyset.keys])
+
+
+class TestKeyset:
+    def test_keys(self) -> None:
+        keyset = Keyset("-created_at", "id", SortKey("name", descending=True))
+        assert keyset.keys == (
+            SortKey("created_at", descending=True),
+            SortKey("id"),
+            SortKey("name", descending=True),
+        )
+
+    def test_requires_keys(self) -> None:
+        with pytest.raises(ValueError, match="at least one sort key"):
+            Keyset()
+
+    @pytest.mark.parametrize(
+        "keys, values, expected",
+        [
+            (["id"], [5], p.gt("id", 5)),
+            (["-id"], [5], p.lt("id", 5)),
+            (
+                ["-a", "id"],
+                [1, 5],
+                p.and_(
+                    p.lte("a", 1),
+                    p.or_(p.lt("a", 1), p.and_(p.eq("a", 1), p.gt("id", 5))),
+                ),
+            ),
+            (
+                ["a", "b", "id"],
+                [1, 2, 3],
+                p.and_(
+                    p.gte("a", 1),
+                    p.or_(
+                        p.gt("a", 1),
+                        p.and_(p.eq("a", 1), p.gt("b", 2)),
+                        p.and_(p.eq("a", 1), p.eq("b", 2), p.gt("id", 3)),
+                    ),
+                ),
+            ),
+        ],
+    )
+    def test_after(
+        self, keys: list[str], values: list[Any], expected: Operation
+    ) -> None:
+        assert structural_key(Keyset(*keys).after(values)) == structural_key(expected)
+
+    @pytest.mark.parametrize(
+        "values, message",
+        [([1], "Expected 2 sort key values, got 1"), ([1, None], "must not be None")],
+    )
+    def test_invalid_values(self, values: list[Any], message: str) -> None:
+        keyset = Keyset("a", "id")
+        with pytest.raises(ValueError, match=message):
+            keyset.after(values)
+        with pytest.raises(ValueError, match=message):
+            keyset.encode(values)
+
+    @pytest.mark.parametrize("keys", [["a", "id"], ["-a", "id"], ["-a", "b", "-id"]])
+    def test_pages_cover_every_record_once(self, keys: list[str]) -> None:
+        rng = random.Random(0)
+        records = [
+            {"a": rng.randrange(5), "b": rng.randrange(3), "id": i} for i in range(200)
+        ]
+        keyset = Keyset(*keys)
+
+        seen = paginate(keyset, records, page_size=7)
+
+        assert sorted(r["id"] for r in seen) == list(range(200))
+        expected_order = sorted(
+            records,
+            key=lambda r: tuple(
+                -r[key.field] if key.descending else r[key.field] for key in keyset.keys
+            ),
+        )
+        assert seen == expected_order
+
+
+class TestCursor:
+    def setup_method(self) -> None:
+        self.keyset = Keyset("-created_at", "id")
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            1,
+            1.5,
+            "a",
+            True,
+            datetime.datetime(2025, 6, 1, 12, 30, tzinfo=datetime.UTC),
+            datetime.date(2025, 6, 1),
+            Decimal("1.10"),
+            uuid.UUID(int=1),
+            b"\x00\xff",
+        ],
+    )
+    def test_round_trip(self, value: Any) -> None:
+        cursor = self.keyset.encode([value, 1])
+        assert "=" not in cursor
+        decoded = self.keyset.decode(cursor)
+        assert decoded == [value, 1]
+        assert type(decoded[0]) is type(value)
+
+    def test_unsupported_value(self) -> None:
+        with pytest.raises(TypeError, match="Cursor value of type"):
+            self.keyset.encode([object(), 1])
+
+    @pytest.mark.parametrize(
+        "cursor",
+        ["", "!!!", "bm90IGpzb24", "W10", "eyJrIjpbIi1jcmVhdGVkX2F0IiwiaWQiXX0"],
+    )
+    def test_invalid(self, cursor: str) -> None:
+        with pytest.raises(ParseError, match="Invalid cursor"):
+            self.keyset.decode(cursor)
+
+    @pytest.mark.parametrize("values", ["[1]", "[1,null]", "{}"])
+    def test_tampered_values(self, values: str) -> None:
+        payload = f'{{"k":["-created_at","id"],"v":{values}}}'.encode()
+        cursor = base64.urlsafe_b64encode(payload).decode()
+        with pytest.raises(ParseError, match="Invalid cursor"):
+            self.keyset.decode(cursor)
+
+    def test_other_sort_order(self) -> None:
+        cursor = Keyset("created_at", "id").encode([1, 2])
+        with pytest.raises(ParseError, match="does not match the sort order"):
+            self.keyset.decode(cursor)
+
+    def test_filter(self) -> None:
+        operations = [p.eq("role", "a")]
+        assert self.keyset.filter(operations, None) == operations
+
+        result = self.keyset.filter(operations, self.keyset.encode([5, 1]))
+        assert [structural_key(op) for op in result] == [
+            structural_key(op) for op in [p.eq("role", "a"), self.keyset.after([5, 1])]
+        ]
@@ -0,0 +1,103 @@
+import warnings
+from collections.abc import Sequence
+
+import pytest
+
+from charter import IndexPlanner, SargabilityWarning
+from charter._backends.cache import CachedBackend
+from charter._backends.interface import Backend
+from charter._ops import Operation, Operator, Operators, structural_key
+from charter._predicate import Predicate
+
+p = Predicate()
+
+
+class RegexBackend(Backend[None]):
+    def transform(self, operations: Sequence[Operation]) -> None:
+        return None
+
+    def non_sargable_reason(self, op: Operator) -> str | None:
+        if op.operator == Operators.REGEX:
+            return "renders a regex"
+        return None
+
+
+def keys(operations: list[Operation]) -> list[object]:
+    return [structural_key(op) for op in operations]
+
+
+class TestIndexPlanner:
+    def setup_method(self) -> None:
+        self.planner = IndexPlanner([["role", "age"], ["id"]])
+
+    @pytest.mark.parametrize(
+        "operations, expected",
+        [
+            ([], []),
+            (
+                [p.contains("name", "a"), p.gt("role", "a"), p.eq("role", "b")],
+                [p.eq("role", "b"), p.gt("role", "a"), p.contains("name", "a")],
+            ),
+            (
+                [p.eq("name", "a"), p.eq("age", 1), p.in_("id", [1, 2])],
+                [p.in_("id", [1, 2]), p.eq("age", 1), p.eq("name", "a")],
+            ),
+            (
+                [p.gt("age", 1), p.or_(p.eq("id", 1)), p.lt("id", 9)],
+                [p.lt("id", 9), p.gt("age", 1), p.or_(p.eq("id", 1))],
+            ),
+            (
+                [p.or_(p.eq("name", "a"), p.eq("id", 1))],
+                [p.or_(p.eq("name", "a"), p.eq("id", 1))],
+            ),
+            (
+                [p.or_(p.and_(p.eq("name", "a"), p.eq("id", 1)), p.eq("age", 1))],
+                [p.or_(p.and_(p.eq("id", 1), p.eq("name", "a")), p.eq("age", 1))],
+            ),
+            (
+                [p.not_(p.eq("name", "a"), p.eq("role", "a"))],
+                [p.not_(p.eq("role", "a"), p.eq("name", "a"))],
+            ),
+        ],
+    )
+    def test_plan(self, operations: list[Operation], expected: list[Operation]) -> None:
+        assert keys(self.planner.plan(operations)) == keys(expected)
+
+    def test_untouched_nodes_are_kept(self) -> None:
+        operation = p.and_(p.eq("id", 1), p.eq("name", "a"))
+        (planned,) = self.planner.plan([operation])
+        assert planned is operation
+
+    def test_from_mongo(self) -> None:
+        planner = IndexPlanner.from_mongo(
+            [[("age", 1), ("name", -1)], [("body", "text"), ("id", 1)], [("_id", 1)]]
+        )
+        assert planner.indexes == (("age", "name"), ("_id",))
+
+    def test_from_mongo_index_information(self) -> None:
+        planner = IndexPlanner.from_mongo(
+            {
+                "_id_": {"key": [("_id", 1)], "v": 2},
+                "role_1_age_-1": {"key": [("role", 1), ("age", -1)], "v": 2},
+            }
+        )
+        assert planner.indexes == (("_id",), ("role", "age"))
+
+    def test_warnings(self) -> None:
+        operations = [p.regex("name", "a"), p.eq("name", "a"), p.regex("role", "b")]
+        with pytest.warns(SargabilityWarning) as record:
+            self.planner.plan(operations, CachedBackend(RegexBackend()))
+
+        assert [(w.message.field, w.message.reason) for w in record] == [  # type: ignore[union-attr]
+            ("name", "renders a regex"),
+            ("role", "renders a regex"),
+        ]
+        assert str(record[0].message) == (
+            "Operator 'regex' on field 'name' renders a regex"
+        )
+        assert record[0].filename == __file__
+
+    def test_no_warnings_without_backend(self) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.planner.plan([p.regex("name", "a")])
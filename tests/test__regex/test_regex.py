@@ -0,0 +1,72 @@
+import random
+import re
+
+import pytest
+
+from charter._regex import RegexPrefix, literal_prefix
+
+
+class TestLiteralPrefix:
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            ("^ACME-2025", RegexPrefix("ACME-2025", "ACME-2026", True)),
+            (r"\AACME", RegexPrefix("ACME", "ACMF", True)),
+            (r"^a\.b", RegexPrefix("a.b", "a.c", True)),
+            ("^ACME-2025$", RegexPrefix("ACME-2025", "ACME-2026", False)),
+            ("^abc*", RegexPrefix("ab", "ac", False)),
+            ("^abc?", RegexPrefix("ab", "ac", False)),
+            ("^abc{0,2}", RegexPrefix("ab", "ac", False)),
+            ("^abc+d", RegexPrefix("abc", "abd", False)),
+            ("^ab.d", RegexPrefix("ab", "ac", False)),
+            ("^ab(c|d)", RegexPrefix("ab", "ac", False)),
+            ("^ab[|]", RegexPrefix("ab", "ac", False)),
+            (r"^ab\d", RegexPrefix("ab", "ac", False)),
+            ("^a\U0010ffff", RegexPrefix("a\U0010ffff", "b", True)),
+            ("^\ud7ff", RegexPrefix("\ud7ff", "\ue000", True)),
+            ("^\U0010ffff", RegexPrefix("\U0010ffff", None, True)),
+            ("ACME", None),
+            ("^", None),
+            ("^a*", None),
+            ("^(?i)acme", None),
+            ("^[a]bc", None),
+            (r"^\w", None),
+            ("^ab|cd", None),
+            ("^ab(c)|d", None),
+            (r"^a\|b|c", None),
+        ],
+    )
+    def test_literal_prefix(self, pattern: str, expected: RegexPrefix | None) -> None:
+        assert literal_prefix(pattern) == expected
+
+    def test_matches_lie_in_range(self) -> None:
+        rng = random.Random(0)
+        atoms = ["a", "b", "c", r"\.", ".", "*", "+", "?", "[ab]", "(a|b)", "|", "$"]
+        strings = [
+            "".join(rng.choice("abc.") for _ in range(rng.randint(0, 6)))
+            for _ in range(500)
+        ]
+
+        checked = 0
+        for _ in range(2000):
+            pattern = "^" + "".join(rng.choice(atoms) for _ in range(rng.randint(1, 5)))
+            try:
+                compiled = re.compile(pattern)
+            except re.error:
+                continue
+            prefix = literal_prefix(pattern)
+            if prefix is None:
+                continue
+
+            checked += 1
+            for string in strings:
+                in_range = string >= prefix.prefix and (
+                    prefix.upper_bound is None or string < prefix.upper_bound
+                )
+                matched = compiled.search(string) is not None
+                assert in_range == string.startswith(prefix.prefix)
+                if matched:
+                    assert in_range
+                if prefix.exact:
+                    assert matched == in_range
+        assert checked > 100
@@ -0,0 +1,258 @@
+import datetime
+import json
+import random
+import time
+import uuid
+from array import array
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from charter import canonical_json, from_bytes, from_json, to_bytes
+from charter._exc import SerializationError
+from charter._ops import (
+    LogicOperatorNode,
+    Operation,
+    OperatorNode,
+    Operators,
+    Param,
+    structural_key,
+)
+from charter._predicate import Predicate
+from tests.test__optimize.test_push_down_not import random_tree
+
+p = Predicate()
+
+
+def keys(operations: list[Operation]) -> list[Any]:
+    return [structural_key(op) for op in operations]
+
+
+class TestBinary:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            True,
+            False,
+            0,
+            -1,
+            2**70,
+            -(2**70),
+            1.5,
+            "",
+            "żółw",
+            b"\x00\xff",
+            [1, "a", None],
+            (1, 2),
+            [1.0, 2.5],
+            [2**63, 1],
+            [True, 1],
+            array("q", [1, -2]),
+            array("d", [0.5]),
+            array("B", b"ab"),
+            Param("limit"),
+            datetime.datetime(2025, 6, 1, 12, 30, tzinfo=datetime.UTC),
+            datetime.date(2025, 6, 1),
+            Decimal("1.10"),
+            uuid.UUID(int=1),
+            {"a": [1, {"b": None}]},
+        ],
+    )
+    def test_value_round_trip(self, value: Any) -> None:
+        operations: list[Operation] = [OperatorNode(Operators.EQ, "field", value)]
+        assert keys(from_bytes(to_bytes(operations))) == keys(operations)
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            p.in_("id", [1, 2, 3]),
+            p.in_("id", array("q", [1, 2, 3])),
+            p.in_("id", Param("ids")),
+            p.contains("name", "ab", ignore_case=True),
+            p.contains("name", Param("q")),
+            p.regex("name", "^a"),
+            p.any_("tags", ["a", "b"]),
+            p.all_("tags", [1, 2]),
+            p.elem_match("items", p.eq("sku", "a"), p.not_(p.lt("qty", 2))),
+            p.elem_match("rows", p.elem_match("cells", p.eq("v", 1))),
+            p.not_(p.and_(p.eq("a", 1), p.or_(p.lt("b", 2), p.gte("b", 5)))),
+        ],
+    )
+    def test_operation_round_trip(self, operation: Operation) -> None:
+        operations = [operation, p.eq("a", 1)]
+        assert keys(from_bytes(to_bytes(operations))) == keys(operations)
+
+    def test_random_trees_round_trip(self) -> None:
+        rng = random.Random(0)
+        for _ in range(200):
+            operations = [random_tree(rng, 4) for _ in range(rng.randint(0, 3))]
+            assert keys(from_bytes(to_bytes(operations))) == keys(operations)
+
+    def test_deep_tree(self) -> None:
+        operation: Operation = p.eq("a", 0)
+        for i in range(10000):
+            operation = p.not_(p.and_(operation, p.gt("a", i)))
+        (decoded,) = from_bytes(to_bytes([operation]))
+        assert structural_key(decoded) == structural_key(operation)
+
+    def test_field_names_are_interned(self) -> None:
+        data = to_bytes([p.eq("a_long_field_name", i) for i in range(100)])
+        assert data.count(b"a_long_field_name") == 1
+
+    @pytest.mark.parametrize(
+        "values, item_size",
+        [([0, 127], 1), ([-129, 0], 2), ([0, 2**31 - 1], 4), ([-(2**63), 0], 8)],
+    )
+    def test_integer_lists_are_packed(self, values: list[int], item_size: int) -> None:
+        data = to_bytes([p.in_("id", values * 500)])
+        assert 1000 * item_size < len(data) < 1000 * item_size + 32
+        (decoded,) = from_bytes(data)
+        assert decoded.value == values * 500  # type: ignore[union-attr]
+
+    def test_decodes_to_nodes(self) -> None:
+        (decoded,) = from_bytes(to_bytes([p.and_(p.eq("a", 1))]))
+        assert isinstance(decoded, LogicOperatorNode)
+        assert isinstance(decoded.operations[0], OperatorNode)
+
+    def test_unsupported_value(self) -> None:
+        with pytest.raises(SerializationError, match="can't be serialized"):
+            to_bytes([OperatorNode(Operators.EQ, "a", object())])
+
+    @pytest.mark.parametrize(
+        "data, message",
+        [
+            (b"", "Invalid binary filter"),
+            (b"JSON", "Not a charter binary filter"),
+            (b"CHB\x01\x01\x01a\x01\x00\x00\x05\x09abc", "Invalid binary filter"),
+            (b"CHB\x01\x00\x01\x10\x01", "Invalid number of operations"),
+            (b"CHB\x01\x01\x01a\x02\x00\x00\x00", "Invalid number of operations"),
+            (b"CHB\x01\x01\x01a\x01\x00\x05\x00", "Invalid binary filter"),
+            (b"CHB\x01\x01\x01a\x01\x20", "Unknown node code: 0x20"),
+            (b"CHB\x01\x01\x01a\x01\x00\x00\x7f", "Unknown value tag: 0x7f"),
+            (b"CHB\x01\x01\x01a\x01\x02\x00\x07\x00", "Invalid binary filter"),
+            (b"CHB\x01\x01\x01a\x01\x00\x00\x10\x031x5", "Invalid binary filter"),
+        ],
+    )
+    def test_invalid_data(self, data: bytes, message: str) -> None:
+        with pytest.raises(SerializationError, match=message):
+            from_bytes(data)
+
+
+class TestCanonicalJson:
+    def test_format(self) -> None:
+        document = canonical_json(
+            [p.in_("id", [3, 1, 3]), p.contains("name", "ab", ignore_case=True)]
+        )
+        assert " " not in document
+        assert sorted(json.loads(document), key=json.dumps) == [
+            {"contains": ["name", {"ignore_case": True, "value": "ab"}]},
+            {"in": ["id", [1, 3]]},
+        ]
+
+    def test_order_independent(self) -> None:
+        first = [p.and_(p.eq("a", 1), p.or_(p.gt("b", 2), p.eq("c", None)))]
+        second = [p.and_(p.or_(p.eq("c", None), p.gt("b", 2)), p.eq("a", 1))]
+        assert canonical_json(first) == canonical_json(second)
+
+    def test_array_operators_order_independent(self) -> None:
+        first = [
+            p.any_("a", [2, 1, 2]),
+            p.all_("b", ["y", "x"]),
+            p.elem_match("c", p.eq("x", 1), p.eq("y", 2)),
+        ]
+        second = [
+            p.elem_match("c", p.eq("y", 2), p.eq("x", 1)),
+            p.all_("b", ["x", "y"]),
+            p.any_("a", [1, 2]),
+        ]
+        assert canonical_json(first) == canonical_json(second)
+        assert canonical_json(from_json(canonical_json(first))) == canonical_json(first)
+
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            ([p.eq("a", 1)], [p.eq("a", 1.0)]),
+            ([p.eq("a", 1)], [p.eq("a", True)]),
+            ([p.eq("a", 1)], [p.eq("a", "1")]),
+            ([p.eq("a", 1)], [p.neq("a", 1)]),
+            ([p.and_(p.eq("a", 1))], [p.or_(p.eq("a", 1))]),
+            ([p.contains("a", "x")], [p.contains("a", "x", ignore_case=True)]),
+            ([p.eq("a", Param("x"))], [p.eq("a", {"$param": "x"})]),
+            ([p.eq("a", {"$map": {}})], [p.eq("a", {})]),
+            ([p.any_("a", [1, 2])], [p.all_("a", [1, 2])]),
+            ([p.any_("a", [1])], [p.in_("a", [1])]),
+        ],
+    )
+    def test_distinguishes(
+        self, first: list[Operation], second: list[Operation]
+    ) -> None:
+        assert canonical_json(first) != canonical_json(second)
+
+    def test_loads_with_from_json(self) -> None:
+        operations = [
+            p.not_(p.in_("a", [2, 1]), p.lte("b", 1.5)),
+            p.contains("c", "x"),
+            p.regex("d", "^a"),
+        ]
+        loaded = from_json(canonical_json(operations))
+        assert canonical_json(loaded) == canonical_json(operations)
+
+    def test_tagged_values(self) -> None:
+        document = canonical_json(
+            [
+                p.eq("a", datetime.date(2025, 6, 1)),
+                p.eq("a", Decimal("1.10")),
+                p.eq("a", Param("x")),
+            ]
+        )
+        assert sorted(json.loads(document), key=json.dumps) == [
+            {"eq": ["a", {"$date": "2025-06-01"}]},
+            {"eq": ["a", {"$decimal": "1.10"}]},
+            {"eq": ["a", {"$param": "x"}]},
+        ]
+
+    def test_deep_tree(self) -> None:
+        operation: Operation = p.eq("a", 0)
+        for i in range(10000):
+            operation = p.not_(p.and_(operation, p.gt("a", i)))
+        document = canonical_json([operation])
+        assert document.count('{"not":') == 10000
+
+    def test_unsupported_value(self) -> None:
+        with pytest.raises(SerializationError, match="can't be serialized"):
+            canonical_json([OperatorNode(Operators.EQ, "a", object())])
+
+
+class TestSerializePerformance:
+    operations = [
+        p.and_(
+            *(
+                p.or_(p.eq(f"field_{i % 50}", i), p.in_("id", list(range(i, i + 20))))
+                for i in range(1000)
+            )
+        )
+    ]
+
+    def best_time(self, function: Any, *args: Any) -> float:
+        times = []
+        for _ in range(3):
+            start_time = time.perf_counter()
+            function(*args)
+            times.append(time.perf_counter() - start_time)
+        return min(times)
+
+    def test_encode(self) -> None:
+        assert self.best_time(to_bytes, self.operations) < 0.2
+
+    def test_decode(self) -> None:
+        data = to_bytes(self.operations)
+        assert self.best_time(from_bytes, data) < 0.2
+
+    def test_smaller_than_json(self) -> None:
+        data = to_bytes(self.operations)
+        assert len(data) < len(canonical_json(self.operations)) // 2
+
+    def test_canonical_json(self) -> None:
+        assert self.best_time(canonical_json, self.operations) < 0.2
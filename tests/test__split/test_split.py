@@ -0,0 +1,206 @@
+import itertools
+import random
+from typing import Any
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from charter import Capabilities, split
+from charter._backends.python import PythonBackend
+from charter._backends.sqlalchemy import SQLAlchemyBackend
+from charter._ops import (
+    ALL_OPERATORS,
+    Operation,
+    OperationType,
+    Operator,
+    Operators,
+    structural_key,
+)
+from charter._predicate import Predicate
+from tests.test__optimize.test_push_down_not import random_tree
+
+p = Predicate()
+
+# ``b`` stands for a field computed in Python.
+STORED = Capabilities(fields={"a"})
+
+
+class Base(DeclarativeBase): ...
+
+
+class Row(Base):
+    __tablename__ = "rows"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    a: Mapped[int | None]
+    b: Mapped[int | None]
+    meta: Mapped[dict[str, Any] | None] = mapped_column(sa.JSON)
+
+
+def keys(operations: list[Operation]) -> list[Any]:
+    return [structural_key(op) for op in operations]
+
+
+def leaves(operations: list[Operation]) -> list[Operator]:
+    found: list[Operator] = []
+    stack = list(operations)
+    while stack:
+        operation = stack.pop()
+        if operation.operation_type is OperationType.LOGIC:
+            stack.extend(operation.operations)  # type: ignore[union-attr]
+        else:
+            found.append(operation)  # type: ignore[arg-type]
+    return found
+
+
+class TestSplit:
+    def test_supported_operations_are_kept(self) -> None:
+        operations = [p.eq("a", 1), p.or_(p.gt("a", 2), p.lt("a", 0))]
+        result = split(operations, STORED)
+        assert result.pushdown == operations
+        assert result.pushdown[1] is operations[1]
+        assert result.residual == []
+
+    @pytest.mark.parametrize(
+        "operation, pushdown",
+        [
+            (p.eq("b", 1), []),
+            (p.and_(p.eq("a", 1), p.eq("b", 1)), [p.eq("a", 1)]),
+            (p.or_(p.eq("a", 1), p.eq("b", 1)), []),
+            (
+                p.or_(p.and_(p.eq("a", 1), p.eq("b", 1)), p.eq("a", 2)),
+                [p.or_(p.eq("a", 1), p.eq("a", 2))],
+            ),
+            (p.not_(p.eq("b", 1)), []),
+            (p.not_(p.eq("a", 1), p.eq("b", 1)), []),
+            (
+                p.not_(p.or_(p.eq("a", 1), p.eq("b", 1))),
+                [p.or_(p.not_(p.eq("a", 1)), p.eq("a", None))],
+            ),
+            (
+                p.not_(p.not_(p.eq("a", 1), p.eq("b", 1))),
+                [p.or_(p.not_(p.not_(p.eq("a", 1))), p.eq("a", None))],
+            ),
+        ],
+    )
+    def test_relaxation(self, operation: Operation, pushdown: list[Operation]) -> None:
+        result = split([p.gt("a", 0), operation], STORED)
+        assert keys(result.pushdown) == keys([p.gt("a", 0), *pushdown])
+        assert result.residual == [operation]
+
+    def test_unsupported_operators(self) -> None:
+        capabilities = Capabilities(operators=ALL_OPERATORS - {Operators.REGEX})
+        operations = [p.regex("b", "^x"), p.eq("b", "x")]
+        result = split(operations, capabilities)
+        assert result.pushdown == [operations[1]]
+        assert result.residual == [operations[0]]
+
+    def test_residual_predicate(self) -> None:
+        records = [{"a": a, "b": b} for a, b in itertools.product(range(3), repeat=2)]
+        result = split([p.or_(p.eq("a", 1), p.eq("b", 2)), p.gt("a", 0)], STORED)
+
+        pushed = PythonBackend().transform(result.pushdown)
+        matches = result.residual_predicate("item")
+        assert [r for r in records if pushed(r) and matches(r)] == [
+            {"a": 1, "b": 0},
+            {"a": 1, "b": 1},
+            {"a": 1, "b": 2},
+            {"a": 2, "b": 2},
+        ]
+
+    @pytest.mark.parametrize(
+        "capabilities",
+        [
+            STORED,
+            Capabilities(fields={"b"}),
+            Capabilities(fields=set()),
+            Capabilities(operators={Operators.EQ, Operators.IN, Operators.GT}),
+        ],
+    )
+    def test_random_trees(self, capabilities: Capabilities) -> None:
+        rng = random.Random(0)
+        values = [None, 0, 1, 2, 3]
+        records = [{"a": a, "b": b} for a, b in itertools.product(values, repeat=2)]
+        backend = PythonBackend(accessor="item")
+
+        for _ in range(300):
+            operations = [random_tree(rng, 3) for _ in range(rng.randint(1, 3))]
+            result = split(operations, capabilities)
+
+            assert all(capabilities.supports(op) for op in leaves(result.pushdown))
+            original = backend.transform(operations)
+            pushed = backend.transform(result.pushdown)
+            residual = result.residual_predicate("item")
+            for record in records:
+                assert original(record) == (pushed(record) and residual(record))
+
+    def test_deep_tree(self) -> None:
+        operation: Operation = p.eq("b", 0)
+        for i in range(10000):
+            operation = p.not_(p.or_(operation, p.gt("a", i)))
+
+        result = split([operation], STORED)
+        assert result.residual == [operation]
+        assert {op.field for op in leaves(result.pushdown)} == {"a"}
+
+
+class TestSplitSQLAlchemy:
+    @pytest.fixture(autouse=True)
+    def setup_db(self) -> None:
+        self.backend = SQLAlchemyBackend(Row)
+        self.engine = sa.create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        values = [None, 0, 1, 2]
+        self.rows = [
+            {"id": i, "a": a, "b": b, "meta": {"color": "red" if b else "blue"}}
+            for i, (a, b) in enumerate(itertools.product(values, repeat=2))
+        ]
+        with Session(self.engine) as session:
+            session.add_all([Row(**row) for row in self.rows])
+            session.commit()
+
+    def select(self, operations: list[Operation]) -> list[int]:
+        result = split(operations, STORED)
+        matches = result.residual_predicate("item")
+        stmt = sa.select(Row).where(self.backend.transform(result.pushdown))
+        with Session(self.engine) as session:
+            rows = [
+                {"id": row.id, "a": row.a, "b": row.b, "meta": row.meta}
+                for row in session.scalars(stmt.order_by(Row.id))
+            ]
+        return [row["id"] for row in rows if matches(row)]
+
+    def test_negation_keeps_null_rows(self) -> None:
+        operation = p.not_(p.or_(p.eq("a", 1), p.eq("b", 2)))
+        expected = [
+            row["id"]
+            for row in self.rows
+            if not (row["a"] == 1 or (row["b"] is not None and row["b"] == 2))
+        ]
+        assert any(self.rows[i]["a"] is None for i in expected)
+        assert self.select([operation]) == expected
+
+    def test_random_trees(self) -> None:
+        rng = random.Random(0)
+        backend = PythonBackend(accessor="item")
+
+        for _ in range(100):
+            operations = [random_tree(rng, 3) for _ in range(rng.randint(1, 3))]
+            result = split(operations, STORED)
+            # Operations pushed down whole keep the backend's own semantics.
+            exact = [op for op in operations if op not in result.residual]
+            in_backend = set(self.select(exact))
+            residual = backend.transform(result.residual)
+            expected = [
+                row["id"]
+                for row in self.rows
+                if row["id"] in in_backend and residual(row)
+            ]
+            assert self.select(operations) == expected
+
+    def test_dotted_path_residual(self) -> None:
+        operations = [p.eq("a", 1), p.eq("meta.color", "red")]
+        assert self.select(operations) == [
+            row["id"] for row in self.rows if row["a"] == 1 and row["b"]
+        ]
@@ -0,0 +1,199 @@
+import io
+import json
+import time
+from array import array
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from charter._exc import ParseError, PayloadTooLargeError
+from charter._ops import (
+    ContainsData,
+    LogicOperatorNode,
+    LogicOperators,
+    Operation,
+    OperatorNode,
+    Operators,
+)
+from charter._stream import from_json_stream
+
+DOCUMENT = json.dumps(
+    {
+        "or": [
+            {
+                "and": [
+                    {"gte": ["created_at", "2025-06-01T00:00:00"]},
+                    {"in": ["id", [1, 2, 3]]},
+                ]
+            },
+            {"contains": ["bio", {"value": 'say "hi"\\', "ignore_case": True}]},
+            {"not": [{"eq": ["deleted_at", None]}]},
+            {"eq": ["score", -1.5e3]},
+            {"eq": ["meta", {"tags": [True, False]}]},
+        ]
+    }
+).encode()
+
+
+def describe(operation: Operation) -> Any:
+    if isinstance(operation, LogicOperatorNode):
+        return (operation.operator, [describe(op) for op in operation.operations])
+    assert isinstance(operation, OperatorNode)
+    return (operation.operator, operation.field, operation.value)
+
+
+def counting_chunks(data: bytes, size: int, read: list[int]) -> Iterator[bytes]:
+    for start in range(0, len(data), size):
+        read.append(size)
+        yield data[start : start + size]
+
+
+class TestFromJsonStream:
+    def test_document(self) -> None:
+        (result,) = from_json_stream([DOCUMENT])
+
+        assert describe(result) == (
+            LogicOperators.OR,
+            [
+                (
+                    LogicOperators.AND,
+                    [
+                        (Operators.GTE, "created_at", "2025-06-01T00:00:00"),
+                        (Operators.IN, "id", array("q", [1, 2, 3])),
+                    ],
+                ),
+                (
+                    Operators.CONTAINS,
+                    "bio",
+                    ContainsData(value='say "hi"\\', ignore_case=True),
+                ),
+                (LogicOperators.NOT, [(Operators.EQ, "deleted_at", None)]),
+                (Operators.EQ, "score", -1500.0),
+                (Operators.EQ, "meta", {"tags": [True, False]}),
+            ],
+        )
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 13, 64])
+    def test_chunk_boundaries(self, chunk_size: int) -> None:
+        expected = describe(from_json_stream([DOCUMENT])[0])
+        (result,) = from_json_stream(io.BytesIO(DOCUMENT), chunk_size=chunk_size)
+
+        assert describe(result) == expected
+
+    def test_document_operators(self) -> None:
+        document = (
+            b'[{"any": ["tags", [1, 2]]}, {"all": ["tags", ["a"]]},'
+            b' {"elem_match": ["items", {"eq": ["sku", "a"]}]}]'
+        )
+        any_, all_, elem_match = from_json_stream([document])
+
+        assert describe(any_) == (Operators.ANY, "tags", [1, 2])
+        assert describe(all_) == (Operators.ALL, "tags", ["a"])
+        assert isinstance(elem_match, OperatorNode)
+        assert [describe(op) for op in elem_match.value] == [(Operators.EQ, "sku", "a")]
+
+    def test_list_document(self) -> None:
+        result = from_json_stream([b'[{"eq": ["a", 1]}', b', {"regex": ["b", "^x"]}]'])
+
+        assert [describe(op) for op in result] == [
+            (Operators.EQ, "a", 1),
+            (Operators.REGEX, "b", "^x"),
+        ]
+
+    @pytest.mark.parametrize(
+        "values, expected",
+        [
+            ([1, 2, 3], array("q", [1, 2, 3])),
+            ([1, 2.5], array("d", [1.0, 2.5])),
+            ([1.5, 2], array("d", [1.5, 2.0])),
+            ([2**63], [2**63]),
+            ([2**60, 0.5], [2**60, 0.5]),
+            (["a", 1], ["a", 1]),
+            ([1, "a"], [1, "a"]),
+            ([True, 1], [True, 1]),
+        ],
+    )
+    def test_in_values_storage(self, values: list[Any], expected: Any) -> None:
+        (op,) = from_json_stream([json.dumps({"in": ["id", values]}).encode()])
+
+        assert isinstance(op, OperatorNode)
+        assert type(op.value) is type(expected)
+        assert op.value == expected
+
+    @pytest.mark.parametrize(
+        "document",
+        [
+            b"",
+            b'{"eq": ["name"]}',
+            b'{"eq": ["", 1]}',
+            b'{"unknown": ["name", 1]}',
+            b'{"in": ["id", []]}',
+            b'{"in": ["id", 1]}',
+            b'{"contains": ["bio", ""]}',
+            b'{"contains": ["bio", 1]}',
+            b'{"contains": ["bio", {"ignore_case": true}]}',
+            b'{"regex": ["email", 1]}',
+            b'{"all": ["tags", []]}',
+            b'{"elem_match": ["items", []]}',
+            b'{"elem_match": ["items", [1]]}',
+            b'{"and": []}',
+            b'{"eq": ["a", tru]}',
+            b'{"eq": ["a", 01]}',
+            b'{"eq": ["a", "unterminated]}',
+            b'{"eq": ["a", 1]} {"eq": ["b", 2]}',
+        ],
+    )
+    def test_invalid_documents(self, document: bytes) -> None:
+        with pytest.raises(ParseError):
+            from_json_stream([document])
+
+    def test_max_bytes_rejects_before_reading_everything(self) -> None:
+        document = json.dumps({"in": ["id", list(range(100000))]}).encode()
+        read: list[int] = []
+
+        with pytest.raises(PayloadTooLargeError, match="maximum size"):
+            from_json_stream(
+                counting_chunks(document, 1024, read),
+                max_bytes=10 * 1024,
+            )
+        assert len(read) == 11
+
+    def test_max_in_length_rejects_before_reading_everything(self) -> None:
+        document = json.dumps({"in": ["id", list(range(100000))]}).encode()
+        read: list[int] = []
+
+        with pytest.raises(PayloadTooLargeError, match="maximum length of 1000"):
+            from_json_stream(counting_chunks(document, 1024, read), max_in_length=1000)
+        assert sum(read) < len(document) // 10
+
+    def test_max_depth(self) -> None:
+        document = b'{"not": [' * 10 + b'{"eq": ["a", 1]}' + b"]}" * 10
+
+        with pytest.raises(PayloadTooLargeError, match="maximum depth of 5"):
+            from_json_stream([document], max_depth=5)
+
+    def test_deep_nesting_without_recursion(self) -> None:
+        depth = 10000
+        document = b'{"not": [' * depth + b'{"eq": ["a", 1]}' + b"]}" * depth
+
+        (result,) = from_json_stream([document], max_depth=depth)
+
+        for _ in range(depth):
+            assert isinstance(result, LogicOperatorNode)
+            result = result.operations[0]
+        assert isinstance(result, OperatorNode)
+
+
+class TestFromJsonStreamPerformance:
+    def test_large_in_list(self) -> None:
+        document = json.dumps({"in": ["id", list(range(100000))]}).encode()
+
+        start_time = time.time()
+        (op,) = from_json_stream(io.BytesIO(document))
+        end_time = time.time()
+
+        assert end_time - start_time < 2.0
+        assert isinstance(op, OperatorNode)
+        assert isinstance(op.value, array)
+        assert op.value.itemsize * len(op.value) == 800000
@@ -0,0 +1,120 @@
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+
+from charter._backends.cache import CachedBackend, CacheInfo
+from charter._backends.interface import Backend
+from charter._ops import Operation, structural_key
+from charter._predicate import Predicate
+
+
+class Unhashable:
+    __hash__ = None  # type: ignore[assignment]
+
+
+class CountingBackend(Backend[list[dict[str, Any]]]):
+    def __init__(self, mutable_output: bool = False) -> None:
+        self.calls = 0
+        self.mutable_output = mutable_output  # type: ignore[misc]
+
+    def transform(self, operations: Sequence[Operation]) -> list[dict[str, Any]]:
+        self.calls += 1
+        return [{"fields": [getattr(op, "field", None) for op in operations]}]
+
+
+class TestStructuralKey:
+    def setup_method(self) -> None:
+        self.p = Predicate()
+
+    def test_equal_trees_have_equal_keys(self) -> None:
+        p = self.p
+        first = p.and_(p.eq("name", "test"), p.in_("age", [1, 2]))
+        second = p.and_(p.eq("name", "test"), p.in_("age", [1, 2]))
+        assert structural_key(first) == structural_key(second)
+
+    def test_nodes_and_models_share_keys(self) -> None:
+        nodes = Predicate(validate=False)
+        assert structural_key(self.p.gt("age", 1)) == structural_key(nodes.gt("age", 1))
+
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            (1, True),
+            (1, 1.0),
+            ([1, 2], (1, 2)),
+            ("1", 1),
+        ],
+    )
+    def test_value_types_are_distinguished(self, first: Any, second: Any) -> None:
+        assert structural_key(self.p.eq("value", first)) != structural_key(
+            self.p.eq("value", second)
+        )
+
+    def test_contains_data(self) -> None:
+        assert structural_key(self.p.contains("bio", "dev")) != structural_key(
+            self.p.contains("bio", "dev", ignore_case=True)
+        )
+
+    def test_unhashable_value(self) -> None:
+        with pytest.raises(TypeError):
+            structural_key(self.p.eq("value", Unhashable()))
+
+
+class TestCachedBackend:
+    def setup_method(self) -> None:
+        self.p = Predicate()
+        self.inner = CountingBackend()
+        self.backend = CachedBackend(self.inner, maxsize=2)
+
+    def test_hit(self) -> None:
+        first = self.backend.transform([self.p.eq("name", "test")])
+        second = self.backend.transform([self.p.eq("name", "test")])
+
+        assert first is second
+        assert self.inner.calls == 1
+        assert self.backend.cache_info() == CacheInfo(
+            hits=1, misses=1, evictions=0, maxsize=2, currsize=1
+        )
+
+    def test_eviction_is_least_recently_used(self) -> None:
+        self.backend.transform([self.p.eq("a", 1)])
+        self.backend.transform([self.p.eq("b", 1)])
+        self.backend.transform([self.p.eq("a", 1)])
+        self.backend.transform([self.p.eq("c", 1)])
+
+        assert self.backend.cache_info().evictions == 1
+        self.backend.transform([self.p.eq("a", 1)])
+        assert self.inner.calls == 3
+        self.backend.transform([self.p.eq("b", 1)])
+        assert self.inner.calls == 4
+
+    def test_unhashable_values_bypass_cache(self) -> None:
+        operations = [self.p.eq("value", Unhashable())]
+        self.backend.transform(operations)
+        self.backend.transform(operations)
+
+        assert self.inner.calls == 2
+        assert self.backend.cache_info().currsize == 0
+        assert self.backend.cache_info().misses == 2
+
+    def test_mutable_output_is_copied(self) -> None:
+        backend = CachedBackend(CountingBackend(mutable_output=True))
+        first = backend.transform([self.p.eq("name", "test")])
+        first[0]["fields"].append("mutated")
+
+        second = backend.transform([self.p.eq("name", "test")])
+        assert second == [{"fields": ["name"]}]
+        assert second is not first
+
+    def test_cache_clear(self) -> None:
+        self.backend.transform([self.p.eq("name", "test")])
+        self.backend.cache_clear()
+
+        assert self.backend.cache_info() == CacheInfo(
+            hits=0, misses=0, evictions=0, maxsize=2, currsize=0
+        )
+
+    def test_invalid_maxsize(self) -> None:
+        with pytest.raises(ValueError, match="maxsize must be a positive integer"):
+            CachedBackend(self.inner, maxsize=0)
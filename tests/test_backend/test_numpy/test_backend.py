@@ -0,0 +1,200 @@
+import time
+from array import array
+from typing import Any
+
+import numpy as np
+import pytest
+
+from charter._backends import load_backend
+from charter._backends.numpy import NumpyBackend
+from charter._backends.python import PythonBackend
+from charter._exc import TransformationError, UnsupportedOperationError
+from charter._ops import Operation, Operator, Param
+from charter._predicate import Predicate
+
+p = Predicate()
+
+
+class TestNumpyBackend:
+    def setup_method(self) -> None:
+        self.backend = NumpyBackend(
+            {
+                "id": np.array([1, 2, 3, 4]),
+                "name": np.array(["Alice", "bob", None, "Carol Bobson"], dtype=object),
+                "age": np.array([30.0, 17.0, np.nan, 45.0]),
+                "role": np.array(["admin", "user", "user", "guest"]),
+                "active": np.array([True, False, True, True]),
+            }
+        )
+
+    def select(self, operations: list[Operation]) -> list[int]:
+        mask = self.backend.transform(operations)
+        assert mask.dtype == np.bool_
+        return self.backend.columns["id"][mask].tolist()  # type: ignore[no-any-return]
+
+    def test_load_backend(self) -> None:
+        assert load_backend("numpy") is NumpyBackend
+
+    def test_empty_operations(self) -> None:
+        assert self.select([]) == [1, 2, 3, 4]
+
+    @pytest.mark.parametrize(
+        "operation, expected",
+        [
+            (p.eq("role", "user"), [2, 3]),
+            (p.eq("active", True), [1, 3, 4]),
+            (p.eq("name", None), [3]),
+            (p.eq("age", None), [3]),
+            (p.eq("name", "bob"), [2]),
+            (p.neq("name", None), [1, 2, 4]),
+            (p.neq("name", "bob"), [1, 4]),
+            (p.neq("age", 30), [2, 4]),
+            (p.in_("id", [1, 3, 99]), [1, 3]),
+            (p.in_("id", array("q", [2, 4])), [2, 4]),
+            (p.in_("name", ["bob", "Alice"]), [1, 2]),
+            (p.in_("role", ["guest"]), [4]),
+            (p.gt("age", 30), [4]),
+            (p.gte("age", 30), [1, 4]),
+            (p.lt("age", 30), [2]),
+            (p.lte("age", 30), [1, 2]),
+            (p.gt("name", "b"), [2]),
+            (p.contains("name", "Bob"), [4]),
+            (p.contains("name", "BOB", ignore_case=True), [2, 4]),
+            (p.contains("role", "us"), [2, 3]),
+            (p.regex("name", r"^[A-Z]"), [1, 4]),
+            (p.regex("role", r"^(admin|guest)$"), [1, 4]),
+        ],
+    )
+    def test_operators(self, operation: Operation, expected: list[int]) -> None:
+        assert self.select([operation]) == expected
+
+    @pytest.mark.parametrize(
+        "operations, expected",
+        [
+            ([p.and_(p.eq("role", "user"), p.gt("age", 10))], [2]),
+            ([p.or_(p.eq("role", "admin"), p.eq("role", "guest"))], [1, 4]),
+            ([p.not_(p.eq("role", "user"))], [1, 4]),
+            ([p.not_(p.eq("role", "user"), p.gt("age", 10))], [1, 3, 4]),
+            ([p.not_in("id", [1, 2])], [3, 4]),
+            ([p.eq("role", "user"), p.lt("age", 18)], [2]),
+        ],
+    )
+    def test_logic_operators(
+        self, operations: list[Operation], expected: list[int]
+    ) -> None:
+        assert self.select(operations) == expected
+
+    def test_structured_array(self) -> None:
+        data = np.array(
+            [(1, 30, "admin"), (2, 17, "user")],
+            dtype=[("id", "i8"), ("age", "i8"), ("role", "U8")],
+        )
+        backend = NumpyBackend(data)
+        mask = backend.transform([p.lt("age", 18), p.eq("role", "user")])
+        assert data["id"][mask].tolist() == [2]
+
+    def test_datetime_nulls(self) -> None:
+        backend = NumpyBackend(
+            {"at": np.array(["2025-01-01", "NaT", "2025-03-01"], dtype="M8[D]")}
+        )
+        assert backend.transform([p.eq("at", None)]).tolist() == [False, True, False]
+        assert backend.transform(
+            [p.gt("at", np.datetime64("2025-02-01"))]
+        ).tolist() == [
+            False,
+            False,
+            True,
+        ]
+
+    def test_returns_fresh_mask(self) -> None:
+        operations = [p.eq("role", "user")]
+        mask = self.backend.transform(operations)
+        mask[:] = False
+        assert self.backend.transform(operations).tolist() == [
+            False,
+            True,
+            True,
+            False,
+        ]
+        assert NumpyBackend.mutable_output
+
+    def test_not_structured_array(self) -> None:
+        with pytest.raises(TypeError, match="mapping or a structured array"):
+            NumpyBackend(np.arange(3))  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"a": np.arange(3), "b": np.arange(4)},
+            {"a": np.zeros((2, 2))},
+        ],
+    )
+    def test_invalid_column_shapes(self, data: dict[str, Any]) -> None:
+        with pytest.raises(ValueError, match="one-dimensional and of equal length"):
+            NumpyBackend(data)
+
+    def test_unknown_column(self) -> None:
+        with pytest.raises(TransformationError, match="Unknown column 'invalid'"):
+            self.backend.transform([p.eq("invalid", 1)])
+
+    def test_string_operator_on_numeric_column(self) -> None:
+        with pytest.raises(TransformationError, match="is not a string column"):
+            self.backend.transform([p.contains("id", "1")])
+
+    def test_param_not_supported(self) -> None:
+        with pytest.raises(UnsupportedOperationError, match="Param placeholders"):
+            self.backend.transform([p.gt("age", Param("age"))])
+
+    def test_unsupported_operator(self) -> None:
+        op = Operator.model_construct(operator="invalid", field="id", value=1)
+        with pytest.raises(UnsupportedOperationError, match="Unsupported operator"):
+            self.backend.transform([op])
+
+
+class TestNumpyBackendPerformance:
+    def test_transform_deep_tree(self) -> None:
+        p = Predicate(validate=False)
+        operation: Operation = p.eq("age", 0)
+        for i in range(10000):
+            operation = p.or_(operation, p.eq("age", i))
+
+        start_time = time.time()
+        mask = NumpyBackend({"age": np.array([0, 5000, 9999, 10000])}).transform(
+            [operation]
+        )
+        end_time = time.time()
+
+        assert mask.tolist() == [True, True, True, False]
+        assert end_time - start_time < 2.0
+
+    def test_vectorized_against_per_row(self) -> None:
+        size = 200000
+        rng = np.random.default_rng(0)
+        data = {
+            "age": rng.integers(0, 90, size),
+            "role": rng.choice(np.array(["admin", "user", "guest"]), size),
+        }
+        operations = [
+            p.and_(
+                p.in_("role", ["admin", "guest"]),
+                p.or_(p.lt("age", 18), p.gte("age", 65)),
+            )
+        ]
+
+        start_time = time.time()
+        mask = NumpyBackend(data).transform(operations)
+        numpy_time = time.time() - start_time
+
+        records = [
+            {"age": age, "role": role}
+            for age, role in zip(
+                data["age"].tolist(), data["role"].tolist(), strict=True
+            )
+        ]
+        predicate = PythonBackend(accessor="item").transform(operations)
+        start_time = time.time()
+        expected = [predicate(record) for record in records]
+        python_time = time.time() - start_time
+
+        assert mask.tolist() == expected
+        assert numpy_time < python_time / 5
@@ -1,11 +1,17 @@
+import asyncio
+import time
+from array import array
+from collections.abc import AsyncIterator
 from typing import Any
 from unittest.mock import Mock
 
 import pytest
 from bson import ObjectId
 
+from charter import Keyset
+from charter._backends.cache import CachedBackend
 from charter._backends.pymongo import PymongoBackend
-from charter._exc import UnsupportedOperationError
+from charter._exc import TransformationError, UnsupportedOperationError
 from charter._ops import (
     ContainsData,
     LogicOperator,
@@ -13,7 +19,9 @@ from charter._ops import (
     Operation,
     Operator,
     Operators,
+    Param,
 )
+from charter._predicate import Predicate
 
 
 class TestPymongoBackend:
@@ -129,6 +137,26 @@ class TestPymongoBackend:
         assert isinstance(transformed["_id"]["$in"][0], ObjectId)
         assert transformed["_id"]["$in"][0] == ObjectId("6887106233516d43a9c29753")
 
+    @pytest.mark.parametrize(
+        "operation, expected",
+        [
+            (
+                Predicate().elem_match("id", Predicate().eq("kind", "a")),
+                {"_id": {"$elemMatch": {"kind": "a"}}},
+            ),
+            (Predicate().regex("id", "^6887"), {"_id": {"$regex": "^6887"}}),
+            (
+                Predicate().contains("id", "6887"),
+                {"_id": {"$regex": "6887"}},
+            ),
+        ],
+    )
+    def test__transform_operator_without_id_conversion(
+        self, operation: Operator, expected: dict[str, Any]
+    ) -> None:
+        backend = PymongoBackend(alias_id=True, convert_id=True)
+        assert backend._transform_operator(operation) == expected
+
     @pytest.mark.parametrize(
         "operator, expected",
         [
@@ -163,7 +191,7 @@ class TestPymongoBackend:
                         )
                     ],
                 ),
-                {"$not": [{"name": "test"}]},
+                {"name": {"$ne": "test"}},
             ),
         ],
     )
@@ -287,13 +315,13 @@ class TestPymongoBackend:
                     ),
                 ],
                 [
-                    {"$not": [{"name": "test"}]},
+                    {"name": {"$ne": "test"}},
                     {"$and": [{"age": {"$gt": 20}}, {"age": {"$lt": 30}}]},
                     {
                         "$or": [
                             {"status": "active"},
                             {"tags": {"$in": ["tag1", "tag2"]}},
-                            {"$not": [{"name": "test"}]},
+                            {"name": {"$ne": "test"}},
                             {"$and": [{"age": {"$gt": 20}}, {"age": {"$lt": 30}}]},
                         ]
                     },
@@ -309,3 +337,717 @@ class TestPymongoBackend:
         result = self.backend.transform(operations)
         assert result == expected
         assert isinstance(result, list)
+
+    def test_transform_unvalidated_nodes(self) -> None:
+        p = Predicate(validate=False)
+        operations = [
+            p.and_(p.eq("name", "test"), p.in_("id", ["6887106233516d43a9c29753"])),
+            p.contains("bio", "dev", ignore_case=True),
+        ]
+        assert self.backend.transform(operations) == [
+            {
+                "$and": [
+                    {"name": "test"},
+                    {"_id": {"$in": [ObjectId("6887106233516d43a9c29753")]}},
+                ]
+            },
+            {"bio": {"$regex": "dev", "$options": "i"}},
+        ]
+
+    def test_cached_transform_returns_copies(self) -> None:
+        backend = CachedBackend(self.backend)
+        operations = [Operator(operator=Operators.IN, field="tags", value=["a"])]
+
+        first = backend.transform(operations)
+        first[0]["tags"]["$in"].append("b")
+
+        assert backend.transform(operations) == [{"tags": {"$in": ["a"]}}]
+        assert backend.cache_info().hits == 1
+
+
+class TestPymongoBackendNot:
+    def setup_method(self) -> None:
+        self.backend = PymongoBackend(alias_id=True, convert_id=True)
+        self.p = Predicate()
+
+    @pytest.mark.parametrize(
+        "operation, expected",
+        [
+            (lambda p: p.not_in("tags", ["a", "b"]), {"tags": {"$nin": ["a", "b"]}}),
+            (lambda p: p.not_(p.eq("name", None)), {"name": {"$ne": None}}),
+            (lambda p: p.not_(p.gt("age", 1)), {"age": {"$not": {"$gt": 1}}}),
+            (
+                lambda p: p.not_(p.contains("name", "a", ignore_case=True)),
+                {"name": {"$not": {"$regex": "a", "$options": "i"}}},
+            ),
+            (
+                lambda p: p.not_(p.eq("name", "a"), p.gt("age", 1)),
+                {"$nor": [{"$and": [{"name": "a"}, {"age": {"$gt": 1}}]}]},
+            ),
+            (
+                lambda p: p.not_(p.or_(p.eq("name", "a"), p.gt("age", 1))),
+                {"$nor": [{"$or": [{"name": "a"}, {"age": {"$gt": 1}}]}]},
+            ),
+            (
+                lambda p: p.not_in("id", ["5f1d7f1c8e4b2a3c4d5e6f70"]),
+                {"_id": {"$nin": [ObjectId("5f1d7f1c8e4b2a3c4d5e6f70")]}},
+            ),
+        ],
+    )
+    def test_not(self, operation: Any, expected: dict[str, Any]) -> None:
+        assert self.backend.transform([operation(self.p)]) == [expected]
+
+    def test_not_in_document(self) -> None:
+        document = self.backend.transform_document(
+            [self.p.not_(self.p.gt("age", 1), self.p.lt("age", 9))]
+        )
+        assert document == {"age": {"$not": {"$gt": 1, "$lt": 9}}}
+
+        document = self.backend.transform_document(
+            [self.p.not_(self.p.eq("name", "a"), self.p.gt("age", 1))]
+        )
+        assert document == {"$nor": [{"name": "a", "age": {"$gt": 1}}]}
+
+    def test_not_in_template(self) -> None:
+        template = self.backend.template([self.p.not_in("id", Param("ids"))])
+        assert template.bind({"ids": ["5f1d7f1c8e4b2a3c4d5e6f70"]}) == [
+            {"_id": {"$nin": [ObjectId("5f1d7f1c8e4b2a3c4d5e6f70")]}}
+        ]
+
+
+class TestPymongoBackendArray:
+    def setup_method(self) -> None:
+        self.backend = PymongoBackend(alias_id=True, convert_id=True)
+        self.p = Predicate()
+
+    @pytest.mark.parametrize(
+        "operation, expected",
+        [
+            (lambda p: p.any_("tags", ["a", "b"]), {"tags": {"$in": ["a", "b"]}}),
+            (lambda p: p.all_("tags", ["a", "b"]), {"tags": {"$all": ["a", "b"]}}),
+            (
+                lambda p: p.any_("id", ["5f1d7f1c8e4b2a3c4d5e6f70"]),
+                {"_id": {"$in": [ObjectId("5f1d7f1c8e4b2a3c4d5e6f70")]}},
+            ),
+            (
+                lambda p: p.elem_match("items", p.eq("id", 1), p.gt("qty", 2)),
+                {"items": {"$elemMatch": {"id": 1, "qty": {"$gt": 2}}}},
+            ),
+            (
+                lambda p: p.not_(p.elem_match("items", p.eq("sku", "x"))),
+                {"items": {"$not": {"$elemMatch": {"sku": "x"}}}},
+            ),
+            (
+                lambda p: p.eq("address.city", "Oslo"),
+                {"address.city": "Oslo"},
+            ),
+        ],
+    )
+    def test_transform(self, operation: Any, expected: dict[str, Any]) -> None:
+        assert self.backend.transform([operation(self.p)]) == [expected]
+
+
+class TestPymongoBackendDeepTree:
+    def test_transform_deep_tree(self) -> None:
+        p = Predicate(validate=False)
+        operation: Operation = p.eq("name", "test")
+        for i in range(10000):
+            operation = p.and_(operation, p.gte("age", i))
+
+        start_time = time.time()
+        (criteria,) = PymongoBackend().transform([operation])
+        end_time = time.time()
+
+        depth = 0
+        while "$and" in criteria:
+            assert criteria["$and"][1] == {"age": {"$gte": 9999 - depth}}
+            criteria = criteria["$and"][0]
+            depth += 1
+        assert depth == 10000
+        assert criteria == {"name": "test"}
+        assert end_time - start_time < 1.0
+
+
+class TestMongoTemplate:
+    def setup_method(self) -> None:
+        self.backend = PymongoBackend(alias_id=True, convert_id=True)
+        self.p = Predicate()
+
+    def test_bind(self) -> None:
+        p = self.p
+        template = self.backend.template(
+            [
+                p.and_(p.gte("age", Param("min_age")), p.eq("role", "admin")),
+                p.in_("tags", Param("tags")),
+                p.contains("bio", Param("bio"), ignore_case=True),
+            ]
+        )
+
+        assert template.params == {"min_age", "tags", "bio"}
+        assert template.bind({"min_age": 18, "tags": ["a"], "bio": "dev"}) == [
+            {"$and": [{"age": {"$gte": 18}}, {"role": "admin"}]},
+            {"tags": {"$in": ["a"]}},
+            {"bio": {"$regex": "dev", "$options": "i"}},
+        ]
+
+    def test_bind_does_not_modify_template(self) -> None:
+        template = self.backend.template([self.p.gt("age", Param("age"))])
+
+        first = template.bind({"age": 1})
+        second = template.bind({"age": 2})
+
+        assert first == [{"age": {"$gt": 1}}]
+        assert second == [{"age": {"$gt": 2}}]
+        assert isinstance(template.criteria[0]["age"]["$gt"], Param)
+
+    def test_bind_shares_unbound_parts(self) -> None:
+        p = self.p
+        template = self.backend.template(
+            [p.gt("age", Param("age")), p.in_("tags", ["a", "b"])]
+        )
+
+        bound = template.bind({"age": 1})
+        assert bound[1] is template.criteria[1]
+
+    def test_bind_converts_ids(self) -> None:
+        p = self.p
+        template = self.backend.template(
+            [p.or_(p.eq("id", Param("id")), p.in_("id", Param("ids")))]
+        )
+        object_id = "6887106233516d43a9c29753"
+
+        assert template.bind({"id": object_id, "ids": [object_id]}) == [
+            {
+                "$or": [
+                    {"_id": ObjectId(object_id)},
+                    {"_id": {"$in": [ObjectId(object_id)]}},
+                ]
+            }
+        ]
+
+    def test_bind_missing_value(self) -> None:
+        template = self.backend.template([self.p.gt("age", Param("age"))])
+
+        with pytest.raises(
+            TransformationError,
+            match="Missing value for parameter 'age'",
+        ):
+            template.bind({})
+
+    def test_deep_template(self) -> None:
+        p = Predicate(validate=False)
+        operation: Operation = p.eq("name", Param("name"))
+        for i in range(10000):
+            operation = p.or_(operation, p.gte("age", Param(f"age_{i % 2}")))
+
+        template = self.backend.template([operation])
+        assert template.params == {"name", "age_0", "age_1"}
+        (criteria,) = template.bind({"name": "a", "age_0": 0, "age_1": 1})
+
+        depth = 0
+        while "$or" in criteria:
+            assert criteria["$or"][1] == {"age": {"$gte": (9999 - depth) % 2}}
+            criteria = criteria["$or"][0]
+            depth += 1
+        assert depth == 10000
+        assert criteria == {"name": "a"}
+        assert isinstance(template.criteria[0]["$or"][1]["age"]["$gte"], Param)
+
+    def test__transform_operator_in_typed_array(self) -> None:
+        operator = Operator(operator=Operators.IN, field="n", value=array("q", [1, 2]))
+        transformed = self.backend._transform_operator(operator)
+        assert transformed == {"n": {"$in": [1, 2]}}
+        assert type(transformed["n"]["$in"]) is list
+
+
+class TestPymongoBackendDocument:
+    def setup_method(self) -> None:
+        self.backend = PymongoBackend(alias_id=True, convert_id=True)
+        self.p = Predicate()
+
+    def test_empty_operations(self) -> None:
+        assert self.backend.transform_document([]) == {}
+
+    @pytest.mark.parametrize(
+        "operations, expected",
+        [
+            (
+                lambda p: [p.gt("age", 1), p.lt("age", 9)],
+                {"age": {"$gt": 1, "$lt": 9}},
+            ),
+            (
+                lambda p: [p.eq("role", "admin"), p.gte("age", 18)],
+                {"role": "admin", "age": {"$gte": 18}},
+            ),
+            (
+                lambda p: [p.eq("age", 5), p.neq("age", None)],
+                {"age": {"$eq": 5, "$ne": None}},
+            ),
+            (
+                lambda p: [p.eq("meta", {"a": 1}), p.neq("meta", {})],
+                {"meta": {"$eq": {"a": 1}, "$ne": {}}},
+            ),
+            (
+                lambda p: [p.gt("age", 1), p.gt("age", 5)],
+                {"age": {"$gt": 1}, "$and": [{"age": {"$gt": 5}}]},
+            ),
+            (
+                lambda p: [p.contains("name", "a"), p.regex("name", "^b")],
+                {
+                    "name": {"$regex": "a"},
+                    "$and": [{"name": {"$regex": "^b"}}],
+                },
+            ),
+            (
+                lambda p: [p.and_(p.gt("age", 1), p.eq("role", "a")), p.lt("age", 9)],
+                {"age": {"$gt": 1, "$lt": 9}, "role": "a"},
+            ),
+            (
+                lambda p: [
+                    p.or_(p.eq("role", "a"), p.eq("role", "b")),
+                    p.or_(p.eq("name", "x"), p.and_(p.gt("age", 1), p.lt("age", 9))),
+                ],
+                {
+                    "$or": [{"role": "a"}, {"role": "b"}],
+                    "$and": [
+                        {"$or": [{"name": "x"}, {"age": {"$gt": 1, "$lt": 9}}]},
+                    ],
+                },
+            ),
+            (
+                lambda p: [
+                    p.eq("id", "5f1d7f1c8e4b2a3c4d5e6f70"),
+                    p.in_("id", ["5f1d7f1c8e4b2a3c4d5e6f70"]),
+                ],
+                {
+                    "_id": {
+                        "$eq": ObjectId("5f1d7f1c8e4b2a3c4d5e6f70"),
+                        "$in": [ObjectId("5f1d7f1c8e4b2a3c4d5e6f70")],
+                    }
+                },
+            ),
+        ],
+    )
+    def test_transform_document(self, operations: Any, expected: Any) -> None:
+        assert self.backend.transform_document(operations(self.p)) == expected
+
+    def test_deep_tree(self) -> None:
+        p = Predicate(validate=False)
+        operation: Operation = p.eq("name", "test")
+        for i in range(10000):
+            operation = p.and_(operation, p.gte("age", i))
+
+        start_time = time.time()
+        document = PymongoBackend().transform_document([operation])
+        end_time = time.time()
+
+        assert document["name"] == "test"
+        assert document["age"] == {"$gte": 0}
+        assert len(document["$and"]) == 9999
+        assert end_time - start_time < 1.0
+
+
+class FakeCursor(list[dict[str, Any]]):
+    closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class AsyncFakeCursor:
+    def __init__(self, documents: list[dict[str, Any]]) -> None:
+        self.documents = documents
+        self.closed = False
+
+    async def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        for document in self.documents:
+            yield document
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeCollection:
+    """In-memory stand-in for a collection, supporting the operators used here."""
+
+    def __init__(self, documents: list[dict[str, Any]]) -> None:
+        self.documents = documents
+        self.filters: list[dict[str, Any]] = []
+
+    def find(self, filter: dict[str, Any], **kwargs: Any) -> "FakeCursor":
+        self.filters.append(filter)
+        self.kwargs = kwargs
+        self.cursor = FakeCursor(
+            document for document in self.documents if self.matches(document, filter)
+        )
+        return self.cursor
+
+    def matches(self, document: dict[str, Any], filter: dict[str, Any]) -> bool:
+        for key, condition in filter.items():
+            if key == "$and":
+                matched = all(self.matches(document, c) for c in condition)
+            elif key == "$or":
+                matched = any(self.matches(document, c) for c in condition)
+            elif key == "$nor":
+                matched = not any(self.matches(document, c) for c in condition)
+            else:
+                matched = self.matches_field(document.get(key), condition)
+            if not matched:
+                return False
+        return True
+
+    def matches_field(self, value: Any, condition: Any) -> bool:
+        if not (isinstance(condition, dict) and condition):
+            return bool(value == condition)
+        checks = {
+            "$eq": lambda v: value == v,
+            "$ne": lambda v: value != v,
+            "$in": lambda v: value in v,
+            "$nin": lambda v: value not in v,
+            "$gt": lambda v: value is not None and value > v,
+            "$lt": lambda v: value is not None and value < v,
+        }
+        return all(checks[op](v) for op, v in condition.items())
+
+
+class AsyncFakeCollection(FakeCollection):
+    def find(  # type: ignore[override]
+        self, filter: dict[str, Any], **kwargs: Any
+    ) -> AsyncFakeCursor:
+        self.async_cursor = AsyncFakeCursor(super().find(filter, **kwargs))
+        return self.async_cursor
+
+
+class TestPymongoBackendFindChunked:
+    def setup_method(self) -> None:
+        self.backend = PymongoBackend(alias_id=True)
+        self.p = Predicate()
+        self.collection = FakeCollection(
+            [
+                {"_id": i, "age": i % 7, "role": "a" if i % 2 else "b"}
+                for i in range(100)
+            ]
+        )
+
+    def ids(self, documents: list[dict[str, Any]]) -> list[int]:
+        return [document["_id"] for document in documents]
+
+    def test_without_oversized_in(self) -> None:
+        documents = self.backend.find_chunked(
+            self.collection,  # type: ignore[arg-type]
+            [self.p.in_("id", [1, 2, 3]), self.p.eq("role", "a")],
+            max_in_length=3,
+        )
+        assert self.ids(documents) == [1, 3]
+        assert self.collection.filters == [{"_id": {"$in": [1, 2, 3]}, "role": "a"}]
+
+    def test_split_into_chunks(self) -> None:
+        documents = self.backend.find_chunked(
+            self.collection,  # type: ignore[arg-type]
+            [self.p.in_("id", list(range(0, 60, 3))), self.p.eq("role", "b")],
+            max_in_length=8,
+        )
+        assert self.ids(documents) == list(range(0, 60, 6))
+        assert [len(f["_id"]["$in"]) for f in self.collection.filters] == [8, 8, 4]
+        assert all(f["role"] == "b" for f in self.collection.filters)
+
+    def test_duplicates_merged_by_id(self) -> None:
+        documents = self.backend.find_chunked(
+            self.collection,  # type: ignore[arg-type]
+            [self.p.or_(self.p.in_("id", list(range(20))), self.p.eq("age", 6))],
+            max_in_length=5,
+        )
+        assert len(self.collection.filters) == 4
+        expected = list(range(20)) + [i for i in range(20, 100) if i % 7 == 6]
+        assert sorted(self.ids(documents)) == expected
+
+    def test_longest_list_split(self) -> None:
+        self.backend.find_chunked(
+            self.collection,  # type: ignore[arg-type]
+            [self.p.in_("age", [1, 2, 3]), self.p.in_("id", list(range(10)))],
+            max_in_length=2,
+        )
+        assert len(self.collection.filters) == 5
+        assert all(f["age"] == {"$in": [1, 2, 3]} for f in self.collection.filters)
+
+    def test_in_under_not_is_kept(self) -> None:
+        operations = [self.p.not_(self.p.in_("id", list(range(1, 100))))]
+        self.backend.find_chunked(
+            self.collection,  # type: ignore[arg-type]
+            operations,
+            max_in_length=10,
+        )
+        assert self.collection.filters == [self.backend.transform_document(operations)]
+
+    def test_shared_leaf_split_once(self) -> None:
+        shared = self.p.in_("id", list(range(20)))
+        documents = self.backend.find_chunked(
+            self.collection,  # type: ignore[arg-type]
+            [self.p.or_(shared, self.p.eq("age", 6)), self.p.not_(shared)],
+            max_in_length=5,
+        )
+        assert sorted(self.ids(documents)) == [i for i in range(20, 100) if i % 7 == 6]
+        assert all(
+            f["_id"] == {"$nin": list(range(20))} for f in self.collection.filters
+        )
+
+    def test_reserved_param_name(self) -> None:
+        operations = [
+            self.p.in_("id", list(range(20))),
+            self.p.eq("role", Param("__charter_in_chunk__")),
+        ]
+        with pytest.raises(TransformationError, match="is reserved"):
+            self.backend.find_chunked(
+                self.collection,  # type: ignore[arg-type]
+                operations,
+                max_in_length=5,
+            )
+
+    @pytest.mark.parametrize("projection", [{"_id": 0}, {"_id": False, "age": 1}])
+    def test_projection_without_id(self, projection: dict[str, Any]) -> None:
+        with pytest.raises(ValueError, match="keep it in projection"):
+            self.backend.find_chunked(
+                self.collection,  # type: ignore[arg-type]
+                [self.p.in_("id", list(range(20)))],
+                max_in_length=5,
+                projection=projection,
+            )
+
+    def test_documents_without_id(self) -> None:
+        collection = FakeCollection([{"age": i % 3} for i in range(6)])
+        documents = self.backend.find_chunked(
+            collection,  # type: ignore[arg-type]
+            [self.p.in_("age", [0, 1, 2])],
+            max_in_length=1,
+        )
+        assert sorted(document["age"] for document in documents) == [0, 0, 1, 1, 2, 2]
+
+    def test_typed_array_and_object_ids(self) -> None:
+        backend = PymongoBackend(alias_id=True, convert_id=True)
+        object_ids = [ObjectId() for _ in range(5)]
+        collection = FakeCollection([{"_id": object_id} for object_id in object_ids])
+        documents = backend.find_chunked(
+            collection,  # type: ignore[arg-type]
+            [self.p.in_("id", [str(object_id) for object_id in object_ids])],
+            max_in_length=2,
+        )
+        assert self.ids(documents) == object_ids
+        assert collection.filters[2] == {"_id": {"$in": [object_ids[4]]}}
+
+        self.backend.find_chunked(
+            self.collection,  # type: ignore[arg-type]
+            [self.p.in_("age", array("q", [1, 2, 3]))],
+            max_in_length=2,
+        )
+        assert self.collection.filters[-1] == {"age": {"$in": [3]}}
+
+    def test_invalid_max_in_length(self) -> None:
+        with pytest.raises(ValueError, match="max_in_length must be positive"):
+            self.backend.find_chunked(self.collection, [], max_in_length=0)  # type: ignore[arg-type]
+
+
+class TestPymongoBackendSargability:
+    @pytest.mark.parametrize(
+        "operation, reason",
+        [
+            (Predicate().contains("name", "a"), "renders an unanchored $regex"),
+            (
+                Predicate().contains("name", "a", ignore_case=True),
+                "renders an unanchored $regex with $options: i",
+            ),
+            (Predicate().regex("name", "a$"), "renders an unanchored $regex"),
+            (Predicate().regex("name", "^a"), None),
+            (
+                Predicate().regex("name", Param("pattern")),
+                "renders an unanchored $regex",
+            ),
+            (Predicate().eq("name", "a"), None),
+        ],
+    )
+    def test_non_sargable_reason(self, operation: Any, reason: str | None) -> None:
+        assert PymongoBackend().non_sargable_reason(operation) == reason
+
+
+class TestPymongoBackendRegexPrefixRange:
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            ("^ACME-2025", {"name": {"$gte": "ACME-2025", "$lt": "ACME-2026"}}),
+            (
+                "^ACME-2025-\\d+$",
+                {
+                    "name": {
+                        "$gte": "ACME-2025-",
+                        "$lt": "ACME-2025.",
+                        "$regex": "^ACME-2025-\\d+$",
+                    }
+                },
+            ),
+            ("ACME", {"name": {"$regex": "ACME"}}),
+            (Param("p"), {"name": {"$regex": Param("p")}}),
+        ],
+    )
+    def test_transform(self, pattern: Any, expected: dict[str, Any]) -> None:
+        backend = PymongoBackend(regex_prefix_range=True)
+        assert backend.transform([Predicate().regex("name", pattern)]) == [expected]
+
+    def test_disabled_by_default(self) -> None:
+        assert PymongoBackend().transform([Predicate().regex("name", "^A")]) == [
+            {"name": {"$regex": "^A"}}
+        ]
+
+
+class TestPymongoBackendKeyset:
+    def test_sort(self) -> None:
+        backend = PymongoBackend(alias_id=True)
+        assert backend.sort(Keyset("-created_at", "id")) == [
+            ("created_at", -1),
+            ("_id", 1),
+        ]
+
+    def test_seek(self) -> None:
+        backend = PymongoBackend(alias_id=True)
+        keyset = Keyset("-created_at", "id")
+        operations = keyset.filter([], keyset.encode([5, 1]))
+        assert backend.transform_document(operations) == {
+            "created_at": {"$lte": 5},
+            "$or": [{"created_at": {"$lt": 5}}, {"created_at": 5, "_id": {"$gt": 1}}],
+        }
+
+
+class TestPymongoBackendStream:
+    def setup_method(self) -> None:
+        self.backend = PymongoBackend(alias_id=True)
+        self.p = Predicate()
+        self.documents = [{"_id": i, "age": i % 7} for i in range(25)]
+
+    def test_stream(self) -> None:
+        collection = FakeCollection(self.documents)
+        batches = list(
+            self.backend.stream(
+                collection,  # type: ignore[arg-type]
+                [self.p.gt("age", 1), self.p.lt("age", 5)],
+                batch_size=4,
+                projection={"age": 1},
+            )
+        )
+
+        assert [len(batch) for batch in batches] == [4, 4, 3]
+        assert [d["_id"] for batch in batches for d in batch] == [
+            i for i in range(25) if 1 < i % 7 < 5
+        ]
+        assert collection.filters == [{"age": {"$gt": 1, "$lt": 5}}]
+        assert collection.kwargs == {"batch_size": 4, "projection": {"age": 1}}
+        assert collection.cursor.closed
+
+    def test_stream_closes_abandoned_cursor(self) -> None:
+        collection = FakeCollection(self.documents)
+        stream = self.backend.stream(collection, [], batch_size=10)  # type: ignore[arg-type]
+        assert len(next(stream)) == 10
+        assert not collection.cursor.closed
+        stream.close()
+        assert collection.cursor.closed
+
+    def test_astream(self) -> None:
+        collection = AsyncFakeCollection(self.documents)
+
+        async def collect() -> list[list[dict[str, Any]]]:
+            return [
+                batch
+                async for batch in self.backend.astream(
+                    collection,  # type: ignore[arg-type]
+                    [self.p.in_("id", [1, 2, 3])],
+                    batch_size=2,
+                )
+            ]
+
+        batches = asyncio.run(collect())
+        assert [[d["_id"] for d in batch] for batch in batches] == [[1, 2], [3]]
+        assert collection.filters == [{"_id": {"$in": [1, 2, 3]}}]
+        assert collection.async_cursor.closed
+
+
+class TestPymongoBackendPipeline:
+    lookup = {
+        "$lookup": {
+            "from": "customers",
+            "localField": "customer_id",
+            "foreignField": "_id",
+            "as": "customer",
+        }
+    }
+
+    def setup_method(self) -> None:
+        self.backend = PymongoBackend(alias_id=True)
+        self.p = Predicate()
+
+    def test_splits_conditions(self) -> None:
+        p = self.p
+        pipeline = self.backend.pipeline(
+            [
+                p.and_(p.eq("status", "paid"), p.gt("total", 100)),
+                p.eq("customer.country", "DE"),
+            ],
+            [self.lookup, {"$unwind": "$customer"}, {"$sort": {"total": -1}}],
+        )
+        assert pipeline == [
+            {"$match": {"status": "paid", "total": {"$gt": 100}}},
+            self.lookup,
+            {"$unwind": "$customer"},
+            {"$match": {"customer.country": "DE"}},
+            {"$sort": {"total": -1}},
+        ]
+
+    def test_condition_on_several_fields(self) -> None:
+        p = self.p
+        pipeline = self.backend.pipeline(
+            [p.or_(p.eq("id", 1), p.eq("customer.vip", True))],
+            [self.lookup, {"$sort": {"_id": 1}}],
+        )
+        assert pipeline == [
+            self.lookup,
+            {"$match": {"$or": [{"_id": 1}, {"customer.vip": True}]}},
+            {"$sort": {"_id": 1}},
+        ]
+
+    @pytest.mark.parametrize(
+        "stage",
+        [
+            {"$group": {"_id": "$status"}},
+            {"$project": {"status": 1}},
+            {"$limit": 10},
+            {"$skip": 10},
+        ],
+    )
+    def test_barrier_stages(self, stage: dict[str, Any]) -> None:
+        pipeline = self.backend.pipeline([self.p.eq("status", "paid")], [stage])
+        assert pipeline == [stage, {"$match": {"status": "paid"}}]
+
+    @pytest.mark.parametrize(
+        "stage, field",
+        [
+            ({"$addFields": {"score.total": 1}}, "score"),
+            ({"$set": {"score": 1}}, "score"),
+            ({"$unset": ["score"]}, "score"),
+            ({"$unset": "score"}, "score"),
+            ({"$unwind": {"path": "$items", "includeArrayIndex": "index"}}, "items"),
+            ({"$unwind": {"path": "$items", "includeArrayIndex": "index"}}, "index"),
+            ({"$graphLookup": {"as": "tree"}}, "tree"),
+        ],
+    )
+    def test_written_fields(self, stage: dict[str, Any], field: str) -> None:
+        p = self.p
+        pipeline = self.backend.pipeline(
+            [p.eq("status", "paid"), p.gt(field, 1)], [stage]
+        )
+        assert pipeline == [
+            {"$match": {"status": "paid"}},
+            stage,
+            {"$match": {field: {"$gt": 1}}},
+        ]
+
+    def test_no_conditions(self) -> None:
+        assert self.backend.pipeline([], [self.lookup]) == [self.lookup]
+
+    def test_no_stages(self) -> None:
+        assert self.backend.pipeline([self.p.eq("a", 1)], []) == [{"$match": {"a": 1}}]
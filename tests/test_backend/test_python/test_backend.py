@@ -0,0 +1,250 @@
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from charter._backends import load_backend
+from charter._backends.python import PythonBackend
+from charter._exc import UnsupportedOperationError
+from charter._ops import Operation, Operator, Param
+from charter._predicate import Predicate
+
+
+@dataclass
+class User:
+    id: int
+    name: str | None
+    age: int | None
+    role: str
+
+
+USERS = [
+    User(id=1, name="Alice", age=30, role="admin"),
+    User(id=2, name="bob", age=17, role="user"),
+    User(id=3, name=None, age=None, role="user"),
+    User(id=4, name="Carol Bobson", age=45, role="guest"),
+]
+
+
+@dataclass
+class Document:
+    id: int
+    meta: dict[str, Any] | None
+
+
+p = Predicate()
+
+
+class TestPythonBackend:
+    def setup_method(self) -> None:
+        self.backend = PythonBackend()
+
+    def select(self, operations: list[Operation], records: Any = USERS) -> list[int]:
+        predicate = self.backend.transform(operations)
+        return [
+            record["id"] if isinstance(record, dict) else record.id
+            for record in records
+            if predicate(record)
+        ]
+
+    def test_load_backend(self) -> None:
+        assert load_backend("python") is PythonBackend
+
+    def test_empty_operations(self) -> None:
+        assert self.select([]) == [1, 2, 3, 4]
+
+    @pytest.mark.parametrize(
+        "operation, expected",
+        [
+            (p.eq("role", "user"), [2, 3]),
+            (p.eq("name", None), [3]),
+            (p.neq("role", "user"), [1, 4]),
+            (p.neq("name", None), [1, 2, 4]),
+            (p.neq("name", "bob"), [1, 4]),
+            (p.in_("id", [1, 3, 99]), [1, 3]),
+            (p.in_("name", [["unhashable"], "bob"]), [2]),
+            (p.gt("age", 30), [4]),
+            (p.gte("age", 30), [1, 4]),
+            (p.lt("age", 30), [2]),
+            (p.lte("age", 30), [1, 2]),
+            (p.contains("name", "Bob"), [4]),
+            (p.contains("name", "BOB", ignore_case=True), [2, 4]),
+            (p.regex("name", r"^[A-Z]"), [1, 4]),
+            (p.regex("name", r"son$"), [4]),
+        ],
+    )
+    def test_operators(self, operation: Operation, expected: list[int]) -> None:
+        assert self.select([operation]) == expected
+
+    @pytest.mark.parametrize(
+        "operations, expected",
+        [
+            ([p.and_(p.eq("role", "user"), p.gt("age", 10))], [2]),
+            ([p.or_(p.eq("role", "admin"), p.eq("role", "guest"))], [1, 4]),
+            ([p.not_(p.eq("role", "user"))], [1, 4]),
+            ([p.not_(p.eq("role", "user"), p.gt("age", 10))], [1, 3, 4]),
+            ([p.not_in("id", [1, 2])], [3, 4]),
+            ([p.eq("role", "user"), p.lt("age", 18)], [2]),
+            (
+                [
+                    p.or_(
+                        p.and_(p.eq("role", "admin"), p.gte("age", 18)),
+                        p.not_(p.neq("name", None)),
+                    )
+                ],
+                [1, 3],
+            ),
+        ],
+    )
+    def test_logic_operators(
+        self, operations: list[Operation], expected: list[int]
+    ) -> None:
+        assert self.select(operations) == expected
+
+    def test_short_circuit(self) -> None:
+        calls: list[str] = []
+
+        class Record:
+            def __getattr__(self, name: str) -> Any:
+                calls.append(name)
+                return 1
+
+        predicate = self.backend.transform([p.or_(p.eq("a", 1), p.eq("b", 1))])
+        assert predicate(Record())
+        assert calls == ["a"]
+
+    def test_item_accessor(self) -> None:
+        self.backend = PythonBackend(accessor="item")
+        records = [{"id": 1, "age": 20}, {"id": 2}]
+        assert self.select([p.gt("age", 10)], records) == [1]
+
+    def test_attribute_accessor(self) -> None:
+        self.backend = PythonBackend(accessor="attribute")
+        assert self.select([p.gt("age", 40)]) == [4]
+
+    def test_auto_accessor_mixed_records(self) -> None:
+        records = [{"id": 10, "age": 50}, *USERS]
+        assert self.select([p.gt("age", 40)], records) == [10, 4]
+
+    @pytest.mark.parametrize(
+        "operation, expected",
+        [
+            (p.eq("meta.color", "red"), [1, 2]),
+            (p.gt("meta.size.width", 3), [3]),
+            (p.not_(p.eq("meta.color", "red")), [3, 4, 5]),
+            (p.eq("meta.color.x", None), [1, 2, 3, 4, 5]),
+        ],
+    )
+    def test_dotted_paths(self, operation: Operation, expected: list[int]) -> None:
+        records = [
+            {"id": 1, "meta": {"color": "red", "size": {"width": 2}}},
+            Document(id=2, meta={"color": "red"}),
+            {"id": 3, "meta": {"size": {"width": 5}}},
+            {"id": 4, "meta": None},
+            {"id": 5},
+        ]
+        self.backend = PythonBackend(dotted_paths=True)
+        assert self.select([operation], records) == expected
+
+    def test_dotted_paths_disabled(self) -> None:
+        records = [{"id": 1, "a.b": 1, "a": {"b": 2}}]
+        assert self.select([p.eq("a.b", 1)], records) == [1]
+
+    @pytest.mark.parametrize(
+        "operation, expected",
+        [
+            (p.any_("tags", ["a", "z"]), [1, 2]),
+            (p.all_("tags", ["a", "b"]), [1]),
+            (p.elem_match("items", p.eq("sku", "x"), p.gt("qty", 1)), [2]),
+            (p.elem_match("items", p.eq("sku", "x")), [1, 2]),
+            (p.not_(p.elem_match("items", p.gt("qty", 1))), [1, 3, 4]),
+        ],
+    )
+    def test_array_operators(self, operation: Operation, expected: list[int]) -> None:
+        records = [
+            {"id": 1, "tags": ["a", "b"], "items": [{"sku": "x", "qty": 1}]},
+            {"id": 2, "tags": ["z"], "items": [{"sku": "y"}, {"sku": "x", "qty": 2}]},
+            {"id": 3, "tags": [], "items": []},
+            {"id": 4, "tags": None, "items": None},
+        ]
+        self.backend = PythonBackend(accessor="item")
+        assert self.select([operation], records) == expected
+
+    @pytest.mark.parametrize(
+        "operation, expected",
+        [
+            (p.in_("tags", ["a", "b"]), [3]),
+            (p.in_("tags", [["a"], "b"]), [1, 3]),
+            (p.any_("items", ["a", 1]), [1, 2]),
+            (p.any_("items", [["a"], 1]), [1]),
+        ],
+    )
+    def test_membership_with_unhashable_values(
+        self, operation: Operation, expected: list[int]
+    ) -> None:
+        records = [
+            {"id": 1, "tags": ["a"], "items": [["a"], 1]},
+            {"id": 2, "tags": {"a": 1}, "items": [{"a": 1}, "a"]},
+            {"id": 3, "tags": "b", "items": [{"a": 1}]},
+        ]
+        self.backend = PythonBackend(accessor="item")
+        assert self.select([operation], records) == expected
+
+    def test_field_names_are_not_evaluated(self) -> None:
+        records = [{"id": 1, "a') or True or ('": 1}]
+        assert self.select([p.eq("a') or True or ('", 2)], records) == []
+
+    def test_invalid_accessor(self) -> None:
+        with pytest.raises(ValueError, match="Unknown accessor: invalid"):
+            PythonBackend(accessor="invalid")  # type: ignore[arg-type]
+
+    def test_param_not_supported(self) -> None:
+        with pytest.raises(UnsupportedOperationError, match="Param placeholders"):
+            self.backend.transform([p.gt("age", Param("age"))])
+
+    def test_unsupported_operator(self) -> None:
+        op = Operator.model_construct(operator="invalid", field="a", value=1)
+        with pytest.raises(UnsupportedOperationError, match="Unsupported operator"):
+            self.backend.transform([op])
+
+    @pytest.mark.parametrize("depth", [49, 50, 51, 10000])
+    def test_deep_tree(self, depth: int) -> None:
+        operation: Operation = p.eq("role", "user")
+        for i in range(depth):
+            operation = p.not_(operation) if i % 2 else p.or_(operation, p.gt("id", 3))
+
+        predicate = self.backend.transform([operation])
+
+        for user in USERS:
+            expected = user.role == "user"
+            for i in range(depth):
+                expected = not expected if i % 2 else expected or user.id > 3
+            assert predicate(user) is expected
+
+
+class TestPythonBackendPerformance:
+    def test_compiled_filter(self) -> None:
+        records = [
+            {"id": i, "age": i % 90, "role": ("admin", "user", "guest")[i % 3]}
+            for i in range(100000)
+        ]
+        predicate = PythonBackend(accessor="item").transform(
+            [
+                p.and_(
+                    p.in_("role", ["admin", "guest"]),
+                    p.or_(p.lt("age", 18), p.gte("age", 65)),
+                )
+            ]
+        )
+
+        start_time = time.time()
+        result = [record for record in records if predicate(record)]
+        end_time = time.time()
+
+        assert end_time - start_time < 0.5
+        assert len(result) == sum(
+            1
+            for record in records
+            if record["role"] != "user" and not 18 <= record["age"] < 65
+        )
@@ -0,0 +1,295 @@
+import sqlite3
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from charter._backends import load_backend
+from charter._backends.sql import SQLBackend, SQLDialect, SQLQuery
+from charter._exc import TransformationError, UnsupportedOperationError
+from charter._ops import (
+    LogicOperatorNode,
+    LogicOperators,
+    Operation,
+    Operator,
+    OperatorNode,
+    Operators,
+    Param,
+)
+from charter._predicate import Predicate
+
+USERS = [
+    (1, "Alice", 30, "admin"),
+    (2, "bob", 17, "user"),
+    (3, None, None, "user"),
+    (4, "Carol Bobson", 45, "guest"),
+    (5, "50% off_", 20, "guest"),
+]
+
+p = Predicate()
+
+
+@pytest.fixture
+def connection() -> Iterator[sqlite3.Connection]:
+    connection = sqlite3.connect(":memory:")
+    SQLBackend.create_regexp(connection)
+    connection.execute("CREATE TABLE users (id, name, age, role)")
+    connection.executemany("INSERT INTO users VALUES (?, ?, ?, ?)", USERS)
+    yield connection
+    connection.close()
+
+
+class TestSQLBackend:
+    backend = SQLBackend(["id", "name", "age", "role"], table="users")
+
+    def select(
+        self,
+        connection: sqlite3.Connection,
+        operations: list[Operation],
+        values: dict[str, Any] | None = None,
+    ) -> list[int]:
+        query = self.backend.transform(operations)
+        parameters = query.parameters if values is None else query.bind(values)
+        rows = connection.execute(
+            f"SELECT id FROM users WHERE {query.where} ORDER BY id", parameters
+        )
+        return [row[0] for row in rows]
+
+    def test_load_backend(self) -> None:
+        assert load_backend("sql") is SQLBackend
+
+    def test_transform(self) -> None:
+        query = self.backend.transform(
+            [p.or_(p.eq("role", "admin"), p.in_("id", [1, 2])), p.eq("name", None)]
+        )
+        assert query == SQLQuery(
+            '(("users"."role" = ? OR "users"."id" IN (?, ?))'
+            ' AND "users"."name" IS NULL)',
+            ("admin", 1, 2),
+        )
+
+    def test_empty_operations(self, connection: sqlite3.Connection) -> None:
+        assert self.select(connection, []) == [1, 2, 3, 4, 5]
+
+    @pytest.mark.parametrize(
+        "operation, expected",
+        [
+            (p.eq("role", "user"), [2, 3]),
+            (p.eq("name", None), [3]),
+            (p.neq("role", "user"), [1, 4, 5]),
+            (p.neq("name", None), [1, 2, 4, 5]),
+            (p.in_("id", [1, 3, 99]), [1, 3]),
+            (OperatorNode(Operators.IN, "id", []), []),
+            (p.gt("age", 30), [4]),
+            (p.gte("age", 30), [1, 4]),
+            (p.lt("age", 30), [2, 5]),
+            (p.lte("age", 30), [1, 2, 5]),
+            (p.contains("name", "Bob"), [4]),
+            (p.contains("name", "BOB", ignore_case=True), [2, 4]),
+            (p.contains("name", "% off_"), [5]),
+            (p.regex("name", r"^[A-Z]"), [1, 4]),
+            (p.regex("name", r"son$"), [4]),
+        ],
+    )
+    def test_operators(
+        self, connection: sqlite3.Connection, operation: Operation, expected: list[int]
+    ) -> None:
+        assert self.select(connection, [operation]) == expected
+
+    @pytest.mark.parametrize(
+        "operations, expected",
+        [
+            ([p.and_(p.eq("role", "user"), p.gt("age", 10))], [2]),
+            ([p.or_(p.eq("role", "admin"), p.eq("role", "guest"))], [1, 4, 5]),
+            ([LogicOperatorNode(LogicOperators.OR, [])], []),
+            ([p.not_(p.eq("role", "user"))], [1, 4, 5]),
+            ([p.not_(p.eq("role", "guest"), p.gt("age", 25))], [1, 2, 3, 5]),
+            ([p.not_in("id", [1, 2])], [3, 4, 5]),
+            ([p.eq("role", "user"), p.lt("age", 18)], [2]),
+        ],
+    )
+    def test_logic_operators(
+        self,
+        connection: sqlite3.Connection,
+        operations: list[Operation],
+        expected: list[int],
+    ) -> None:
+        assert self.select(connection, operations) == expected
+
+    def test_params(self, connection: sqlite3.Connection) -> None:
+        operations = [
+            p.gte("age", Param("min_age")),
+            p.contains("name", Param("name"), ignore_case=True),
+        ]
+        values = {"min_age": 18, "name": "BOB"}
+        assert self.select(connection, operations, values) == [4]
+
+    def test_contains_ignore_case_non_ascii(
+        self, connection: sqlite3.Connection
+    ) -> None:
+        connection.execute("INSERT INTO users VALUES (6, 'ÉCOLE Øst', 30, 'user')")
+        operations = [p.contains("name", "école øst", ignore_case=True)]
+        assert self.select(connection, operations) == []
+
+        SQLBackend.create_lower(connection)
+        assert self.select(connection, operations) == [6]
+
+    def test_missing_param(self) -> None:
+        query = self.backend.transform([p.gte("age", Param("min_age"))])
+        with pytest.raises(TransformationError, match="'min_age'"):
+            query.bind({})
+
+    @pytest.mark.parametrize(
+        "paramstyle, where, parameters",
+        [
+            ("qmark", '("a" = ? AND "b" IN (?, ?))', (1, 2, 3)),
+            ("numeric", '("a" = :1 AND "b" IN (:2, :3))', (1, 2, 3)),
+            ("named", '("a" = :p1 AND "b" IN (:p2, :p3))', {"p1": 1, "p2": 2, "p3": 3}),
+            ("format", '("a" = %s AND "b" IN (%s, %s))', (1, 2, 3)),
+            (
+                "pyformat",
+                '("a" = %(p1)s AND "b" IN (%(p2)s, %(p3)s))',
+                {"p1": 1, "p2": 2, "p3": 3},
+            ),
+        ],
+    )
+    def test_paramstyle(self, paramstyle: Any, where: str, parameters: Any) -> None:
+        backend = SQLBackend(["a", "b"], paramstyle=paramstyle)
+        query = backend.transform([p.eq("a", 1), p.in_("b", [2, 3])])
+        assert query == SQLQuery(where, parameters)
+
+    def test_named_paramstyle_runs(self, connection: sqlite3.Connection) -> None:
+        self.backend = SQLBackend(["id", "age"], paramstyle="named")
+        assert self.select(connection, [p.gt("age", 18), p.lt("id", 4)]) == [1]
+
+    @pytest.mark.parametrize(
+        "dialect, where",
+        [
+            ("postgresql", '("a" ~ %s AND strpos(lower("b"), %s) > 0)'),
+            ("mysql", "(REGEXP_LIKE(`a`, %s, 'c') AND INSTR(LOWER(`b`), %s) > 0)"),
+        ],
+    )
+    def test_dialect(self, dialect: Any, where: str) -> None:
+        backend = SQLBackend(["a", "b"], paramstyle="format", dialect=dialect)
+        query = backend.transform(
+            [p.regex("a", "^x"), p.contains("b", "Y", ignore_case=True)]
+        )
+        assert query == SQLQuery(where, ("^x", "y"))
+
+    def test_custom_dialect(self) -> None:
+        dialect = SQLDialect(
+            quote="[",
+            contains="{column} LIKE {value}",
+            contains_ignore_case="{column} ILIKE {value}",
+            regex="{column} SIMILAR TO {value}",
+        )
+        query = SQLBackend(["a"], dialect=dialect).transform([p.regex("a", "x%")])
+        assert query.where == "[a[ SIMILAR TO ?"
+
+    def test_in_param(self) -> None:
+        backend = SQLBackend(["id"], paramstyle="format", dialect="postgresql")
+        query = backend.transform([p.in_("id", Param("ids"))])
+        assert query.where == '"id" = ANY(%s)'
+        assert query.bind({"ids": [1, 2]}) == ([1, 2],)
+
+        with pytest.raises(UnsupportedOperationError, match="'in'"):
+            self.backend.transform([p.in_("id", Param("ids"))])
+
+    def test_column_mapping(self, connection: sqlite3.Connection) -> None:
+        self.backend = SQLBackend({"user_id": "id"})
+        assert self.select(connection, [p.eq("user_id", 2)]) == [2]
+
+    def test_field_not_allowed(self) -> None:
+        with pytest.raises(AttributeError, match="'password' is not an allowed"):
+            self.backend.transform([p.eq("password", "x")])
+
+    def test_identifiers_are_quoted(self) -> None:
+        backend = SQLBackend({"a": 'a" OR 1=1 --'})
+        assert backend.transform([p.eq("a", 1)]).where == '"a"" OR 1=1 --" = ?'
+
+    def test_values_are_parameters(self, connection: sqlite3.Connection) -> None:
+        assert self.select(connection, [p.eq("name", "x' OR '1'='1")]) == []
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"paramstyle": "dollar"}, "Unknown paramstyle: dollar"),
+            ({"dialect": "oracle"}, "Unknown dialect: oracle"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: dict[str, Any], message: str) -> None:
+        with pytest.raises(ValueError, match=message):
+            SQLBackend(["a"], **kwargs)
+
+    def test_unsupported_operator(self) -> None:
+        op = Operator.model_construct(operator="invalid", field="id", value=1)
+        with pytest.raises(UnsupportedOperationError, match="Unsupported operator"):
+            self.backend.transform([op])
+
+    @pytest.mark.parametrize(
+        "operation, reason",
+        [
+            (p.eq("name", "a"), None),
+            (p.contains("name", "a"), "renders a substring search"),
+            (p.regex("name", "^a"), "renders a regular expression match"),
+        ],
+    )
+    def test_non_sargable_reason(self, operation: Any, reason: str | None) -> None:
+        assert self.backend.non_sargable_reason(operation) == reason
+
+    def test_deep_tree(self) -> None:
+        operation: Operation = p.eq("role", "user")
+        for _ in range(10000):
+            operation = p.not_(p.or_(operation, p.gt("id", 3)))
+
+        query = self.backend.transform([operation])
+        assert query.where.count("NOT") == 10000
+        assert len(query.parameters) == 10001
+
+
+class TestSQLBackendPerformance:
+    def test_faster_than_sqlalchemy(self) -> None:
+        sa = pytest.importorskip("sqlalchemy")
+        from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+        from charter._backends.sqlalchemy import SQLAlchemyBackend
+
+        class Base(DeclarativeBase):
+            pass
+
+        class User(Base):
+            __tablename__ = "users"
+            id: Mapped[int] = mapped_column(primary_key=True)
+            age: Mapped[int]
+            role: Mapped[str]
+
+        operations = [
+            p.and_(
+                p.in_("role", ["admin", "guest"]),
+                p.or_(p.lt("age", 18), p.gte("age", 65)),
+                p.neq("id", 1),
+            )
+        ]
+        sql_backend = SQLBackend(["id", "age", "role"], table="users")
+        sqlalchemy_backend = SQLAlchemyBackend(User)
+        dialect = sa.create_engine("sqlite://").dialect
+
+        def best_time(function: Any) -> float:
+            times = []
+            for _ in range(3):
+                start_time = time.perf_counter()
+                for _ in range(200):
+                    function()
+                times.append(time.perf_counter() - start_time)
+            return min(times)
+
+        raw = best_time(lambda: sql_backend.transform(operations))
+        compiled = best_time(
+            lambda: (
+                sa.select(User)
+                .where(sqlalchemy_backend.transform(operations))
+                .compile(dialect=dialect)
+            )
+        )
+        assert raw * 5 < compiled
@@ -1,16 +1,26 @@
+import asyncio
+import random
+import time
+from array import array
+from typing import Any
+
 import pytest
 import sqlalchemy as sa
 from sqlalchemy.dialects import mysql, oracle, postgresql, sqlite
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
-from charter._backends.sqlalchemy import SQLAlchemyBackend
+from charter import IndexPlanner, Keyset, SargabilityWarning, push_down_not
+from charter._backends.sqlalchemy import InListThresholds, SQLAlchemyBackend
 from charter._ops import (
     ContainsData,
     LogicOperator,
     LogicOperators,
+    Operation,
     Operator,
     Operators,
+    Param,
 )
+from charter._predicate import Predicate
 
 DEFAULT_DIALECT = postgresql.dialect()
 DIALECT_MAPPING = {
@@ -33,6 +43,35 @@ class User(Base):
     role: Mapped[str]
 
 
+class Reading(Base):
+    __tablename__ = "readings"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    a: Mapped[int | None]
+    b: Mapped[int | None]
+
+
+class Prefixed(sa.TypeDecorator[str]):
+    impl = sa.String
+    cache_ok = True
+
+    def process_bind_param(self, value: str | None, dialect: sa.Dialect) -> str | None:
+        return None if value is None else f"p:{value}"
+
+    def process_result_value(
+        self, value: str | None, dialect: sa.Dialect
+    ) -> str | None:
+        return None if value is None else value[2:]
+
+
+class Attachment(Base):
+    __tablename__ = "attachments"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    digest: Mapped[bytes] = mapped_column(sa.LargeBinary)
+    code: Mapped[str] = mapped_column(Prefixed)
+
+
 class TestSQLAlchemyBackend:
     def setup_method(self) -> None:
         self.backend = SQLAlchemyBackend(User)
@@ -306,3 +345,593 @@ class TestSQLAlchemyBackend:
         result = self.backend._transform_logic_operator(operator)
         compiled = self.compile_sa_stmt(result)
         assert compiled == expected
+
+    def test_transform_unvalidated_nodes(self) -> None:
+        p = Predicate(validate=False)
+        result = self.backend.transform(
+            [p.or_(p.eq("name", "test"), p.in_("age", [20, 30])), p.gt("id", 1)]
+        )
+        assert (
+            self.compile_sa_stmt(result)
+            == "(users.name = 'test' OR users.age IN (20, 30)) AND users.id > 1"
+        )
+
+    @pytest.mark.parametrize(
+        "operator, expected",
+        [
+            (
+                Operator(field="age", operator=Operators.GTE, value=Param("min_age")),
+                "users.age >= %(min_age)s::INTEGER",
+            ),
+            (
+                Operator(field="age", operator=Operators.IN, value=Param("ages")),
+                "users.age IN (__[POSTCOMPILE_ages])",
+            ),
+            (
+                Operator(field="age", operator=Operators.EQ, value=Param("age")),
+                "users.age = %(age)s::INTEGER",
+            ),
+            (
+                Operator(field="age", operator=Operators.NEQ, value=Param("age")),
+                "users.age != %(age)s::INTEGER",
+            ),
+            (
+                Operator(field="name", operator=Operators.CONTAINS, value=Param("q")),
+                "users.name LIKE ('%%' || %(q)s::VARCHAR || '%%')",
+            ),
+            (
+                Operator(
+                    field="name",
+                    operator=Operators.CONTAINS,
+                    value=ContainsData(value=Param("q"), ignore_case=True),
+                ),
+                "users.name ILIKE ('%%' || %(q)s::VARCHAR || '%%')",
+            ),
+        ],
+    )
+    def test__transform_operator_param(self, operator: Operator, expected: str) -> None:
+        result = self.backend._transform_operator(operator)
+        compiled = str(
+            result.compile(
+                dialect=DEFAULT_DIALECT,
+                compile_kwargs={"literal_binds": False},
+            )
+        )
+        assert (
+            compiled.replace("%(param_1)s::VARCHAR", "'%%'").replace(
+                "%(param_2)s::VARCHAR", "'%%'"
+            )
+            == expected
+        )
+
+    def test_param_template_execution(self) -> None:
+        p = Predicate()
+        engine = sa.create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(
+                sa.insert(User),
+                [
+                    {"id": i, "name": f"user_{i}", "age": 20 + i, "role": "user"}
+                    for i in range(10)
+                ],
+            )
+
+        stmt = sa.select(User.id).where(
+            self.backend.transform(
+                [p.gte("age", Param("min_age")), p.in_("role", Param("roles"))]
+            )
+        )
+
+        with engine.connect() as connection:
+            first = connection.execute(stmt, {"min_age": 27, "roles": ["user"]})
+            assert first.scalars().all() == [7, 8, 9]
+            cache_size = len(engine._compiled_cache)  # type: ignore[attr-defined]
+
+            second = connection.execute(stmt, {"min_age": 29, "roles": ["user"]})
+            assert second.scalars().all() == [9]
+            assert len(engine._compiled_cache) == cache_size  # type: ignore[attr-defined]
+
+    @pytest.mark.parametrize("value", [None, 1, 5])
+    @pytest.mark.parametrize("operator", [Operators.EQ, Operators.NEQ])
+    def test_nullable_params(self, operator: Operators, value: int | None) -> None:
+        engine = sa.create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(
+                sa.insert(Reading),
+                [{"id": i, "a": a} for i, a in enumerate([None, 1, 2, None, 1])],
+            )
+
+        backend = SQLAlchemyBackend(Reading, nullable_params=True)
+        stmt = sa.select(Reading.id).order_by(Reading.id)
+        template = stmt.where(
+            backend.transform(
+                [Operator(field="a", operator=operator, value=Param("a"))]
+            )
+        )
+        literal = stmt.where(
+            backend.transform([Operator(field="a", operator=operator, value=value)])
+        )
+        with engine.connect() as connection:
+            expected = connection.scalars(literal).all()
+            assert connection.scalars(template, {"a": value}).all() == expected
+
+    def test__transform_operator_in_typed_array(self) -> None:
+        result = self.backend._transform_operator(
+            Operator(field="age", operator=Operators.IN, value=array("q", [20, 30]))
+        )
+        assert self.compile_sa_stmt(result) == "users.age IN (20, 30)"
+
+
+class TestSQLAlchemyBackendDeepTree:
+    def test_transform_deep_tree(self) -> None:
+        p = Predicate(validate=False)
+        logic = [p.and_, p.or_, p.not_]
+        operation: Operation = p.eq("name", "test")
+        for i in range(10000):
+            operation = logic[i % 3](operation, p.gte("age", i))
+
+        start_time = time.time()
+        criteria = SQLAlchemyBackend(User).transform([operation])
+        end_time = time.time()
+
+        assert isinstance(criteria, sa.ColumnElement)
+        assert end_time - start_time < 2.0
+
+
+class TestInListStrategy:
+    thresholds = InListThresholds(literal=4, values=10, temp_table=100)
+
+    def setup_class(self) -> None:
+        self.engine = sa.create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            connection.execute(
+                sa.insert(User),
+                [
+                    {"id": i, "name": f"user_{i}", "age": i % 100, "role": "user"}
+                    for i in range(1000)
+                ],
+            )
+
+    def setup_method(self) -> None:
+        self.backend = SQLAlchemyBackend(User, in_thresholds=self.thresholds)
+
+    def select_ids(self, values: list[int]) -> list[int]:
+        stmt = sa.select(User.id).where(
+            self.backend.transform([Predicate().in_("id", values)])
+        )
+        with self.engine.begin() as connection:
+            with self.backend.temp_tables(connection, stmt):
+                return sorted(connection.execute(stmt).scalars())
+
+    @pytest.mark.parametrize(
+        "size, expected",
+        [
+            (3, "users.id IN (__[POSTCOMPILE_param_1])"),
+            (4, "users.id IN (__[POSTCOMPILE_id_1])"),
+            (10, "users.id IN (VALUES (0), (3), (6)"),
+            (100, "users.id IN (SELECT charter_in_"),
+        ],
+    )
+    def test_strategy_by_size(self, size: int, expected: str) -> None:
+        values = list(range(0, size * 3, 3))
+        criteria = self.backend.transform([Predicate().in_("id", values)])
+        compiled = str(criteria.compile(dialect=sqlite.dialect()))
+        assert compiled.startswith(expected)
+
+    def test_inline_literals(self) -> None:
+        criteria = self.backend.transform([Predicate().in_("id", [1, 2])])
+        with self.engine.connect() as connection:
+            compiled = criteria.compile(connection)
+            assert compiled.params == {"param_1": [1, 2]}
+        assert self.select_ids([2, 1]) == [1, 2]
+
+    @pytest.mark.parametrize("size", [3, 4, 10, 100, 150])
+    def test_execution(self, size: int) -> None:
+        values = list(range(0, size * 3, 3))
+        assert self.select_ids(values) == [v for v in values if v < 1000]
+
+    @pytest.mark.parametrize(
+        "dialect, expected",
+        [
+            ("postgresql", "users.name IN (VALUES ('a'), ('O''Brien'))"),
+            ("mysql", "users.name IN (VALUES ROW('a'), ROW('O''Brien'))"),
+        ],
+    )
+    def test_values_rendering(self, dialect: str, expected: str) -> None:
+        backend = SQLAlchemyBackend(User, in_thresholds=InListThresholds(values=2))
+        criteria = backend.transform([Predicate().in_("name", ["a", "O'Brien"])])
+        assert str(criteria.compile(dialect=DIALECT_MAPPING[dialect])) == expected
+
+    def test_values_negated(self) -> None:
+        stmt = sa.select(User.id).where(
+            self.backend.transform([Predicate().not_in("id", list(range(2, 52)))])
+        )
+        with self.engine.connect() as connection:
+            result = connection.execute(stmt).scalars().all()
+        assert result == [0, 1, *range(52, 1000)]
+
+    def test_temp_table_duplicates_and_cleanup(self) -> None:
+        values = [5, 7] * 60
+        stmt = sa.select(User.id).where(
+            self.backend.transform([Predicate().in_("id", values)])
+        )
+        with self.engine.begin() as connection:
+            with self.backend.temp_tables(connection, stmt):
+                assert sorted(connection.execute(stmt).scalars()) == [5, 7]
+                names = sa.inspect(connection).get_temp_table_names()
+                assert len(names) == 1
+            assert sa.inspect(connection).get_temp_table_names() == []
+
+    def test_temp_tables_without_temp_table(self) -> None:
+        stmt = sa.select(User.id).where(User.id == 1)
+        with self.engine.begin() as connection:
+            with self.backend.temp_tables(connection, stmt):
+                assert connection.execute(stmt).scalars().all() == [1]
+
+    @pytest.mark.parametrize("size", [1, 3, 500, 5000])
+    def test_default_is_plain_in(self, size: int) -> None:
+        backend = SQLAlchemyBackend(User)
+        criteria = backend.transform([Predicate().in_("id", list(range(size)))])
+        compiled = str(criteria.compile(dialect=sqlite.dialect()))
+        assert compiled == "users.id IN (__[POSTCOMPILE_id_1])"
+
+    def test_disabled_strategies(self) -> None:
+        backend = SQLAlchemyBackend(
+            User, in_thresholds=InListThresholds(None, None, None)
+        )
+        criteria = backend.transform([Predicate().in_("id", list(range(500)))])
+        assert "POSTCOMPILE_id_1" in str(criteria.compile(dialect=sqlite.dialect()))
+
+    @pytest.mark.parametrize(
+        "operation, expected",
+        [
+            (Predicate().in_("digest", [b"\x00a", b"zz"]), [1]),
+            (Predicate().in_("code", ["b", "zz"]), [2]),
+            (Predicate().in_("code", [f"c{i}" for i in range(2000)]), []),
+        ],
+    )
+    def test_default_uses_bind_processing(
+        self, operation: Operation, expected: list[int]
+    ) -> None:
+        with self.engine.begin() as connection:
+            Attachment.__table__.create(connection, checkfirst=True)
+            connection.execute(sa.delete(Attachment))
+            connection.execute(
+                sa.insert(Attachment),
+                [
+                    {"id": 1, "digest": b"\x00a", "code": "a"},
+                    {"id": 2, "digest": b"\x00b", "code": "b"},
+                ],
+            )
+            stmt = sa.select(Attachment.id).where(
+                SQLAlchemyBackend(Attachment).transform([operation])
+            )
+            assert connection.execute(stmt).scalars().all() == expected
+
+    def test_beyond_bind_parameter_limit(self) -> None:
+        backend = SQLAlchemyBackend(User, in_thresholds=InListThresholds(values=1000))
+        values = list(range(40000))
+        stmt = sa.select(sa.func.count()).where(
+            backend.transform([Predicate().in_("id", values)])
+        )
+
+        start_time = time.time()
+        with self.engine.connect() as connection:
+            count = connection.execute(stmt).scalar()
+        end_time = time.time()
+
+        assert count == 1000
+        assert end_time - start_time < 1.0
+
+
+class TestPushDownNot:
+    def test_equivalent_on_random_trees(self) -> None:
+        from tests.test__optimize.test_push_down_not import random_tree
+
+        rng = random.Random(0)
+        engine = sa.create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(
+                sa.insert(Reading),
+                [
+                    {
+                        "id": i,
+                        "a": rng.choice([None, 0, 1, 2, 3]),
+                        "b": rng.choice([None, 0, 1, 2, 3]),
+                    }
+                    for i in range(200)
+                ],
+            )
+
+        backend = SQLAlchemyBackend(Reading)
+        with engine.connect() as connection:
+
+            def ids(operations: list[Operation]) -> list[int]:
+                stmt = sa.select(Reading.id).where(backend.transform(operations))
+                return list(connection.scalars(stmt.order_by(Reading.id)))
+
+            for _ in range(100):
+                operations = [random_tree(rng, 4) for _ in range(rng.randint(1, 3))]
+                result = push_down_not(operations, null_semantics="sql")
+                assert ids(operations) == ids(result)
+
+
+class Account(Base):
+    __tablename__ = "accounts"
+    __table_args__ = (
+        sa.Index("ix_accounts_role_age", "role", "age_years"),
+        sa.Index("ix_accounts_lower_name", sa.func.lower(sa.column("name")), "role"),
+        sa.UniqueConstraint("email"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    email: Mapped[str]
+    role: Mapped[str]
+    age: Mapped[int] = mapped_column("age_years")
+
+
+class TestIndexPlanner:
+    def test_from_sqlalchemy(self) -> None:
+        planner = IndexPlanner.from_sqlalchemy(Account)
+        assert sorted(planner.indexes) == [("email",), ("id",), ("role", "age")]
+
+    @pytest.mark.parametrize(
+        "use_lower_like, operation, reason",
+        [
+            (False, Predicate().contains("name", "a"), "renders LIKE"),
+            (False, Predicate().contains("name", "a", True), "renders ILIKE"),
+            (True, Predicate().contains("name", "a", True), r"lower\(column\) LIKE"),
+            (False, Predicate().regex("name", "^a"), "renders a REGEXP match"),
+        ],
+    )
+    def test_warnings(
+        self, use_lower_like: bool, operation: Operation, reason: str
+    ) -> None:
+        backend = SQLAlchemyBackend(Account, use_lower_like=use_lower_like)
+        planner = IndexPlanner.from_sqlalchemy(Account)
+        with pytest.warns(SargabilityWarning, match=reason):
+            planner.plan([Predicate().eq("role", "a"), operation], backend)
+
+
+class TestRegexPrefixRange:
+    def setup_method(self) -> None:
+        self.backend = SQLAlchemyBackend(User, regex_prefix_range=True)
+
+    def compile(self, criteria: sa.ColumnElement[bool]) -> str:
+        return str(
+            criteria.compile(
+                dialect=DEFAULT_DIALECT, compile_kwargs={"literal_binds": True}
+            )
+        )
+
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            (
+                "^ACME-2025",
+                "users.name >= 'ACME-2025' AND users.name < 'ACME-2026'",
+            ),
+            (
+                "^ACME-2025-[0-9]+$",
+                "users.name >= 'ACME-2025-' AND users.name < 'ACME-2025.'"
+                " AND (users.name REGEXP '^ACME-2025-[0-9]+$')",
+            ),
+            ("ACME", "users.name REGEXP 'ACME'"),
+        ],
+    )
+    def test_transform(self, pattern: str, expected: str) -> None:
+        criteria = self.backend.transform([Predicate().regex("name", pattern)])
+        assert self.compile(criteria) == expected
+
+    def test_disabled_by_default(self) -> None:
+        criteria = SQLAlchemyBackend(User).transform([Predicate().regex("name", "^A")])
+        assert self.compile(criteria) == "users.name REGEXP '^A'"
+
+    def test_param_pattern(self) -> None:
+        criteria = self.backend.transform([Predicate().regex("name", Param("p"))])
+        assert str(criteria) == "users.name REGEXP :p"
+
+    def test_execution(self) -> None:
+        engine = sa.create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(
+                sa.insert(User),
+                [
+                    {"id": i, "name": name, "age": 30, "role": "user"}
+                    for i, name in enumerate(["ACME-2024", "ACME-2025-1", "ACME-2026"])
+                ],
+            )
+            criteria = self.backend.transform([Predicate().regex("name", "^ACME-2025")])
+            rows = connection.scalars(sa.select(User.name).where(criteria)).all()
+        assert rows == ["ACME-2025-1"]
+
+    def test_sargable(self) -> None:
+        assert self.backend.non_sargable_reason(Predicate().regex("name", "^A")) is None
+        assert self.backend.non_sargable_reason(Predicate().regex("name", "A"))
+
+
+class TestKeysetPagination:
+    def setup_method(self) -> None:
+        self.backend = SQLAlchemyBackend(User)
+        self.engine = sa.create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        rng = random.Random(0)
+        with self.engine.begin() as connection:
+            connection.execute(
+                sa.insert(User),
+                [
+                    {
+                        "id": i,
+                        "name": f"n{i}",
+                        "age": rng.randrange(5),
+                        "role": rng.choice("ab"),
+                    }
+                    for i in range(100)
+                ],
+            )
+
+    def test_order_by(self) -> None:
+        clauses = self.backend.order_by(Keyset("-age", "id"))
+        assert [str(clause) for clause in clauses] == ["users.age DESC", "users.id ASC"]
+
+    @pytest.mark.parametrize(
+        "keys, expected",
+        [
+            (["age", "id"], "(users.age, users.id) > (3, 7)"),
+            (["-age", "-id"], "(users.age, users.id) < (3, 7)"),
+            (
+                ["-age", "id"],
+                "users.age <= 3 AND (users.age < 3 OR users.age = 3 AND users.id > 7)",
+            ),
+        ],
+    )
+    def test_seek(self, keys: list[str], expected: str) -> None:
+        criteria = self.backend.seek(Keyset(*keys), [3, 7])
+        compiled = criteria.compile(
+            dialect=DEFAULT_DIALECT, compile_kwargs={"literal_binds": True}
+        )
+        assert str(compiled) == expected
+
+    def test_seek_without_row_values(self) -> None:
+        criteria = self.backend.seek(Keyset("age", "id"), [3, 7], row_values=False)
+        compiled = criteria.compile(
+            dialect=DEFAULT_DIALECT, compile_kwargs={"literal_binds": True}
+        )
+        assert str(compiled) == (
+            "users.age >= 3 AND (users.age > 3 OR users.age = 3 AND users.id > 7)"
+        )
+
+    @pytest.mark.parametrize(
+        "keys",
+        [
+            ["age", "id"],
+            ["-age", "-id"],
+            ["-age", "id"],
+            ["age", "-id"],
+            ["role", "-age", "id"],
+            ["-role", "age", "-id"],
+        ],
+    )
+    @pytest.mark.parametrize("mode", ["row_values", "expanded", "operations"])
+    def test_pages(self, keys: list[str], mode: str) -> None:
+        keyset = Keyset(*keys)
+        columns = [getattr(User, key.field) for key in keyset.keys]
+        base = sa.select(*columns).order_by(*self.backend.order_by(keyset))
+
+        seen: list[Any] = []
+        cursor = None
+        with self.engine.connect() as connection:
+            expected = connection.execute(base).all()
+            while True:
+                if mode == "operations" or cursor is None:
+                    operations = keyset.filter([], cursor)
+                    stmt = base.where(self.backend.transform(operations))
+                else:
+                    criteria = self.backend.seek(
+                        keyset, keyset.decode(cursor), row_values=mode == "row_values"
+                    )
+                    stmt = base.where(criteria)
+                page = connection.execute(stmt.limit(9)).all()
+                if not page:
+                    break
+                seen.extend(page)
+                cursor = keyset.encode(list(page[-1]))
+
+        assert seen == expected
+
+
+class TestStream:
+    thresholds = InListThresholds(literal=4, values=10, temp_table=100)
+
+    def setup_method(self) -> None:
+        self.backend = SQLAlchemyBackend(User, in_thresholds=self.thresholds)
+        self.engine = sa.create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            connection.execute(
+                sa.insert(User),
+                [
+                    {"id": i, "name": f"user_{i}", "age": i % 10, "role": "user"}
+                    for i in range(50)
+                ],
+            )
+
+    def test_session(self) -> None:
+        with sa.orm.Session(self.engine) as session:
+            batches = list(
+                self.backend.stream(session, [Predicate().lt("age", 3)], batch_size=4)
+            )
+        assert [len(batch) for batch in batches] == [4, 4, 4, 3]
+        users = [user for batch in batches for user in batch]
+        assert all(isinstance(user, User) for user in users)
+        assert sorted(user.id for user in users) == [i for i in range(50) if i % 10 < 3]
+
+    def test_connection_with_statement(self) -> None:
+        with self.engine.connect() as connection:
+            batches = list(
+                self.backend.stream(
+                    connection,
+                    [Predicate().eq("age", 0)],
+                    statement=sa.select(User.id, User.name).order_by(User.id),
+                    batch_size=2,
+                )
+            )
+        assert [[tuple(row) for row in batch] for batch in batches] == [
+            [(0, "user_0"), (10, "user_10")],
+            [(20, "user_20"), (30, "user_30")],
+            [(40, "user_40")],
+        ]
+
+    def test_temp_table_lives_while_streaming(self) -> None:
+        values = list(range(0, 200, 2))
+        with self.engine.connect() as connection:
+            stream = self.backend.stream(
+                connection,
+                [Predicate().in_("id", values)],
+                statement=sa.select(User.id).order_by(User.id),
+                batch_size=10,
+            )
+            ids = [row.id for row in next(stream)]
+            tables = sa.inspect(connection).get_temp_table_names()
+            assert any(name.startswith("charter_in_") for name in tables)
+
+            ids += [row.id for batch in stream for row in batch]
+            assert ids == list(range(0, 50, 2))
+            assert sa.inspect(connection).get_temp_table_names() == []
+
+    def test_astream(self) -> None:
+        pytest.importorskip("greenlet")
+        pytest.importorskip("aiosqlite")
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+        async def collect() -> list[list[int]]:
+            engine = create_async_engine("sqlite+aiosqlite://")
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+                await connection.execute(
+                    sa.insert(User),
+                    [
+                        {"id": i, "name": f"user_{i}", "age": i % 10, "role": "user"}
+                        for i in range(50)
+                    ],
+                )
+            async with AsyncSession(engine) as session:
+                batches = [
+                    [user.id for user in batch]
+                    async for batch in self.backend.astream(
+                        session,
+                        [Predicate().in_("id", list(range(200)))],
+                        batch_size=20,
+                    )
+                ]
+            await engine.dispose()
+            return batches
+
+        batches = asyncio.run(collect())
+        assert [len(batch) for batch in batches] == [20, 20, 10]
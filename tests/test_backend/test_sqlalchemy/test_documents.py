@@ -0,0 +1,182 @@
+from typing import Any
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from charter._backends.sqlalchemy import SQLAlchemyBackend
+from charter._exc import UnsupportedOperationError
+from charter._ops import Operation, Param
+from charter._predicate import Predicate
+
+p = Predicate()
+
+
+class Base(DeclarativeBase): ...
+
+
+class Product(Base):
+    __tablename__ = "products"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    data: Mapped[dict[str, Any]] = mapped_column(JSONB)
+    tags: Mapped[list[str]] = mapped_column(ARRAY(sa.String))
+
+
+class Record(Base):
+    __tablename__ = "records"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    meta: Mapped[dict[str, Any] | None] = mapped_column(sa.JSON)
+
+
+def compile_postgresql(criteria: sa.ColumnElement[bool]) -> tuple[str, Any]:
+    compiled = criteria.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+class TestContainment:
+    backend = SQLAlchemyBackend(Product)
+
+    @pytest.mark.parametrize(
+        "operation, documents",
+        [
+            (p.eq("data.color", "red"), [{"color": "red"}]),
+            (p.eq("data.size.width", 2), [{"size": {"width": 2}}]),
+            (
+                p.in_("data.color", ["red", "blue"]),
+                [{"color": "red"}, {"color": "blue"}],
+            ),
+            (p.any_("data.labels", ["a", "b"]), [{"labels": ["a"]}, {"labels": ["b"]}]),
+            (p.all_("data.labels", ["a", "b"]), [{"labels": ["a", "b"]}]),
+            (
+                p.elem_match("data.variants", p.eq("sku", "x"), p.eq("size.w", 2)),
+                [{"variants": [{"sku": "x", "size": {"w": 2}}]}],
+            ),
+            (p.elem_match("data", p.eq("sku", "x")), [[{"sku": "x"}]]),
+        ],
+    )
+    def test_jsonb(self, operation: Operation, documents: list[Any]) -> None:
+        sql, params = compile_postgresql(self.backend.transform([operation]))
+        assert sql.count("products.data @>") == len(documents)
+        assert list(params.values()) == documents
+        assert self.backend.non_sargable_reason(operation) is None
+
+    @pytest.mark.parametrize(
+        "operation, sql",
+        [
+            (p.any_("tags", ["a", "b"]), "products.tags && %(tags_1)s::VARCHAR[]"),
+            (p.all_("tags", ["a", "b"]), "products.tags @> %(tags_1)s::VARCHAR[]"),
+            (p.all_("tags", Param("tags")), "products.tags @> %(tags)s::VARCHAR[]"),
+        ],
+    )
+    def test_array(self, operation: Operation, sql: str) -> None:
+        assert compile_postgresql(self.backend.transform([operation]))[0] == sql
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            p.gt("data.price", 10),
+            p.contains("data.color", "re"),
+            p.eq("data.color", None),
+        ],
+    )
+    def test_extraction_fallback(self, operation: Operation) -> None:
+        sql, _ = compile_postgresql(self.backend.transform([operation]))
+        assert "->>" in sql
+        assert "@>" not in sql
+        assert (
+            self.backend.non_sargable_reason(operation)
+            == "renders a JSON path extraction"
+        )
+
+    @pytest.mark.parametrize(
+        "operation, message",
+        [
+            (p.eq("data.color", Param("color")), "Param placeholders"),
+            (p.elem_match("data.variants", p.gt("price", 1)), "'elem_match'"),
+            (p.any_("id", [1, 2]), "'any'"),
+        ],
+    )
+    def test_unsupported(self, operation: Operation, message: str) -> None:
+        with pytest.raises(UnsupportedOperationError, match=message):
+            self.backend.transform([operation])
+
+
+class TestJsonPath:
+    @pytest.fixture(autouse=True)
+    def setup_db(self) -> None:
+        self.backend = SQLAlchemyBackend(Record)
+        self.engine = sa.create_engine("sqlite://")
+        Base.metadata.create_all(self.engine, tables=[Record.__table__])
+        with sa.orm.Session(self.engine) as session:
+            session.add_all(
+                [
+                    Record(id=1, meta={"color": "red", "size": {"width": 2}}),
+                    Record(id=2, meta={"color": "blue", "size": {"width": 5}}),
+                    Record(id=3, meta={"active": True}),
+                    Record(id=4, meta=None),
+                ]
+            )
+            session.commit()
+
+    def select(self, operations: list[Operation]) -> list[int]:
+        stmt = sa.select(Record.id).where(self.backend.transform(operations))
+        with self.engine.connect() as connection:
+            return list(connection.scalars(stmt.order_by(Record.id)))
+
+    @pytest.mark.parametrize(
+        "operation, expected",
+        [
+            (p.eq("meta.color", "red"), [1]),
+            (p.in_("meta.color", ["red", "blue"]), [1, 2]),
+            (p.gt("meta.size.width", 3), [2]),
+            (p.eq("meta.active", True), [3]),
+            (p.contains("meta.color", "lu"), [2]),
+        ],
+    )
+    def test_operators(self, operation: Operation, expected: list[int]) -> None:
+        assert self.select([operation]) == expected
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            p.eq("meta.color", Param("color")),
+            p.neq("meta.color", Param("color")),
+            p.gt("meta.size.width", Param("width")),
+            p.in_("meta.color", Param("colors")),
+        ],
+    )
+    def test_param_rejected(self, operation: Operation) -> None:
+        with pytest.raises(UnsupportedOperationError, match="pass the value itself"):
+            self.backend.transform([operation])
+        with pytest.raises(UnsupportedOperationError, match="Param placeholders"):
+            SQLAlchemyBackend(Product).transform(
+                [operation.model_copy(update={"field": "data.color"})]
+            )
+
+    @pytest.mark.parametrize(
+        "operation, values, expected",
+        [
+            (p.contains("meta.color", Param("q")), {"q": "lu"}, [2]),
+            (
+                p.contains("meta.color", Param("q"), ignore_case=True),
+                {"q": "E"},
+                [1, 2],
+            ),
+            (p.regex("meta.color", Param("q")), {"q": "^r"}, [1]),
+        ],
+    )
+    def test_string_param(
+        self, operation: Operation, values: dict[str, str], expected: list[int]
+    ) -> None:
+        criteria = self.backend.transform([operation])
+        stmt = sa.select(Record.id).where(criteria).order_by(Record.id)
+        with self.engine.connect() as connection:
+            assert list(connection.scalars(stmt, values)) == expected
+
+    def test_not_a_json_column(self) -> None:
+        with pytest.raises(AttributeError, match="'id.value'"):
+            self.backend.transform([p.eq("id.value", 1)])
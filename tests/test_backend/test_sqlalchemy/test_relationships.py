@@ -0,0 +1,225 @@
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+from charter._backends.sqlalchemy import SQLAlchemyBackend
+from charter._ops import (
+    LogicOperatorNode,
+    LogicOperators,
+    Operation,
+    OperatorNode,
+    Operators,
+)
+
+
+class Base(DeclarativeBase): ...
+
+
+book_tags = sa.Table(
+    "book_tags",
+    Base.metadata,
+    sa.Column("book_id", sa.ForeignKey("books.id"), primary_key=True),
+    sa.Column("tag_id", sa.ForeignKey("tags.id"), primary_key=True),
+)
+
+
+class Publisher(Base):
+    __tablename__ = "publishers"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+
+
+class Author(Base):
+    __tablename__ = "authors"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    publisher_id: Mapped[int | None] = mapped_column(sa.ForeignKey("publishers.id"))
+
+    publisher: Mapped[Publisher | None] = relationship()
+    books: Mapped[list["Book"]] = relationship(back_populates="author")
+
+
+class Tag(Base):
+    __tablename__ = "tags"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+
+
+class Book(Base):
+    __tablename__ = "books"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str]
+    author_id: Mapped[int | None] = mapped_column(sa.ForeignKey("authors.id"))
+
+    author: Mapped[Author | None] = relationship(back_populates="books")
+    tags: Mapped[list[Tag]] = relationship(secondary=book_tags)
+
+
+def eq(field: str, value: object) -> OperatorNode:
+    return OperatorNode(Operators.EQ, field, value)
+
+
+class TestFieldPaths:
+    def test_shared_between_instances(self) -> None:
+        assert SQLAlchemyBackend(Book).fields is SQLAlchemyBackend(Book).fields
+
+    def test_frozen(self) -> None:
+        fields = SQLAlchemyBackend(Book).fields
+        with pytest.raises(TypeError):
+            fields["other"] = fields["title"]  # type: ignore[index]
+
+    def test_direct_relationship_columns(self) -> None:
+        fields = SQLAlchemyBackend(Book).fields
+        assert fields["author.name"].column is Author.__table__.c.name
+        assert fields["tags.name"].column is Tag.__table__.c.name
+        assert "author.publisher.name" not in fields
+
+    def test__get_column_nested_path(self) -> None:
+        backend = SQLAlchemyBackend(Book)
+        column = backend._get_column("author.publisher.name")
+        assert column is Publisher.__table__.c.name
+
+    @pytest.mark.parametrize(
+        "field_name", ["author.invalid", "invalid.name", "title.name", "author."]
+    )
+    def test_invalid_path(self, field_name: str) -> None:
+        backend = SQLAlchemyBackend(Book)
+        with pytest.raises(
+            AttributeError,
+            match=f"Object of type {Book.__class__} has no attribute '{field_name}'",
+        ):
+            backend.transform([eq(field_name, "x")])
+
+
+class TestRelationships:
+    @pytest.fixture(autouse=True)
+    def setup_db(self) -> None:
+        self.backend = SQLAlchemyBackend(Book)
+        self.engine = sa.create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+
+        acme = Publisher(id=1, name="Acme")
+        ann = Author(id=1, name="Ann", publisher=acme)
+        bob = Author(id=2, name="Bob")
+        fiction = Tag(id=1, name="fiction")
+        classic = Tag(id=2, name="classic")
+        with sa.orm.Session(self.engine) as session:
+            session.add_all(
+                [
+                    Book(id=1, title="A", author=ann, tags=[fiction, classic]),
+                    Book(id=2, title="B", author=bob, tags=[fiction]),
+                    Book(id=3, title="C", author=None, tags=[]),
+                ]
+            )
+            session.commit()
+
+    def transform_ids(self, operations: list[Operation]) -> list[int]:
+        stmt = sa.select(Book.id).where(self.backend.transform(operations))
+        with self.engine.connect() as connection:
+            return list(connection.scalars(stmt.order_by(Book.id)))
+
+    def filter_ids(self, operations: list[Operation]) -> list[int]:
+        stmt = self.backend.filter(sa.select(Book.id), operations)
+        with self.engine.connect() as connection:
+            return list(connection.scalars(stmt.order_by(Book.id)))
+
+    def test_to_one_uses_exists(self) -> None:
+        criteria = self.backend.transform([eq("author.name", "Ann")])
+        assert "EXISTS" in str(criteria)
+        assert self.transform_ids([eq("author.name", "Ann")]) == [1]
+
+    def test_to_many_does_not_repeat_rows(self) -> None:
+        operations: list[Operation] = [
+            OperatorNode(Operators.IN, "tags.name", ["fiction", "classic"])
+        ]
+        assert self.transform_ids(operations) == [1, 2]
+        assert self.filter_ids(operations) == [1, 2]
+
+    def test_nested_path(self) -> None:
+        operations: list[Operation] = [eq("author.publisher.name", "Acme")]
+        assert self.transform_ids(operations) == [1]
+        assert self.filter_ids(operations) == [1]
+
+    def test_filter_joins_to_one(self) -> None:
+        stmt = self.backend.filter(
+            sa.select(Book.id),
+            [eq("author.name", "Ann"), eq("author.publisher.name", "Acme")],
+        )
+        sql = str(stmt)
+        assert sql.count("LEFT OUTER JOIN") == 2
+        assert "EXISTS" not in sql
+
+    def test_filter_keeps_exists_for_to_many(self) -> None:
+        stmt = self.backend.filter(sa.select(Book.id), [eq("tags.name", "fiction")])
+        sql = str(stmt)
+        assert "JOIN" not in sql
+        assert "EXISTS" in sql
+
+    @pytest.mark.parametrize(
+        "operation, expected",
+        [
+            (
+                OperatorNode(Operators.ELEM_MATCH, "tags", (eq("name", "fiction"),)),
+                [1, 2],
+            ),
+            (
+                OperatorNode(
+                    Operators.ELEM_MATCH, "tags", (eq("name", "fiction"), eq("id", 2))
+                ),
+                [],
+            ),
+            (OperatorNode(Operators.ELEM_MATCH, "author", (eq("name", "Bob"),)), [2]),
+            (
+                OperatorNode(
+                    Operators.ELEM_MATCH, "author.publisher", (eq("name", "Acme"),)
+                ),
+                [1],
+            ),
+        ],
+    )
+    def test_elem_match(self, operation: Operation, expected: list[int]) -> None:
+        assert self.transform_ids([operation]) == expected
+        assert self.filter_ids([operation]) == expected
+
+    @pytest.mark.parametrize(
+        "operations, expected",
+        [
+            ([eq("author.name", "Ann")], [1]),
+            ([OperatorNode(Operators.NEQ, "author.name", "Ann")], [2]),
+            (
+                [
+                    LogicOperatorNode(
+                        LogicOperators.OR, [eq("author.name", "Bob"), eq("title", "C")]
+                    )
+                ],
+                [2, 3],
+            ),
+            (
+                [LogicOperatorNode(LogicOperators.NOT, [eq("author.name", "Ann")])],
+                [2, 3],
+            ),
+            (
+                [
+                    LogicOperatorNode(
+                        LogicOperators.NOT,
+                        [
+                            LogicOperatorNode(
+                                LogicOperators.OR,
+                                [eq("author.name", "Ann"), eq("tags.name", "fiction")],
+                            )
+                        ],
+                    )
+                ],
+                [3],
+            ),
+        ],
+    )
+    def test_filter_matches_transform(
+        self, operations: list[Operation], expected: list[int]
+    ) -> None:
+        assert self.transform_ids(operations) == expected
+        assert self.filter_ids(operations) == expected
@@ -84,6 +84,31 @@ class TestPredicateBasicOperators:
         assert inner_op.field == "status"
         assert inner_op.value == values
 
+    def test_any_operator(self) -> None:
+        op = self.predicate.any_("tags", ["a", "b"])
+
+        assert isinstance(op, Operator)
+        assert op.operator == Operators.ANY
+        assert op.field == "tags"
+        assert op.value == ["a", "b"]
+
+    def test_all_operator(self) -> None:
+        op = self.predicate.all_("tags", ["a", "b"])
+
+        assert isinstance(op, Operator)
+        assert op.operator == Operators.ALL
+        assert op.value == ["a", "b"]
+
+    def test_elem_match_operator(self) -> None:
+        sku = self.predicate.eq("sku", "a")
+        quantity = self.predicate.gt("quantity", 2)
+        op = self.predicate.elem_match("items", sku, quantity)
+
+        assert isinstance(op, Operator)
+        assert op.operator == Operators.ELEM_MATCH
+        assert op.field == "items"
+        assert op.value == (sku, quantity)
+
     def test_gt_operator(self) -> None:
         op = self.predicate.gt("age", 18)
 
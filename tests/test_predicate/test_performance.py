@@ -1,13 +1,40 @@
 """Performance and stress tests for the Predicate class."""
 
 import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
 
 import pytest
 
-from charter._ops import LogicOperator, Operator
+from charter._backends.python import PythonBackend
+from charter._ops import (
+    LogicOperator,
+    LogicOperatorNode,
+    Operation,
+    Operator,
+    fold_operations,
+    structural_key,
+    validate_operation,
+)
+from charter._optimize import optimize
 from charter._predicate import Predicate
 
 
+def best_time(run: Callable[[], object], repeat: int = 5) -> float:
+    """Best CPU time of this process over ``repeat`` calls of ``run``.
+
+    Other load on the machine is not counted, and taking the best call
+    leaves out pauses such as garbage collection.
+    """
+    times = []
+    for _ in range(repeat):
+        start_time = time.process_time()
+        run()
+        times.append(time.process_time() - start_time)
+    return min(times)
+
+
 class TestPredicatePerformance:
     def setup_method(self) -> None:
         self.predicate = Predicate()
@@ -110,6 +137,135 @@ class TestPredicatePerformance:
         assert len(result.operations) == operation_count
 
 
+class TestUnvalidatedPredicatePerformance:
+    def build_leaves(
+        self, predicate: Predicate[Any, Any], count: int
+    ) -> list[Operation]:
+        return [predicate.eq(f"field_{i}", i) for i in range(count)]
+
+    def test_node_construction_faster_than_models(self) -> None:
+        count = 10000
+
+        model_time = best_time(lambda: self.build_leaves(Predicate(), count))
+        node_time = best_time(
+            lambda: self.build_leaves(Predicate(validate=False), count)
+        )
+
+        # Nodes build about five times faster than models.
+        assert node_time < model_time
+
+    def test_node_allocations_smaller_than_models(self) -> None:
+        count = 10000
+
+        tracemalloc.start()
+        models = self.build_leaves(Predicate(), count)
+        model_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        nodes = self.build_leaves(Predicate(validate=False), count)
+        node_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert len(models) == len(nodes) == count
+        assert node_size < model_size
+
+    def test_deeply_nested_nodes(self) -> None:
+        p = Predicate(validate=False)
+
+        start_time = time.time()
+        current_op: Operation = p.eq("base", "value")
+        for i in range(100):
+            current_op = p.and_(current_op, p.eq(f"field_{i}", i))
+        end_time = time.time()
+
+        assert end_time - start_time < 0.5
+        assert isinstance(current_op, LogicOperatorNode)
+
+
+def build_deep_tree(depth: int, width: int) -> Operation:
+    """Build ``depth`` nested logic operators with ``width`` leaves each.
+
+    ``and``, ``or`` and ``not`` alternate, so no rewrite can flatten the tree.
+    """
+    p = Predicate(validate=False)
+    logic = [p.and_, p.or_, p.not_]
+    current_op: Operation = p.eq("base", "value")
+    for i in range(depth):
+        leaves = [p.gte(f"field_{j}", i) for j in range(width - 1)]
+        current_op = logic[i % 3](current_op, *leaves)
+    return current_op
+
+
+class TestDeepTreePerformance:
+    """100k-node, 10k-deep trees, far beyond the interpreter's recursion limit."""
+
+    depth = 10000
+    width = 10
+
+    def setup_method(self) -> None:
+        self.tree = build_deep_tree(self.depth, self.width)
+
+    def count_nodes(self, operation: Operation) -> int:
+        return fold_operations(
+            [operation], lambda op: 1, lambda op, counts: 1 + sum(counts)
+        )[0]
+
+    def test_fold_operations(self) -> None:
+        start_time = time.time()
+        count = self.count_nodes(self.tree)
+        end_time = time.time()
+
+        assert count == self.depth * self.width + 1
+        assert end_time - start_time < 1.0
+
+    def test_fold_operations_is_linear(self) -> None:
+        small = build_deep_tree(self.depth // 10, self.width)
+
+        small_time = best_time(lambda: self.count_nodes(small))
+        large_time = best_time(lambda: self.count_nodes(self.tree))
+
+        # Ten times the nodes: about ten times the time if linear, a hundred
+        # if quadratic.
+        assert large_time < small_time * 10 * 4
+
+    def test_validate_operation(self) -> None:
+        start_time = time.time()
+        validated = validate_operation(self.tree)
+        end_time = time.time()
+
+        assert self.count_nodes(validated) == self.depth * self.width + 1
+        assert end_time - start_time < 3.0
+
+    def test_structural_key(self) -> None:
+        start_time = time.time()
+        key = structural_key(self.tree)
+        end_time = time.time()
+
+        assert key == structural_key(build_deep_tree(self.depth, self.width))
+        assert hash(key) == hash(structural_key(self.tree))
+        assert end_time - start_time < 3.0
+
+    def test_optimize(self) -> None:
+        start_time = time.time()
+        optimized = optimize([self.tree])
+        end_time = time.time()
+
+        # The outermost ``and`` is flattened into the returned list.
+        assert len(optimized) == self.width
+        assert end_time - start_time < 5.0
+
+    def test_python_backend(self) -> None:
+        tree = build_deep_tree(self.depth, 2)
+
+        start_time = time.time()
+        predicate = PythonBackend(accessor="item").transform([tree])
+        end_time = time.time()
+
+        assert isinstance(predicate({"base": "value", "field_0": 0}), bool)
+        assert end_time - start_time < 5.0
+
+
 class TestPredicateStressTests:
     def setup_method(self) -> None:
         self.predicate = Predicate()